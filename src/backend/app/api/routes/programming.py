@@ -12,6 +12,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.core.job_manager import JobType, ProgressStep, get_job_manager
 from app.core.programming.generator import ProgrammingGenerator, ProgrammingResult
 from app.core.scoring.engine import ScoringEngine
@@ -518,6 +519,7 @@ async def _run_programming(
                 generator = ProgrammingGenerator(
                     scoring_engine=ScoringEngine(),
                     on_progress=sync_progress,
+                    parallel=get_settings().parallel_generation,
                 )
 
                 start_dt = datetime.now()
@@ -652,7 +654,7 @@ async def _run_programming(
                                     else None,
                                     "block_name": prog.block_name,
                                     "score": prog.score.total_score,
-                                    "forbidden_violated": len(prog.score.forbidden_violations) > 0,
+                                    "forbidden_violated": bool(prog.score.forbidden_violations),
                                 }
                             )
 
@@ -687,8 +689,7 @@ async def _run_programming(
                                         else None,
                                         "score": prog.score.total_score,
                                         "block_name": prog.block_name,
-                                        "forbidden_violated": len(prog.score.forbidden_violations)
-                                        > 0,
+                                        "forbidden_violated": bool(prog.score.forbidden_violations),
                                     }
                                 )
                             all_iter_data.append(
@@ -1039,7 +1040,7 @@ async def _run_programming(
                                 ],
                                 "bonuses": prog.score.bonuses_applied,
                                 "mandatory_met": len(prog.score.mandatory_penalties) == 0,
-                                "forbidden_violated": len(prog.score.forbidden_violations) > 0,
+                                "forbidden_violated": bool(prog.score.forbidden_violations),
                                 "forbidden_details": prog.score.forbidden_violations,
                                 "mandatory_details": prog.score.mandatory_penalties,
                                 "keyword_multiplier": prog.score.keyword_multiplier,
@@ -1262,16 +1263,22 @@ async def _run_programming(
                 f"Programming completed: {len(programs)} programs, avg score {result.average_score:.2f}"
             )
 
-    except Exception as e:
-        logger.error(f"Programming failed: {e}")
+    except (Exception, asyncio.CancelledError) as e:
+        # A CancelledError comes from the scheduler's timeout or from shutdown: the job and
+        # history entry are still marked failed before the cancellation is re-raised
+        cancelled = isinstance(e, asyncio.CancelledError)
+        error = "Cancelled (timed out or shutting down)" if cancelled else str(e)
+        logger.error(f"Programming failed: {error}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-        await job_manager.fail_job(job_id, str(e))
+        await job_manager.fail_job(job_id, error)
         # Try to mark history entry as failed if it was created
         try:
             if "history_entry" in dir() and "history_service" in dir():
-                await history_service.mark_failed(history_entry.id, str(e))
+                await history_service.mark_failed(history_entry.id, error)
         except Exception:
             pass  # Best effort
+        if cancelled:
+            raise
 
 
 def _run_programming_in_thread(job_id: str, request: ProgrammingRequest) -> None:
@@ -308,7 +308,10 @@ async def run_schedule_now(
         raise HTTPException(status_code=404, detail="Schedule not found")
 
     scheduler = get_scheduler_manager()
-    await scheduler.run_schedule_now(schedule_id)
+    try:
+        await scheduler.run_schedule_now(schedule_id)
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
 
     return {
         "status": "triggered",
@@ -1,6 +1,7 @@
 """Scoring API routes for analyzing channel programming."""
 
 import asyncio
+import concurrent.futures
 import logging
 import threading
 from datetime import UTC, datetime
@@ -446,6 +447,7 @@ async def _run_scoring(
             )
 
             scoring_engine = ScoringEngine()
+            scoring_engine.clear_caches()
             scored_programs = []
             total_score = 0.0
             violations_count = 0
@@ -475,129 +477,165 @@ async def _run_scoring(
             # Import ScoringContext for timing information
             from app.core.scoring.base_criterion import ScoringContext
 
-            for i, prog in enumerate(programs_data):
-                # Update progress
+            async def report_progress(i: int) -> None:
                 progress = 40 + (i / len(programs_data)) * 50
-                if i % 10 == 0:
-                    await job_manager.update_step_status(
-                        job_id, "scoring", "running", f"{i}/{len(programs_data)} scorés"
-                    )
-                    await job_manager.update_job_progress(
-                        job_id, progress, f"Calcul des scores: {i}/{len(programs_data)}..."
-                    )
+                await job_manager.update_step_status(
+                    job_id, "scoring", "running", f"{i}/{len(programs_data)} scorés"
+                )
+                await job_manager.update_job_progress(
+                    job_id, progress, f"Calcul des scores: {i}/{len(programs_data)}..."
+                )
 
-                # Use cached content if available, otherwise use Tunarr data
-                cached_content = prog.get("_cached_content")
-                cached_meta = prog.get("_cached_meta")
+            # Scoring is CPU-bound: run it in an executor and send progress back to the loop
+            loop = asyncio.get_running_loop()
+            progress_updates: list[concurrent.futures.Future[None]] = []
+            stop_scoring = threading.Event()
 
-                # Build content from cache or Tunarr data
-                if cached_content:
-                    content = cached_content
-                else:
-                    # Tunarr returns type="content" with subtype="movie" or "episode"
-                    content_type = prog.get("subtype") or prog.get("type", "movie")
-                    if content_type == "content":
-                        content_type = "movie"
-                    # Extract year from date field if not present
-                    content_year = prog.get("year")
-                    if not content_year:
-                        date_str = prog.get("date", "")
-                        if date_str and len(date_str) >= 4:
-                            try:
-                                content_year = int(date_str[:4])
-                            except (ValueError, TypeError):
-                                content_year = None
-                    content = {
-                        "id": prog.get("id", ""),
-                        "plex_key": prog.get(
-                            "externalKey", prog.get("plexKey", prog.get("id", ""))
-                        ),
-                        "title": prog.get("title", "Unknown"),
-                        "type": content_type,
-                        "duration_ms": prog.get("duration", 0),
-                        "year": content_year,
-                    }
+            def score_programs() -> None:
+                nonlocal total_score, violations_count
 
-                # Use cached meta (from cache or TMDB enrichment), or fallback to Tunarr data
-                if cached_meta:
-                    meta = cached_meta
-                else:
-                    meta = {
-                        "genres": prog.get("genres", []),
-                        "tmdb_rating": prog.get("rating"),
-                        "content_rating": prog.get("contentRating"),
-                        "age_rating": prog.get("contentRating"),
-                    }
+                for i, prog in enumerate(programs_data):
+                    if stop_scoring.is_set():
+                        return  # The run was cancelled (scheduler timeout or shutdown)
 
-                # Get time block for program
-                start_time = prog.get("start", "")
-                block = block_assignments[i]
+                    # Update progress
+                    if i % 10 == 0:
+                        progress_updates.append(
+                            asyncio.run_coroutine_threadsafe(report_progress(i), loop)
+                        )
 
-                # Determine if first/last in block
-                current_block_name = block.get("name") if block else None
-                prev_block_name = (
-                    block_assignments[i - 1].get("name")
-                    if i > 0 and block_assignments[i - 1]
-                    else None
-                )
-                next_block_name = (
-                    block_assignments[i + 1].get("name")
-                    if i < len(block_assignments) - 1 and block_assignments[i + 1]
-                    else None
-                )
+                    # Use cached content if available, otherwise use Tunarr data
+                    cached_content = prog.get("_cached_content")
+                    cached_meta = prog.get("_cached_meta")
 
-                is_first_in_block = current_block_name and current_block_name != prev_block_name
-                is_last_in_block = current_block_name and current_block_name != next_block_name
+                    # Build content from cache or Tunarr data
+                    if cached_content:
+                        content = cached_content
+                    else:
+                        # Tunarr returns type="content" with subtype="movie" or "episode"
+                        content_type = prog.get("subtype") or prog.get("type", "movie")
+                        if content_type == "content":
+                            content_type = "movie"
+                        # Extract year from date field if not present
+                        content_year = prog.get("year")
+                        if not content_year:
+                            date_str = prog.get("date", "")
+                            if date_str and len(date_str) >= 4:
+                                try:
+                                    content_year = int(date_str[:4])
+                                except (ValueError, TypeError):
+                                    content_year = None
+                        content = {
+                            "id": prog.get("id", ""),
+                            "plex_key": prog.get(
+                                "externalKey", prog.get("plexKey", prog.get("id", ""))
+                            ),
+                            "title": prog.get("title", "Unknown"),
+                            "type": content_type,
+                            "duration_ms": prog.get("duration", 0),
+                            "year": content_year,
+                        }
+
+                    # Use cached meta (from cache or TMDB enrichment), or fallback to Tunarr data
+                    if cached_meta:
+                        meta = cached_meta
+                    else:
+                        meta = {
+                            "genres": prog.get("genres", []),
+                            "tmdb_rating": prog.get("rating"),
+                            "content_rating": prog.get("contentRating"),
+                            "age_rating": prog.get("contentRating"),
+                        }
+
+                    # Get time block for program
+                    start_time = prog.get("start", "")
+                    block = block_assignments[i]
+
+                    # Determine if first/last in block
+                    current_block_name = block.get("name") if block else None
+                    prev_block_name = (
+                        block_assignments[i - 1].get("name")
+                        if i > 0 and block_assignments[i - 1]
+                        else None
+                    )
+                    next_block_name = (
+                        block_assignments[i + 1].get("name")
+                        if i < len(block_assignments) - 1 and block_assignments[i + 1]
+                        else None
+                    )
 
-                # Create ScoringContext with timing information
-                context = None
-                if block and start_time:
-                    try:
-                        # Parse program start time
-                        prog_start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-
-                        # Parse block start/end times (HH:MM format) using program date
-                        block_start_str = block.get("start_time", "00:00")
-                        block_end_str = block.get("end_time", "00:00")
-
-                        block_start_h, block_start_m = map(int, block_start_str.split(":"))
-                        block_end_h, block_end_m = map(int, block_end_str.split(":"))
-
-                        # Use program's local date for block times
-                        local_prog_start = prog_start_dt.astimezone()
-                        base_date = local_prog_start.date()
-                        prog_time_minutes = local_prog_start.hour * 60 + local_prog_start.minute
-                        block_start_minutes = block_start_h * 60 + block_start_m
-                        block_end_minutes = block_end_h * 60 + block_end_m
-
-                        # Determine if this is an overnight block (end < start in 24h clock)
-                        is_overnight_block = block_end_minutes < block_start_minutes
-
-                        if is_overnight_block:
-                            # For overnight blocks, determine if program is in "before midnight"
-                            # or "after midnight" part
-                            if prog_time_minutes >= block_start_minutes:
-                                # Program is in "before midnight" part (e.g., 23:30 in 23:00-07:00)
-                                # block_start = same day, block_end = next day
-                                block_start_dt = datetime(
-                                    base_date.year,
-                                    base_date.month,
-                                    base_date.day,
-                                    block_start_h,
-                                    block_start_m,
-                                    tzinfo=local_prog_start.tzinfo,
-                                )
-                                block_end_dt = datetime(
-                                    base_date.year,
-                                    base_date.month,
-                                    base_date.day,
-                                    block_end_h,
-                                    block_end_m,
-                                    tzinfo=local_prog_start.tzinfo,
-                                ) + timedelta(days=1)
+                    is_first_in_block = current_block_name and current_block_name != prev_block_name
+                    is_last_in_block = current_block_name and current_block_name != next_block_name
+
+                    # Create ScoringContext with timing information
+                    context = None
+                    if block and start_time:
+                        try:
+                            # Parse program start time
+                            prog_start_dt = datetime.fromisoformat(
+                                start_time.replace("Z", "+00:00")
+                            )
+
+                            # Parse block start/end times (HH:MM format) using program date
+                            block_start_str = block.get("start_time", "00:00")
+                            block_end_str = block.get("end_time", "00:00")
+
+                            block_start_h, block_start_m = map(int, block_start_str.split(":"))
+                            block_end_h, block_end_m = map(int, block_end_str.split(":"))
+
+                            # Use program's local date for block times
+                            local_prog_start = prog_start_dt.astimezone()
+                            base_date = local_prog_start.date()
+                            prog_time_minutes = local_prog_start.hour * 60 + local_prog_start.minute
+                            block_start_minutes = block_start_h * 60 + block_start_m
+                            block_end_minutes = block_end_h * 60 + block_end_m
+
+                            # Determine if this is an overnight block (end < start in 24h clock)
+                            is_overnight_block = block_end_minutes < block_start_minutes
+
+                            if is_overnight_block:
+                                # For overnight blocks, determine if program is in "before midnight"
+                                # or "after midnight" part
+                                if prog_time_minutes >= block_start_minutes:
+                                    # Program is in "before midnight" part (e.g., 23:30 in 23:00-07:00)
+                                    # block_start = same day, block_end = next day
+                                    block_start_dt = datetime(
+                                        base_date.year,
+                                        base_date.month,
+                                        base_date.day,
+                                        block_start_h,
+                                        block_start_m,
+                                        tzinfo=local_prog_start.tzinfo,
+                                    )
+                                    block_end_dt = datetime(
+                                        base_date.year,
+                                        base_date.month,
+                                        base_date.day,
+                                        block_end_h,
+                                        block_end_m,
+                                        tzinfo=local_prog_start.tzinfo,
+                                    ) + timedelta(days=1)
+                                else:
+                                    # Program is in "after midnight" part (e.g., 05:47 in 23:00-07:00)
+                                    # block_start = previous day, block_end = same day
+                                    block_start_dt = datetime(
+                                        base_date.year,
+                                        base_date.month,
+                                        base_date.day,
+                                        block_start_h,
+                                        block_start_m,
+                                        tzinfo=local_prog_start.tzinfo,
+                                    ) - timedelta(days=1)
+                                    block_end_dt = datetime(
+                                        base_date.year,
+                                        base_date.month,
+                                        base_date.day,
+                                        block_end_h,
+                                        block_end_m,
+                                        tzinfo=local_prog_start.tzinfo,
+                                    )
                             else:
-                                # Program is in "after midnight" part (e.g., 05:47 in 23:00-07:00)
-                                # block_start = previous day, block_end = same day
+                                # Normal daytime block
                                 block_start_dt = datetime(
                                     base_date.year,
                                     base_date.month,
@@ -605,7 +643,7 @@ async def _run_scoring(
                                     block_start_h,
                                     block_start_m,
                                     tzinfo=local_prog_start.tzinfo,
-                                ) - timedelta(days=1)
+                                )
                                 block_end_dt = datetime(
                                     base_date.year,
                                     base_date.month,
@@ -614,136 +652,125 @@ async def _run_scoring(
                                     block_end_m,
                                     tzinfo=local_prog_start.tzinfo,
                                 )
-                        else:
-                            # Normal daytime block
-                            block_start_dt = datetime(
-                                base_date.year,
-                                base_date.month,
-                                base_date.day,
-                                block_start_h,
-                                block_start_m,
-                                tzinfo=local_prog_start.tzinfo,
+
+                            context = ScoringContext(
+                                current_time=prog_start_dt,
+                                block_start_time=block_start_dt,
+                                block_end_time=block_end_dt,
+                                is_first_in_block=is_first_in_block,
+                                is_last_in_block=is_last_in_block,
                             )
-                            block_end_dt = datetime(
-                                base_date.year,
-                                base_date.month,
-                                base_date.day,
-                                block_end_h,
-                                block_end_m,
-                                tzinfo=local_prog_start.tzinfo,
+                        except Exception as e:
+                            logger.warning(
+                                f"Failed to create ScoringContext for {prog.get('title')}: {e}"
                             )
 
-                        context = ScoringContext(
-                            current_time=prog_start_dt,
-                            block_start_time=block_start_dt,
-                            block_end_time=block_end_dt,
-                            is_first_in_block=is_first_in_block,
-                            is_last_in_block=is_last_in_block,
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to create ScoringContext for {prog.get('title')}: {e}"
-                        )
-
-                # Ensure content has timing info for overflow calculation
-                # (cached content doesn't have start_time/end_time, add from program data)
-                content_with_timing = {
-                    **content,
-                    "start_time": prog.get("start"),
-                    "end_time": prog.get("end"),
-                }
-
-                # Score the program
-                score_result = scoring_engine.score(
-                    content_with_timing, meta, profile_dict, block, context
-                )
+                    # Ensure content has timing info for overflow calculation
+                    # (cached content doesn't have start_time/end_time, add from program data)
+                    content_with_timing = {
+                        **content,
+                        "start_time": prog.get("start"),
+                        "end_time": prog.get("end"),
+                    }
 
-                # Track violations
-                if score_result.forbidden_violations:
-                    violations_count += len(score_result.forbidden_violations)
-                    content_title = content.get("title", "Unknown")
-                    block_name = block.get("name") if block else "None"
-                    logger.warning(
-                        f"[FORBIDDEN SCORED] '{content_title}' (block: {block_name}, score: {score_result.total_score}) - "
-                        f"Violations: {score_result.forbidden_violations}"
+                    # Score the program
+                    score_result = scoring_engine.score(
+                        content_with_timing, meta, profile_dict, block, context
                     )
-                    for v in score_result.forbidden_violations:
-                        forbidden_violations.append(
-                            f"{content_title}: {v.get('message', v.get('rule', 'Unknown'))}"
-                        )
 
-                if score_result.mandatory_penalties:
-                    for p in score_result.mandatory_penalties:
-                        mandatory_violations.append(
-                            f"{content.get('title', 'Unknown')}: {p.get('message', p.get('rule', 'Unknown'))}"
+                    # Track violations
+                    if score_result.forbidden_violations:
+                        violations_count += len(score_result.forbidden_violations)
+                        content_title = content.get("title", "Unknown")
+                        block_name = block.get("name") if block else "None"
+                        logger.warning(
+                            f"[FORBIDDEN SCORED] '{content_title}' (block: {block_name}, score: {score_result.total_score}) - "
+                            f"Violations: {score_result.forbidden_violations}"
                         )
-                        penalties_applied.append(p.get("rule", "unknown"))
-
-                # Update score distribution (average per criterion)
-                for name, res in score_result.criterion_results.items():
-                    if name in score_distribution:
-                        score_distribution[name] += res.score
-
-                total_score += score_result.total_score
-
-                # Build program result with full scoring details (same format as programming)
-                # Use skipped flag to return None for skipped criteria (e.g., timing for middle programs)
-                scored_programs.append(
-                    {
-                        "id": str(uuid4()),
-                        "title": content.get("title", "Unknown"),
-                        "type": content.get("type", "movie"),
-                        "start_time": start_time,
-                        "end_time": prog.get("end", ""),
-                        "duration_min": content.get("duration_ms", 0) / 60000,
-                        "genres": meta.get("genres", []) if meta else [],
-                        "keywords": meta.get("keywords", []) if meta else [],
-                        "year": content.get("year"),
-                        "tmdb_rating": meta.get("tmdb_rating") if meta else None,
-                        "content_rating": meta.get("age_rating") or meta.get("content_rating")
-                        if meta
-                        else None,
-                        "plex_key": content.get("plex_key", ""),
-                        "block_name": block.get("name") if block else None,
-                        "score": {
-                            "total": score_result.total_score,
-                            "breakdown": {
-                                name: (res.score if not res.skipped else None)
-                                for name, res in score_result.criterion_results.items()
-                            },
-                            "criteria": {
-                                name: {
-                                    "score": res.score if not res.skipped else None,
-                                    "weight": res.weight,
-                                    "weighted_score": res.weighted_score,
-                                    "multiplier": res.multiplier,
-                                    "multiplied_weighted_score": res.multiplied_weighted_score,
-                                    "skipped": res.skipped,
-                                    "details": res.details,  # Include criterion-specific details
-                                    "rule_violation": {
-                                        "rule_type": res.rule_violation.rule_type,
-                                        "values": res.rule_violation.values,
-                                        "penalty_or_bonus": res.rule_violation.penalty_or_bonus,
+                        for v in score_result.forbidden_violations:
+                            forbidden_violations.append(
+                                f"{content_title}: {v.get('message', v.get('rule', 'Unknown'))}"
+                            )
+
+                    if score_result.mandatory_penalties:
+                        for p in score_result.mandatory_penalties:
+                            mandatory_violations.append(
+                                f"{content.get('title', 'Unknown')}: {p.get('message', p.get('rule', 'Unknown'))}"
+                            )
+                            penalties_applied.append(p.get("rule", "unknown"))
+
+                    # Update score distribution (average per criterion)
+                    for name, res in score_result.criterion_results.items():
+                        if name in score_distribution:
+                            score_distribution[name] += res.score
+
+                    total_score += score_result.total_score
+
+                    # Build program result with full scoring details (same format as programming)
+                    # Use skipped flag to return None for skipped criteria (e.g., timing for middle programs)
+                    scored_programs.append(
+                        {
+                            "id": str(uuid4()),
+                            "title": content.get("title", "Unknown"),
+                            "type": content.get("type", "movie"),
+                            "start_time": start_time,
+                            "end_time": prog.get("end", ""),
+                            "duration_min": content.get("duration_ms", 0) / 60000,
+                            "genres": meta.get("genres", []) if meta else [],
+                            "keywords": meta.get("keywords", []) if meta else [],
+                            "year": content.get("year"),
+                            "tmdb_rating": meta.get("tmdb_rating") if meta else None,
+                            "content_rating": meta.get("age_rating") or meta.get("content_rating")
+                            if meta
+                            else None,
+                            "plex_key": content.get("plex_key", ""),
+                            "block_name": block.get("name") if block else None,
+                            "score": {
+                                "total": score_result.total_score,
+                                "breakdown": {
+                                    name: (res.score if not res.skipped else None)
+                                    for name, res in score_result.criterion_results.items()
+                                },
+                                "criteria": {
+                                    name: {
+                                        "score": res.score if not res.skipped else None,
+                                        "weight": res.weight,
+                                        "weighted_score": res.weighted_score,
+                                        "multiplier": res.multiplier,
+                                        "multiplied_weighted_score": res.multiplied_weighted_score,
+                                        "skipped": res.skipped,
+                                        "details": res.details,  # Include criterion-specific details
+                                        "rule_violation": {
+                                            "rule_type": res.rule_violation.rule_type,
+                                            "values": res.rule_violation.values,
+                                            "penalty_or_bonus": res.rule_violation.penalty_or_bonus,
+                                        }
+                                        if res.rule_violation
+                                        else None,
                                     }
-                                    if res.rule_violation
-                                    else None,
-                                }
-                                for name, res in score_result.criterion_results.items()
+                                    for name, res in score_result.criterion_results.items()
+                                },
+                                "penalties": [
+                                    p.get("message", "") for p in score_result.mandatory_penalties
+                                ],
+                                "bonuses": score_result.bonuses_applied,
+                                "mandatory_met": len(score_result.mandatory_penalties) == 0,
+                                "forbidden_violated": bool(score_result.forbidden_violations),
+                                "forbidden_details": score_result.forbidden_violations,
+                                "mandatory_details": score_result.mandatory_penalties,
+                                "keyword_multiplier": score_result.keyword_multiplier,
+                                "keyword_match": score_result.keyword_match,
+                                "criterion_rule_violations": score_result.criterion_rule_violations,
                             },
-                            "penalties": [
-                                p.get("message", "") for p in score_result.mandatory_penalties
-                            ],
-                            "bonuses": score_result.bonuses_applied,
-                            "mandatory_met": len(score_result.mandatory_penalties) == 0,
-                            "forbidden_violated": len(score_result.forbidden_violations) > 0,
-                            "forbidden_details": score_result.forbidden_violations,
-                            "mandatory_details": score_result.mandatory_penalties,
-                            "keyword_multiplier": score_result.keyword_multiplier,
-                            "keyword_match": score_result.keyword_match,
-                            "criterion_rule_violations": score_result.criterion_rule_violations,
-                        },
-                    }
-                )
+                        }
+                    )
+
+            try:
+                await loop.run_in_executor(None, score_programs)
+            finally:
+                stop_scoring.set()
+            # Let the last progress updates land before the step is marked completed
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in progress_updates))
 
             await job_manager.update_step_status(
                 job_id, "scoring", "completed", f"{len(programs_data)} programmes scorés"
@@ -820,18 +847,24 @@ async def _run_scoring(
                 f"Scoring completed: {len(scored_programs)} programs, avg {average_score:.2f}"
             )
 
-    except Exception as e:
-        logger.error(f"Scoring failed: {e}")
+    except (Exception, asyncio.CancelledError) as e:
+        # A CancelledError comes from the scheduler's timeout or from shutdown: the job and
+        # history entry are still marked failed before the cancellation is re-raised
+        cancelled = isinstance(e, asyncio.CancelledError)
+        error = "Cancelled (timed out or shutting down)" if cancelled else str(e)
+        logger.error(f"Scoring failed: {error}")
         import traceback
 
         logger.error(f"Traceback: {traceback.format_exc()}")
-        await job_manager.fail_job(job_id, str(e))
+        await job_manager.fail_job(job_id, error)
         # Try to mark history entry as failed if it was created
         try:
             if "history_entry" in dir() and "history_service" in dir():
-                await history_service.mark_failed(history_entry.id, str(e))
+                await history_service.mark_failed(history_entry.id, error)
         except Exception:
             pass  # Best effort
+        if cancelled:
+            raise
 
 
 def _get_block_for_time(
@@ -52,6 +52,12 @@ class Settings(BaseSettings):
         description="Secret key for encryption",
     )
 
+    # Programming
+    parallel_generation: bool = Field(
+        default=False,
+        description="Run generation iterations for large content pools in worker processes",
+    )
+
     # Server
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8080, description="Server port")
@@ -1,16 +1,25 @@
 """Job manager for background tasks with SSE support."""
 
 import asyncio
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import islice
 from typing import Any
 from uuid import uuid4
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Job results may use non-string keys, which json.dumps used to stringify
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Minimum delay in seconds between two job_progress events of the same job. Updates
+# arriving sooner are coalesced and the latest state is sent once the delay has passed.
+PROGRESS_BROADCAST_INTERVAL = 0.1
+
 
 class JobType(str, Enum):
     """Types of background jobs."""
@@ -32,7 +41,7 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressStep:
     """A progress step for display."""
 
@@ -50,9 +59,9 @@ class ProgressStep:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
-    """Represents a background job."""
+    """Represents a background job (slotted: finished jobs are kept for up to a day)."""
 
     id: str
     type: JobType
@@ -121,14 +130,18 @@ class JobManager:
     def __init__(self) -> None:
         """Initialize the job manager."""
         self._jobs: dict[str, Job] = {}
-        self._sse_clients: list[asyncio.Queue[str]] = []
+        # Client queues are only added, removed and copied without awaiting in between,
+        # so they need no lock; the lock guards multi-step changes to jobs
+        self._sse_clients: set[asyncio.Queue[str]] = set()
         self._lock = asyncio.Lock()
+        # Per-job loop time of the last job_progress event, and pending coalesced events
+        self._progress_sent_at: dict[str, float] = {}
+        self._progress_flushes: dict[str, asyncio.Task[None]] = {}
 
     async def subscribe_sse(self) -> asyncio.Queue[str]:
         """Subscribe a new SSE client and return their queue."""
         queue: asyncio.Queue[str] = asyncio.Queue()
-        async with self._lock:
-            self._sse_clients.append(queue)
+        self._sse_clients.add(queue)
         logger.info(f"SSE client subscribed. Total clients: {len(self._sse_clients)}")
 
         # Send current state
@@ -136,30 +149,69 @@ class JobManager:
             "type": "jobs_state",
             "jobs": [job.to_dict() for job in self._jobs.values()],
         }
-        await queue.put(f"data: {json.dumps(jobs_data)}\n\n")
+        queue.put_nowait(f"data: {orjson.dumps(jobs_data, option=_JSON_OPTIONS).decode()}\n\n")
 
         return queue
 
     async def unsubscribe_sse(self, queue: asyncio.Queue[str]) -> None:
         """Unsubscribe an SSE client."""
-        async with self._lock:
-            if queue in self._sse_clients:
-                self._sse_clients.remove(queue)
+        self._sse_clients.discard(queue)
         logger.info(f"SSE client unsubscribed. Total clients: {len(self._sse_clients)}")
 
     async def broadcast(self, data: dict[str, Any]) -> None:
         """Broadcast data to all SSE clients."""
-        message = f"data: {json.dumps(data)}\n\n"
-
-        async with self._lock:
-            clients = list(self._sse_clients)
+        message = f"data: {orjson.dumps(data, option=_JSON_OPTIONS).decode()}\n\n"
 
+        clients = tuple(self._sse_clients)
+        # Client queues are unbounded, so put_nowait never fails for being full and
+        # skips creating and awaiting a put() coroutine per client
         for queue in clients:
             try:
-                await queue.put(message)
+                queue.put_nowait(message)
             except Exception as e:
                 logger.error(f"Error broadcasting to SSE client: {e}")
 
+    async def _broadcast_progress(self, job: Job) -> None:
+        """Broadcast a job_progress event, coalescing updates sent in quick succession."""
+        if job.id in self._progress_flushes:
+            return  # The pending event will carry the latest state
+
+        now = asyncio.get_running_loop().time()
+        sent_at = self._progress_sent_at.get(job.id)
+        if sent_at is not None and now - sent_at < PROGRESS_BROADCAST_INTERVAL:
+            delay = sent_at + PROGRESS_BROADCAST_INTERVAL - now
+            self._progress_flushes[job.id] = asyncio.create_task(
+                self._send_progress_later(job, delay)
+            )
+            return
+
+        self._progress_sent_at[job.id] = now
+        await self.broadcast({"type": "job_progress", "job": job.to_dict()})
+
+    async def _send_progress_later(self, job: Job, delay: float) -> None:
+        """Send a coalesced job_progress event once the broadcast interval has passed."""
+        await asyncio.sleep(delay)
+        del self._progress_flushes[job.id]
+        self._progress_sent_at[job.id] = asyncio.get_running_loop().time()
+        await self.broadcast({"type": "job_progress", "job": job.to_dict()})
+
+    async def _finish_progress(self, job: Job) -> None:
+        """
+        Send a job's pending job_progress event now and drop its throttling state.
+
+        Called before a terminal event so the final steps and counters are not lost.
+        """
+        if self._drop_progress_state(job.id) is not None:
+            await self.broadcast({"type": "job_progress", "job": job.to_dict()})
+
+    def _drop_progress_state(self, job_id: str) -> asyncio.Task[None] | None:
+        """Forget a job's throttling state and cancel its pending event, which is returned."""
+        self._progress_sent_at.pop(job_id, None)
+        pending = self._progress_flushes.pop(job_id, None)
+        if pending is not None:
+            pending.cancel()
+        return pending
+
     async def create_job(
         self,
         job_type: JobType,
@@ -267,12 +319,7 @@ class JobManager:
                     job.steps = kwargs["steps"]
 
         if job:
-            await self.broadcast(
-                {
-                    "type": "job_progress",
-                    "job": job.to_dict(),
-                }
-            )
+            await self._broadcast_progress(job)
 
     async def set_job_steps(self, job_id: str, steps: list[ProgressStep]) -> None:
         """Set the progress steps for a job."""
@@ -282,12 +329,7 @@ class JobManager:
                 job.steps = steps
 
         if job:
-            await self.broadcast(
-                {
-                    "type": "job_progress",
-                    "job": job.to_dict(),
-                }
-            )
+            await self._broadcast_progress(job)
 
     async def update_step_status(
         self,
@@ -308,12 +350,7 @@ class JobManager:
                         break
 
         if job:
-            await self.broadcast(
-                {
-                    "type": "job_progress",
-                    "job": job.to_dict(),
-                }
-            )
+            await self._broadcast_progress(job)
 
     async def complete_job(
         self,
@@ -334,6 +371,7 @@ class JobManager:
                     job.best_score = best_score
 
         if job:
+            await self._finish_progress(job)
             await self.broadcast(
                 {
                     "type": "job_completed",
@@ -352,6 +390,7 @@ class JobManager:
                 job.error_message = error_message
 
         if job:
+            await self._finish_progress(job)
             await self.broadcast(
                 {
                     "type": "job_failed",
@@ -364,20 +403,20 @@ class JobManager:
         """Cancel a running job."""
         async with self._lock:
             job = self._jobs.get(job_id)
-            if job and job.status in [JobStatus.PENDING, JobStatus.RUNNING]:
-                job.status = JobStatus.CANCELLED
-                job.completed_at = datetime.utcnow()
-
-                await self.broadcast(
-                    {
-                        "type": "job_cancelled",
-                        "job": job.to_dict(),
-                    }
-                )
-                logger.info(f"Cancelled job {job_id}")
-                return True
+            if not job or job.status not in [JobStatus.PENDING, JobStatus.RUNNING]:
+                return False
+            job.status = JobStatus.CANCELLED
+            job.completed_at = datetime.utcnow()
 
-        return False
+        await self._finish_progress(job)
+        await self.broadcast(
+            {
+                "type": "job_cancelled",
+                "job": job.to_dict(),
+            }
+        )
+        logger.info(f"Cancelled job {job_id}")
+        return True
 
     async def get_job(self, job_id: str) -> Job | None:
         """Get a job by ID."""
@@ -396,12 +435,11 @@ class JobManager:
     async def get_recent_jobs(self, limit: int = 10) -> list[Job]:
         """Get recent jobs."""
         async with self._lock:
-            jobs = sorted(
-                self._jobs.values(),
-                key=lambda j: j.created_at,
-                reverse=True,
-            )
-            return jobs[:limit]
+            # Jobs are stored as they are created, so newest first is reverse insertion
+            # order and needs no sort by created_at
+            if limit >= 0:
+                return list(islice(reversed(self._jobs.values()), limit))
+            return list(reversed(self._jobs.values()))[:limit]
 
     async def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         """Remove jobs older than specified hours."""
@@ -416,6 +454,7 @@ class JobManager:
             ]
             for job_id in jobs_to_remove:
                 del self._jobs[job_id]
+                self._drop_progress_state(job_id)
                 removed += 1
 
         if removed > 0:
@@ -434,6 +473,7 @@ class JobManager:
             ]
             for job_id in jobs_to_remove:
                 del self._jobs[job_id]
+                self._drop_progress_state(job_id)
                 removed += 1
 
         if removed > 0:
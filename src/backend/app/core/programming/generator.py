@@ -1,19 +1,122 @@
 """ProgrammingGenerator with N iterations and best-score selection."""
 
+import heapq
 import logging
+import multiprocessing
+import os
 import random
-from collections.abc import Callable
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import cached_property
+from itertools import islice
 from typing import Any
 
-from app.core.blocks.time_block_manager import TimeBlockManager
-from app.core.scoring.base_criterion import ScoringContext
+from app.core.blocks.time_block_manager import TimeBlockManager, _get_local_timezone
+from app.core.scoring.base_criterion import CriterionResult, ScoringContext
+from app.core.scoring.criteria.age_criterion import AgeCriterion
+from app.core.scoring.criteria.rating_criterion import rating_category
+from app.core.scoring.criteria.timing_criterion import TimingCriterion
 from app.core.scoring.engine import ScoringEngine
 from app.core.scoring.engine import ScoringResult as ScoreResult
 
 logger = logging.getLogger(__name__)
 
+# Minimum pool size before generation iterations are spread over worker processes
+ITERATION_PARALLEL_MIN_CONTENTS = 500
+
+# Pre-selection categories: category i covers values below bound i (last one is open-ended)
+DURATION_CATEGORIES = ("short", "standard", "long", "very_long", "epic")
+DURATION_CATEGORY_BOUNDS_MS = (60 * 60000, 120 * 60000, 180 * 60000, 240 * 60000)
+
+# Worker processes shared by all generate() calls (created on first use)
+_iteration_pool: ProcessPoolExecutor | None = None
+_iteration_pool_lock = threading.Lock()
+
+
+def _parse_block_time(time_str: str | None) -> tuple[int, int] | None:
+    """Parse a block time string (HH:MM) to (hour, minute), None if empty or invalid."""
+    if not time_str:
+        return None
+    try:
+        parts = time_str.split(":")
+        hour = int(parts[0])
+        minute = int(parts[1]) if len(parts) > 1 else 0
+    except (ValueError, IndexError):
+        return None
+    return hour, minute
+
+
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on (honours CPU affinity where supported)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _get_iteration_pool() -> ProcessPoolExecutor:
+    """Return the shared iteration pool, starting it on first use.
+
+    Workers are spawned rather than forked: generate() runs in a thread of the
+    server process, and forking a multi-threaded process can copy held locks.
+    """
+    global _iteration_pool
+    with _iteration_pool_lock:
+        if _iteration_pool is None:
+            _iteration_pool = ProcessPoolExecutor(
+                max_workers=_available_cpus(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _iteration_pool
+
+
+def shutdown_iteration_pool() -> None:
+    """Stop the shared iteration pool, if it was started."""
+    global _iteration_pool
+    with _iteration_pool_lock:
+        pool, _iteration_pool = _iteration_pool, None
+    if pool:
+        pool.shutdown(cancel_futures=True)
+
+
+def _iteration_worker(
+    scoring_engine: ScoringEngine, iteration_args: tuple[Any, ...], indices: range
+) -> list[tuple["ProgrammingResult", tuple[Any, ...]]]:
+    """Run consecutive seeded iterations in a worker process, each with its final random state."""
+    (
+        contents,
+        mandatory_contents,
+        profile,
+        start_datetime,
+        duration_hours,
+        randomness,
+        seed,
+        block_pools,
+    ) = iteration_args
+    generator = ProgrammingGenerator(scoring_engine)
+    results = []
+    for index in indices:
+        iter_seed = seed + index
+        random.seed(iter_seed)
+        result = generator._generate_iteration(
+            contents,
+            mandatory_contents,
+            profile,
+            start_datetime,
+            duration_hours,
+            randomness,
+            index + 1,
+            iter_seed,
+            block_pools,
+        )
+        results.append((result, random.getstate()))
+    return results
+
 
 @dataclass
 class ScheduledProgram:
@@ -30,6 +133,16 @@ class ScheduledProgram:
     replacement_reason: str | None = None  # "forbidden" | "improved" | None
     replaced_title: str | None = None  # Title of the program that was replaced
 
+    @cached_property
+    def duration(self) -> timedelta:
+        """Content duration, computed once per program."""
+        return timedelta(milliseconds=self.content.get("duration_ms", 0))
+
+    @cached_property
+    def content_key(self) -> str:
+        """Content identifier used for de-duplication (plex_key, falling back to id)."""
+        return self.content.get("plex_key", self.content.get("id", ""))
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -49,6 +162,18 @@ class ScheduledProgram:
         }
 
 
+@dataclass(slots=True)
+class PreselectionResult:
+    """M/F/P pre-selection result of a content item for a block."""
+
+    tier: int  # 1 (best) to 4 (fallback)
+    preselect_score: int  # Score within tier (higher is better)
+    preferred_matches: list[str]
+    mandatory_matches: list[str]
+    mandatory_misses: list[str]
+    forbidden_violations: list[str]
+
+
 @dataclass
 class ProgrammingResult:
     """Result of a programming generation."""
@@ -90,6 +215,10 @@ class ProgrammingResult:
         }
 
 
+# Alternative program from another iteration: (-score, order, program, result)
+Alternative = tuple[float, int, ScheduledProgram, ProgrammingResult]
+
+
 class ProgrammingGenerator:
     """Generates optimized programming with N iterations."""
 
@@ -97,6 +226,7 @@ class ProgrammingGenerator:
         self,
         scoring_engine: ScoringEngine | None = None,
         on_progress: Callable[[int, int, float], None] | None = None,
+        parallel: bool = False,
     ) -> None:
         """
         Initialize generator.
@@ -104,9 +234,11 @@ class ProgrammingGenerator:
         Args:
             scoring_engine: Scoring engine instance (creates new if None)
             on_progress: Callback for progress updates (iteration, total, best_score)
+            parallel: Run iterations for large pools in the shared worker pool
         """
         self.scoring_engine = scoring_engine or ScoringEngine()
         self.on_progress = on_progress
+        self.parallel = parallel
 
     def generate(
         self,
@@ -138,6 +270,8 @@ class ProgrammingGenerator:
         if seed is None:
             seed = random.randint(0, 2**31)
 
+        self.scoring_engine.clear_caches()
+
         # Filter forbidden content (profile-level)
         filtered_contents = self._filter_forbidden(contents, profile)
         logger.info(
@@ -172,25 +306,24 @@ class ProgrammingGenerator:
         mandatory_contents = self._get_mandatory(contents, profile)
         logger.info(f"Found {len(mandatory_contents)} mandatory items")
 
+        # Pre-filter each time block once for all iterations
+        block_pools = self._prefilter_blocks(filtered_contents, profile)
+
         all_results: list[ProgrammingResult] = []
         best_result: ProgrammingResult | None = None
 
-        for i in range(iterations):
-            # Use deterministic seed per iteration
-            iter_seed = seed + i
-            random.seed(iter_seed)
-
-            result = self._generate_iteration(
-                filtered_contents,
-                mandatory_contents,
-                profile,
-                start_datetime,
-                duration_hours,
-                randomness,
-                i + 1,
-                iter_seed,
-            )
-
+        iteration_results = self._generate_iterations(
+            filtered_contents,
+            mandatory_contents,
+            profile,
+            start_datetime,
+            duration_hours,
+            randomness,
+            iterations,
+            seed,
+            block_pools,
+        )
+        for i, result in enumerate(iteration_results):
             all_results.append(result)
 
             result_score = result.total_score or 0.0
@@ -272,6 +405,80 @@ class ProgrammingGenerator:
             seed=seed,
         )
 
+    def _generate_iterations(
+        self,
+        contents: list[tuple[dict[str, Any], dict[str, Any] | None]],
+        mandatory_contents: list[tuple[dict[str, Any], dict[str, Any] | None]],
+        profile: dict[str, Any],
+        start_datetime: datetime,
+        duration_hours: int,
+        randomness: float,
+        iterations: int,
+        seed: int,
+        block_pools: dict[str, list[tuple[dict[str, Any], dict[str, Any] | None]]],
+    ) -> Iterator[ProgrammingResult]:
+        """
+        Yield the results of all iterations in order.
+
+        Each iteration only depends on its seed (seed + index), so for a
+        parallel generator, large pools run in the shared worker pool. The random state the last iteration ends in is restored afterwards,
+        so the post-processing steps draw the same numbers as after a sequential run.
+        """
+        iteration_args = (
+            contents,
+            mandatory_contents,
+            profile,
+            start_datetime,
+            duration_hours,
+            randomness,
+            seed,
+            block_pools,
+        )
+
+        done = 0
+        max_workers = min(iterations, _available_cpus())
+        if self.parallel and max_workers > 1 and len(contents) >= ITERATION_PARALLEL_MIN_CONTENTS:
+            try:
+                pool = _get_iteration_pool()
+                # One contiguous run of iterations per worker, so the inputs are sent
+                # once per worker rather than once per iteration
+                step = -(-iterations // max_workers)
+                futures = [
+                    pool.submit(
+                        _iteration_worker,
+                        self.scoring_engine,
+                        iteration_args,
+                        range(start, min(start + step, iterations)),
+                    )
+                    for start in range(0, iterations, step)
+                ]
+                for future in futures:
+                    for result, random_state in future.result():
+                        done += 1
+                        yield result
+                random.setstate(random_state)
+            except Exception as e:
+                logger.warning(f"Parallel iterations failed, running sequentially: {e}")
+                if isinstance(e, BrokenProcessPool):
+                    shutdown_iteration_pool()
+
+        for i in range(done, iterations):
+            # Use deterministic seed per iteration
+            iter_seed = seed + i
+            random.seed(iter_seed)
+
+            yield self._generate_iteration(
+                contents,
+                mandatory_contents,
+                profile,
+                start_datetime,
+                duration_hours,
+                randomness,
+                i + 1,
+                iter_seed,
+                block_pools,
+            )
+
     def _generate_iteration(
         self,
         contents: list[tuple[dict[str, Any], dict[str, Any] | None]],
@@ -282,10 +489,12 @@ class ProgrammingGenerator:
         randomness: float,
         iteration: int,
         seed: int,
+        block_pools: dict[str, list[tuple[dict[str, Any], dict[str, Any] | None]]] | None = None,
     ) -> ProgrammingResult:
         """Generate a single iteration of programming."""
         block_manager = TimeBlockManager(profile)
         programs: list[ScheduledProgram] = []
+        today = datetime.now()
 
         current_time = start_datetime
         end_time = start_datetime + timedelta(hours=duration_hours)
@@ -328,8 +537,16 @@ class ProgrammingGenerator:
                 if block.name != current_block_name:
                     is_first_in_block = True
                     current_block_name = block.name
-                    # Pre-filter content for this new block
-                    block_filtered = self._prefilter_for_block(base_available, block_dict)
+                    # Pre-filter content for this new block (reuse the block pool if available)
+                    block_pool = block_pools.get(block.name) if block_pools else None
+                    if block_pool is not None:
+                        block_filtered = [
+                            (c, m)
+                            for c, m in block_pool
+                            if c.get("plex_key", c.get("id", "")) not in used_content_ids
+                        ]
+                    else:
+                        block_filtered = self._prefilter_for_block(base_available, block_dict)
                     if not block_filtered:
                         logger.warning(
                             f"No content passes pre-filter for block '{block.name}', "
@@ -344,6 +561,8 @@ class ProgrammingGenerator:
                 block_end_time=block_end_time,
                 is_first_in_block=is_first_in_block,
                 is_schedule_start=(position == 0),  # First program of entire schedule
+                current_year=today.year,
+                current_month=today.month,
             )
 
             # Use pre-filtered content for this block (falls back to base if empty)
@@ -354,10 +573,10 @@ class ProgrammingGenerator:
             # The UI will highlight forbidden content, but we don't exclude them here
             scored_content = []
             forbidden_count = 0
-            for content, meta in available:
-                score = self.scoring_engine.score(
-                    content, meta, profile, block_dict, scoring_context
-                )
+            scores = self.scoring_engine.score_batch(
+                available, profile, block_dict, scoring_context
+            )
+            for (content, meta), score in zip(available, scores, strict=True):
                 scored_content.append((content, meta, score))
                 if score.forbidden_violations:
                     forbidden_count += 1
@@ -476,22 +695,11 @@ class ProgrammingGenerator:
             adjusted = base_weight * (1 - randomness) + randomness
             weights.append(adjusted)
 
-        # Normalize weights
-        total_weight = sum(weights)
-        if total_weight <= 0:
+        if not any(weights):
             return sorted_content[0]
 
-        normalized = [w / total_weight for w in weights]
-
         # Weighted random selection
-        r = random.random()
-        cumulative = 0.0
-        for i, weight in enumerate(normalized):
-            cumulative += weight
-            if r <= cumulative:
-                return sorted_content[i]
-
-        return sorted_content[0]
+        return random.choices(sorted_content, weights=weights, k=1)[0]
 
     def _recalculate_timing_scores(
         self,
@@ -512,9 +720,6 @@ class ProgrammingGenerator:
         if not programs:
             return
 
-        # Import timing criterion
-        from app.core.scoring.criteria.timing_criterion import TimingCriterion
-
         timing_criterion = TimingCriterion()
 
         # Get time blocks from profile
@@ -587,8 +792,6 @@ class ProgrammingGenerator:
                 2. Replace hour/minute to get the block time in local
                 3. Return as naive datetime (for consistent local time comparisons)
                 """
-                from app.core.blocks.time_block_manager import _get_local_timezone
-
                 try:
                     parts = time_str.split(":")
                     hour = int(parts[0])
@@ -699,8 +902,6 @@ class ProgrammingGenerator:
             for idx in indices[1:-1]:  # Skip first and last
                 prog = programs[idx]
                 # Create a skipped timing result
-                from app.core.scoring.base_criterion import CriterionResult
-
                 timing_result = CriterionResult(
                     name="timing",
                     score=0.0,
@@ -750,43 +951,16 @@ class ProgrammingGenerator:
             prog.score.total_score = 0.0
         else:
             adjusted_score = prog.score.weighted_total
-            for penalty in prog.score.mandatory_penalties:
-                adjusted_score -= penalty.get("penalty", 10.0)
+            if prog.score.mandatory_penalties:
+                adjusted_score -= sum(
+                    penalty.get("penalty", 10.0) for penalty in prog.score.mandatory_penalties
+                )
             # Apply keyword multiplier if present
             if prog.score.keyword_multiplier != 1.0:
                 adjusted_score *= prog.score.keyword_multiplier
-            prog.score.total_score = max(0.0, min(100.0, adjusted_score))
-
-    def _recalculate_consecutive_timings(
-        self,
-        programs: list[ScheduledProgram],
-    ) -> None:
-        """
-        Recalculate start/end times for consecutive programs after replacements.
-
-        When a program is replaced with one of a different duration, subsequent
-        programs' start times need to be adjusted to avoid overlaps or gaps.
-
-        This method ensures all programs are consecutive with no overlaps:
-        - First program keeps its original start_time
-        - Each subsequent program starts when the previous one ends
-        - End times are calculated from start_time + duration
-        """
-        if not programs:
-            return
-
-        for idx in range(len(programs)):
-            prog = programs[idx]
-            duration_ms = prog.content.get("duration_ms", 0)
-
-            if idx == 0:
-                # First program: keep original start, recalculate end
-                prog.end_time = prog.start_time + timedelta(milliseconds=duration_ms)
-            else:
-                # Subsequent programs: start when previous ends
-                prev_prog = programs[idx - 1]
-                prog.start_time = prev_prog.end_time
-                prog.end_time = prog.start_time + timedelta(milliseconds=duration_ms)
+            prog.score.total_score = (
+                0.0 if adjusted_score < 0.0 else 100.0 if adjusted_score > 100.0 else adjusted_score
+            )
 
     def _recalculate_block_names(
         self,
@@ -807,99 +981,121 @@ class ProgrammingGenerator:
         if not programs:
             return
 
-        from app.core.blocks.time_block_manager import TimeBlockManager
-
         block_manager = TimeBlockManager(profile)
 
         changes_made = 0
         for prog in programs:
-            old_block_name = prog.block_name
-            block = block_manager.get_block_for_datetime(prog.start_time)
-            if block:
-                prog.block_name = block.name
-                if old_block_name != block.name:
-                    changes_made += 1
-                    logger.info(
-                        f"Block name change: '{prog.content.get('title')}' at {prog.start_time.strftime('%H:%M')} "
-                        f"changed from '{old_block_name}' to '{block.name}'"
-                    )
-            else:
-                prog.block_name = "Unknown"
-                if old_block_name != "Unknown":
-                    changes_made += 1
-                    logger.warning(
-                        f"No block found for '{prog.content.get('title')}' at {prog.start_time.strftime('%H:%M')}"
-                    )
+            if self._update_block_name(prog, block_manager):
+                changes_made += 1
 
         logger.info(f"_recalculate_block_names: {changes_made} block name changes made")
 
-    def _recalculate_full_scores(
+    def _recalculate_programs(
         self,
         programs: list[ScheduledProgram],
         profile: dict[str, Any],
-    ) -> None:
+    ) -> int:
         """
-        Recalculate full scores for programs after block changes.
+        Recalculate times, block names and full scores after replacements, in one pass.
 
-        After block name recalculation, programs may be in different blocks with
-        different criteria. This method recalculates the complete score for each
-        program using the criteria of its current block.
+        When a program is replaced with one of a different duration, subsequent
+        programs' start times need to be adjusted to avoid overlaps or gaps:
+        - First program keeps its original start_time
+        - Each subsequent program starts when the previous one ends
+        - End times are calculated from start_time + duration
+
+        Programs may then have shifted to different time blocks, so each program's
+        block_name is updated to the block containing its actual start_time, and its
+        complete score is recalculated with the criteria of that block (important
+        for forbidden detection).
+
+        Returns:
+            Number of programs with forbidden violations after recalculation
         """
         if not programs:
-            return
+            return 0
+
+        block_manager = TimeBlockManager(profile)
 
         time_blocks = profile.get("time_blocks", [])
-        time_block_map = {tb.get("name", ""): tb for tb in time_blocks}
 
-        recalculated_count = 0
-        from app.core.blocks.time_block_manager import _get_local_timezone
-        from app.core.scoring.base_criterion import ScoringContext
+        # Parse block start/end times once per block: name -> (block_dict, start, end)
+        block_ctx_map: dict[
+            str, tuple[dict[str, Any], tuple[int, int] | None, tuple[int, int] | None]
+        ] = {
+            tb.get("name", ""): (
+                tb,
+                _parse_block_time(tb.get("start_time", "00:00")),
+                _parse_block_time(tb.get("end_time", "00:00")),
+            )
+            for tb in time_blocks
+        }
+        no_block_ctx: tuple[dict[str, Any], None, None] = ({}, None, None)
 
-        def build_block_datetime_for_recalc(
-            time_str: str, reference_dt: datetime
-        ) -> datetime | None:
-            """Build a full datetime from block time string (HH:MM) using reference date."""
-            if not time_str:
-                return None
-            try:
-                parts = time_str.split(":")
-                hour = int(parts[0])
-                minute = int(parts[1]) if len(parts) > 1 else 0
-            except (ValueError, IndexError):
-                return None
+        block_changes = 0
+        forbidden_count = 0
 
-            # Convert reference to local time first (block times are in local time)
-            if reference_dt.tzinfo is not None:
-                local_tz = _get_local_timezone()
-                local_ref = reference_dt.astimezone(local_tz)
-            else:
-                local_ref = reference_dt
+        local_tz = _get_local_timezone()
 
-            return local_ref.replace(hour=hour, minute=minute, second=0, microsecond=0, tzinfo=None)
+        # Single context updated per program (the engine does not keep a reference to it)
+        today = datetime.now()
+        scoring_context = ScoringContext(
+            is_last_in_block=False,  # Will be updated in timing recalculation
+            current_year=today.year,
+            current_month=today.month,
+        )
 
+        prev_end_time: datetime | None = None
         for prog_idx, prog in enumerate(programs):
-            block_dict = time_block_map.get(prog.block_name, {})
+            # Consecutive timing: subsequent programs start when the previous one ends
+            if prev_end_time is not None:
+                prog.start_time = prev_end_time
+            prog.end_time = prog.start_time + prog.duration
+            prev_end_time = prog.end_time
+
+            # Block containing the actual start time
+            if self._update_block_name(prog, block_manager):
+                block_changes += 1
+
+            block_dict, block_start_hm, block_end_hm = block_ctx_map.get(
+                prog.block_name, no_block_ctx
+            )
 
             # Build proper timing context using program's actual start time
+            # (block times are in local time, built as naive datetimes)
             block_start_time = None
             block_end_time = None
             if block_dict and prog.start_time:
-                block_start_str = block_dict.get("start_time", "00:00")
-                block_end_str = block_dict.get("end_time", "00:00")
-                block_start_time = build_block_datetime_for_recalc(block_start_str, prog.start_time)
-                block_end_time = build_block_datetime_for_recalc(block_end_str, prog.start_time)
+                local_ref = (
+                    prog.start_time.astimezone(local_tz)
+                    if prog.start_time.tzinfo is not None
+                    else prog.start_time
+                )
+                if block_start_hm:
+                    block_start_time = local_ref.replace(
+                        hour=block_start_hm[0],
+                        minute=block_start_hm[1],
+                        second=0,
+                        microsecond=0,
+                        tzinfo=None,
+                    )
+                if block_end_hm:
+                    block_end_time = local_ref.replace(
+                        hour=block_end_hm[0],
+                        minute=block_end_hm[1],
+                        second=0,
+                        microsecond=0,
+                        tzinfo=None,
+                    )
 
-            # Build scoring context with proper timing info
-            scoring_context = ScoringContext(
-                current_time=prog.start_time,
-                block_start_time=block_start_time,
-                block_end_time=block_end_time,
-                is_first_in_block=prog.position == 0,
-                is_last_in_block=False,  # Will be updated in timing recalculation
-                is_schedule_start=(prog_idx == 0),  # First program of entire schedule
-            )
+            # Update scoring context with proper timing info
+            scoring_context.current_time = prog.start_time
+            scoring_context.block_start_time = block_start_time
+            scoring_context.block_end_time = block_end_time
+            scoring_context.is_first_in_block = prog.position == 0
+            scoring_context.is_schedule_start = prog_idx == 0  # First program of entire schedule
 
-            # Recalculate full score with new block criteria
+            # Recalculate full score with the criteria of the actual block
             new_score = self.scoring_engine.score(
                 prog.content,
                 prog.content_meta,
@@ -909,8 +1105,10 @@ class ProgrammingGenerator:
             )
 
             # Check if forbidden status changed
-            old_forbidden = len(prog.score.forbidden_violations) > 0 if prog.score else False
-            new_forbidden = len(new_score.forbidden_violations) > 0
+            old_forbidden = bool(prog.score and prog.score.forbidden_violations)
+            new_forbidden = bool(new_score.forbidden_violations)
+            if new_forbidden:
+                forbidden_count += 1
 
             if new_forbidden != old_forbidden:
                 logger.info(
@@ -919,9 +1117,33 @@ class ProgrammingGenerator:
                 )
 
             prog.score = new_score
-            recalculated_count += 1
 
-        logger.info(f"_recalculate_full_scores: recalculated {recalculated_count} programs")
+        logger.info(
+            f"_recalculate_programs: {block_changes} block name changes made, "
+            f"recalculated {len(programs)} programs"
+        )
+        return forbidden_count
+
+    def _update_block_name(self, prog: ScheduledProgram, block_manager: TimeBlockManager) -> bool:
+        """Set the program's block_name from its start_time. Returns True if it changed."""
+        old_block_name = prog.block_name
+        block = block_manager.get_block_for_datetime(prog.start_time)
+        if block:
+            prog.block_name = block.name
+            if old_block_name != block.name:
+                logger.info(
+                    f"Block name change: '{prog.content.get('title')}' at {prog.start_time.strftime('%H:%M')} "
+                    f"changed from '{old_block_name}' to '{block.name}'"
+                )
+                return True
+        else:
+            prog.block_name = "Unknown"
+            if old_block_name != "Unknown":
+                logger.warning(
+                    f"No block found for '{prog.content.get('title')}' at {prog.start_time.strftime('%H:%M')}"
+                )
+                return True
+        return False
 
     def _filter_forbidden(
         self,
@@ -981,6 +1203,32 @@ class ProgrammingGenerator:
             if content.get("plex_key", "") in mandatory_ids
         ]
 
+    def _prefilter_blocks(
+        self,
+        contents: list[tuple[dict[str, Any], dict[str, Any] | None]],
+        profile: dict[str, Any],
+    ) -> dict[str, list[tuple[dict[str, Any], dict[str, Any] | None]]]:
+        """
+        Pre-filter the content pool for every time block of the profile.
+
+        Pre-filtering only reorders content with a stable sort, so dropping used
+        content from these pools gives the same order as pre-filtering the
+        remaining content again.
+
+        Returns:
+            Dict of block_name -> pre-filtered pool (duplicate block names are skipped)
+        """
+        blocks = [block.to_dict() for block in TimeBlockManager(profile).blocks]
+        block_names = [block["name"] for block in blocks]
+        blocks = [block for block in blocks if block_names.count(block["name"]) == 1]
+        if not blocks or not contents:
+            return {}
+
+        return {
+            block["name"]: [contents[i] for i in self._prefilter_order(contents, block)]
+            for block in blocks
+        }
+
     def _prefilter_for_block(
         self,
         contents: list[tuple[dict[str, Any], dict[str, Any] | None]],
@@ -998,38 +1246,48 @@ class ProgrammingGenerator:
 
         Returns a pool sorted by preselection score (best first).
         """
-
         criteria = block.get("criteria", {}) if block else {}
         if not criteria:
             return contents
 
+        return [contents[i] for i in self._prefilter_order(contents, block)]
+
+    def _prefilter_order(
+        self,
+        contents: list[tuple[dict[str, Any], dict[str, Any] | None]],
+        block: dict[str, Any],
+    ) -> list[int]:
+        """Return content indices in pre-selection order for a block (see _prefilter_for_block)."""
+        criteria = block.get("criteria", {}) if block else {}
+        if not criteria:
+            return list(range(len(contents)))
+
         # Extract all rules from criteria
         rules_config = self._extract_mfp_rules(criteria)
 
-        # Score each content for preselection
-        scored_contents: list[tuple[dict[str, Any], dict[str, Any] | None, dict[str, Any]]] = []
+        # Bucket content by tier (1-4) as (-preselect_score, index) entries
+        tier_buckets: tuple[list[tuple[int, int]], ...] = ([], [], [], [])
 
-        for content, meta in contents:
+        for idx, (content, meta) in enumerate(contents):
             preselect_result = self._evaluate_preselection(content, meta, criteria, rules_config)
-            scored_contents.append((content, meta, preselect_result))
+            tier_buckets[preselect_result.tier - 1].append((-preselect_result.preselect_score, idx))
 
         # Log preselection stats
-        tier_counts = {1: 0, 2: 0, 3: 0, 4: 0}
-        for _, _, result in scored_contents:
-            tier_counts[result["tier"]] += 1
-
         block_name = block.get("name", "unnamed") if block else "unknown"
         logger.info(
             f"Block '{block_name}' preselection: "
-            f"Tier1(preferred)={tier_counts[1]}, Tier2(mandatory)={tier_counts[2]}, "
-            f"Tier3(no_forbidden)={tier_counts[3]}, Tier4(fallback)={tier_counts[4]}"
+            f"Tier1(preferred)={len(tier_buckets[0])}, Tier2(mandatory)={len(tier_buckets[1])}, "
+            f"Tier3(no_forbidden)={len(tier_buckets[2])}, Tier4(fallback)={len(tier_buckets[3])}"
         )
 
-        # Sort by: tier (ascending), then preselect_score (descending)
-        scored_contents.sort(key=lambda x: (x[2]["tier"], -x[2]["preselect_score"]))
+        # Tiers are already in order: sort each bucket by preselect_score (descending),
+        # then original order, and concatenate
+        order: list[int] = []
+        for bucket in tier_buckets:
+            bucket.sort()
+            order.extend(idx for _, idx in bucket)
 
-        # Return only content, meta (without the score dict)
-        return [(c, m) for c, m, _ in scored_contents]
+        return order
 
     def _extract_mfp_rules(self, criteria: dict[str, Any]) -> dict[str, dict[str, Any]]:
         """
@@ -1118,20 +1376,14 @@ class ProgrammingGenerator:
         meta: dict[str, Any] | None,
         criteria: dict[str, Any],
         rules_config: dict[str, dict[str, Any]],
-    ) -> dict[str, Any]:
+    ) -> PreselectionResult:
         """
         Evaluate content against M/F/P rules and return preselection result.
 
         Returns:
-            dict with keys:
-            - tier: 1 (best) to 4 (fallback)
-            - preselect_score: numeric score within tier
-            - preferred_matches: list of matched preferred criteria
-            - mandatory_matches: list of matched mandatory criteria
-            - forbidden_violations: list of violated forbidden criteria
+            PreselectionResult with tier (1 best to 4 fallback), score within tier
+            and the matched/missed/violated criteria
         """
-        from app.core.scoring.criteria.age_criterion import AgeCriterion
-
         preferred_matches: list[str] = []
         mandatory_matches: list[str] = []
         mandatory_misses: list[str] = []
@@ -1139,6 +1391,10 @@ class ProgrammingGenerator:
 
         meta = meta or {}
 
+        # Content values used by several rule categories
+        content_rating_raw = meta.get("age_rating") or meta.get("content_rating") or ""
+        duration_ms = content.get("duration_ms", 0)
+
         # === GENRE EVALUATION ===
         if "genre" in rules_config:
             content_genres = {g.lower() for g in meta.get("genres", [])}
@@ -1219,8 +1475,7 @@ class ProgrammingGenerator:
         # === AGE EVALUATION ===
         if "age" in rules_config:
             age_rules = rules_config["age"]
-            raw_rating = meta.get("age_rating") or meta.get("content_rating") or ""
-            content_rating = raw_rating.lower() if raw_rating else ""
+            content_rating = content_rating_raw.lower()
 
             if content_rating:
                 if content_rating in age_rules["preferred"]:
@@ -1230,15 +1485,13 @@ class ProgrammingGenerator:
 
         # Also check max_age_rating constraint
         max_age_rating = criteria.get("max_age_rating")
-        if max_age_rating:
-            content_rating = meta.get("age_rating") or meta.get("content_rating") or ""
-            if content_rating:
-                max_level = AgeCriterion.get_rating_level(max_age_rating)
-                content_level = AgeCriterion.get_rating_level(content_rating)
-                if content_level > max_level:
-                    forbidden_violations.append(
-                        f"age:exceeds_max({content_rating}>{max_age_rating})"
-                    )
+        if max_age_rating and content_rating_raw:
+            max_level = AgeCriterion.get_rating_level(max_age_rating)
+            content_level = AgeCriterion.get_rating_level(content_rating_raw)
+            if content_level > max_level:
+                forbidden_violations.append(
+                    f"age:exceeds_max({content_rating_raw}>{max_age_rating})"
+                )
 
         # === TYPE EVALUATION ===
         if "type" in rules_config:
@@ -1259,7 +1512,7 @@ class ProgrammingGenerator:
         # === DURATION EVALUATION ===
         if "duration" in rules_config:
             duration_rules = rules_config["duration"]
-            duration_category = self._get_duration_category(content.get("duration_ms", 0))
+            duration_category = self._get_duration_category(duration_ms)
 
             if duration_category:
                 if duration_category in duration_rules["preferred"]:
@@ -1272,7 +1525,6 @@ class ProgrammingGenerator:
         # Also check min/max duration constraints
         min_duration = criteria.get("min_duration_min")
         max_duration = criteria.get("max_duration_min")
-        duration_ms = content.get("duration_ms", 0)
         duration_min = duration_ms / 60000 if duration_ms else 0
 
         if min_duration and duration_min < min_duration:
@@ -1286,7 +1538,7 @@ class ProgrammingGenerator:
         # Tier 3: No forbidden violations
         # Tier 4: Fallback (has forbidden)
 
-        has_forbidden = len(forbidden_violations) > 0
+        has_forbidden = bool(forbidden_violations)
         has_preferred = len(preferred_matches) > 0
         has_mandatory_miss = len(mandatory_misses) > 0
 
@@ -1305,14 +1557,14 @@ class ProgrammingGenerator:
             len(preferred_matches) * 10 + len(mandatory_matches) * 5 - len(mandatory_misses) * 3
         )
 
-        return {
-            "tier": tier,
-            "preselect_score": preselect_score,
-            "preferred_matches": preferred_matches,
-            "mandatory_matches": mandatory_matches,
-            "mandatory_misses": mandatory_misses,
-            "forbidden_violations": forbidden_violations,
-        }
+        return PreselectionResult(
+            tier=tier,
+            preselect_score=preselect_score,
+            preferred_matches=preferred_matches,
+            mandatory_matches=mandatory_matches,
+            mandatory_misses=mandatory_misses,
+            forbidden_violations=forbidden_violations,
+        )
 
     def _get_content_bonus_categories(
         self, content: dict[str, Any], meta: dict[str, Any]
@@ -1322,8 +1574,6 @@ class ProgrammingGenerator:
 
         Categories: blockbuster, popular, collection, recent, old, classic, vintage
         """
-        from datetime import datetime
-
         categories: set[str] = set()
 
         # Blockbuster: revenue > budget * 2
@@ -1371,14 +1621,7 @@ class ProgrammingGenerator:
         if rating is None:
             return None
 
-        if rating >= 8.0:
-            return "excellent"
-        elif rating >= 7.0:
-            return "good"
-        elif rating >= 5.0:
-            return "average"
-        else:
-            return "poor"
+        return rating_category(rating)
 
     def _get_content_keywords(self, content: dict[str, Any], meta: dict[str, Any]) -> set[str]:
         """
@@ -1460,18 +1703,40 @@ class ProgrammingGenerator:
         if not duration_ms:
             return None
 
-        duration_min = duration_ms / 60000
+        return DURATION_CATEGORIES[bisect_right(DURATION_CATEGORY_BOUNDS_MS, duration_ms)]
 
-        if duration_min < 60:
-            return "short"
-        elif duration_min < 120:
-            return "standard"
-        elif duration_min < 180:
-            return "long"
-        elif duration_min < 240:
-            return "very_long"
-        else:
-            return "epic"
+    def _build_alternatives_map(
+        self,
+        all_results: list[ProgrammingResult],
+        best_result: ProgrammingResult,
+        block_names: set[str] | None = None,
+    ) -> dict[str, list[Alternative]]:
+        """
+        Group non-forbidden programs of the other iterations by block name.
+
+        Each alternative is a (-score, order, program, result) tuple, so plain tuple
+        ordering sorts by score descending and keeps the original order for equal scores.
+
+        Args:
+            all_results: All iteration results
+            best_result: The best result (its own programs are skipped)
+            block_names: Only collect alternatives for these blocks (all blocks if None)
+        """
+        alternatives_map: dict[str, list[Alternative]] = {}
+        order = 0
+        for result in all_results:
+            if result.iteration == best_result.iteration:
+                continue  # Skip the best result itself
+            for prog in result.programs:
+                if prog.score.forbidden_violations:
+                    continue
+                if block_names is not None and prog.block_name not in block_names:
+                    continue
+                alternatives_map.setdefault(prog.block_name, []).append(
+                    (-(prog.score.total_score or 0.0), order, prog, result)
+                )
+                order += 1
+        return alternatives_map
 
     def _replace_forbidden_programs(
         self,
@@ -1501,10 +1766,11 @@ class ProgrammingGenerator:
             Modified ProgrammingResult with forbidden content replaced and is_optimized=True
         """
         # Find programs with forbidden violations
-        forbidden_programs: list[tuple[int, ScheduledProgram]] = []
-        for idx, prog in enumerate(best_result.programs):
-            if prog.score.forbidden_violations:
-                forbidden_programs.append((idx, prog))
+        forbidden_programs: list[tuple[int, ScheduledProgram]] = [
+            (idx, prog)
+            for idx, prog in enumerate(best_result.programs)
+            if prog.score.forbidden_violations
+        ]
 
         if not forbidden_programs:
             logger.info("No forbidden programs to replace")
@@ -1514,165 +1780,196 @@ class ProgrammingGenerator:
         logger.info(f"Found {len(forbidden_programs)} forbidden programs to replace")
 
         # Track used content IDs to avoid duplicates
-        used_content_ids: set[str] = set()
-        for prog in best_result.programs:
-            content_id = prog.content.get("plex_key", prog.content.get("id", ""))
-            if content_id:
-                used_content_ids.add(content_id)
+        used_content_ids: set[str] = {
+            content_id for prog in best_result.programs if (content_id := prog.content_key)
+        }
 
-        # Build a map of block_name -> programs from other iterations
-        # Only include programs that are NOT forbidden
-        other_iterations_map: dict[str, list[tuple[ScheduledProgram, ProgrammingResult]]] = {}
-        for result in all_results:
-            if result.iteration == best_result.iteration:
-                continue  # Skip the best result itself
-            for prog in result.programs:
-                if not prog.score.forbidden_violations:
-                    block_name = prog.block_name
-                    if block_name not in other_iterations_map:
-                        other_iterations_map[block_name] = []
-                    other_iterations_map[block_name].append((prog, result))
-
-        # Sort each block's alternatives by score descending
-        for block_name in other_iterations_map:
-            other_iterations_map[block_name].sort(
-                key=lambda x: x[0].score.total_score or 0.0, reverse=True
-            )
+        # Build a map of block_name -> heap of alternatives from other iterations
+        # (best score first, then original order). Only include programs that are NOT forbidden,
+        # and only for blocks that actually have forbidden programs to replace
+        forbidden_block_names = {prog.block_name for _, prog in forbidden_programs}
+        other_iterations_map = self._build_alternatives_map(
+            all_results, best_result, forbidden_block_names
+        )
+        for alternatives in other_iterations_map.values():
+            heapq.heapify(alternatives)
 
         # Get time blocks for pre-filtering
         time_blocks = profile.get("time_blocks", [])
         time_block_map = {tb.get("name", ""): tb for tb in time_blocks}
 
+        # Block lookup for scoring replacement candidates (block times are in local time)
+        block_manager = TimeBlockManager(profile)
+        local_tz = _get_local_timezone()
+
+        # Pre-filtered pools by block name (several forbidden programs can share a block)
+        prefilter_cache: dict[str, list[tuple[dict[str, Any], dict[str, Any] | None]]] = {}
+        # Per-block index of the first pool entry whose content may still be available
+        pool_cursors: dict[str, int] = {}
+
+        # Used content only becomes available again when its forbidden program is replaced,
+        # so any other used content can be skipped for good
+        releasable_ids = {prog.content_key for _, prog in forbidden_programs}
+
         # Process each forbidden program
         replaced_count = 0
-        new_programs = list(best_result.programs)
+        # Copied on the first replacement only
+        new_programs: list[ScheduledProgram] | None = None
+
+        # Calendar values shared by every candidate scored in this pass
+        today = datetime.now()
+
+        # Whether each program starts its block (replacements keep the block name,
+        # so this stays valid for the whole pass)
+        programs = best_result.programs
+        first_in_block = [True] + [
+            programs[idx - 1].block_name != programs[idx].block_name
+            for idx in range(1, len(programs))
+        ]
 
         for prog_idx, forbidden_prog in forbidden_programs:
             block_name = forbidden_prog.block_name
-            forbidden_id = forbidden_prog.content.get(
-                "plex_key", forbidden_prog.content.get("id", "")
-            )
+            forbidden_id = forbidden_prog.content_key
+            forbidden_title = forbidden_prog.content.get("title")
 
             replacement: ScheduledProgram | None = None
 
             # Strategy 1: Find replacement from other iterations
             if block_name in other_iterations_map:
-                for alt_prog, _ in other_iterations_map[block_name]:
-                    alt_id = alt_prog.content.get("plex_key", alt_prog.content.get("id", ""))
-                    if alt_id and alt_id not in used_content_ids:
-                        # Found a valid replacement from another iteration
-                        # Create a new ScheduledProgram with adjusted times
+                alternatives = other_iterations_map[block_name]
+                # Rejected alternatives whose content may be freed later go back to the heap
+                rejected: list[Alternative] = []
+                while alternatives:
+                    alternative = heapq.heappop(alternatives)
+                    _, _, alt_prog, alt_result = alternative
+                    alt_id = alt_prog.content_key
+                    if not alt_id:
+                        continue
+                    if alt_id in used_content_ids:
+                        if alt_id in releasable_ids:
+                            rejected.append(alternative)
+                        continue
+
+                    # Found a valid replacement from another iteration
+                    # Create a new ScheduledProgram with adjusted times
+                    replacement = ScheduledProgram(
+                        content=alt_prog.content,
+                        content_meta=alt_prog.content_meta,
+                        start_time=forbidden_prog.start_time,
+                        end_time=forbidden_prog.start_time + alt_prog.duration,
+                        block_name=block_name,
+                        position=forbidden_prog.position,
+                        score=alt_prog.score,  # Keep original score
+                        is_replacement=True,
+                        replacement_reason="forbidden",
+                        replaced_title=forbidden_title,
+                    )
+                    used_content_ids.add(alt_id)
+                    logger.info(
+                        f"Replaced forbidden '{forbidden_title}' "
+                        f"with '{alt_prog.content.get('title')}' "
+                        f"from iteration #{alt_result.iteration}"
+                    )
+                    break
+                for alternative in rejected:
+                    heapq.heappush(alternatives, alternative)
+
+            # Strategy 2: Find replacement from pre-filtered pool
+            if replacement is None:
+                # Pre-filter with the block criteria (once per block)
+                block_filtered = prefilter_cache.get(block_name)
+                if block_filtered is None:
+                    block_dict = time_block_map.get(block_name, {})
+                    block_filtered = self._prefilter_for_block(filtered_contents, block_dict)
+                    prefilter_cache[block_name] = block_filtered
+
+                # Block containing the forbidden program's start time, used for scoring
+                block = block_manager.get_block_for_datetime(forbidden_prog.start_time)
+                block_dict_for_scoring = block.to_dict() if block else None
+
+                # Block start/end around the forbidden program (local time, naive).
+                # Uses the already parsed block times instead of the "HH:MM" strings.
+                block_start_time = None
+                block_end_time = None
+                if block:
+                    ref_dt = forbidden_prog.start_time
+                    local_ref = ref_dt.astimezone(local_tz) if ref_dt.tzinfo is not None else ref_dt
+                    block_start_time = local_ref.replace(
+                        hour=block.start_time.hour,
+                        minute=block.start_time.minute,
+                        second=0,
+                        microsecond=0,
+                        tzinfo=None,
+                    )
+                    block_end_time = local_ref.replace(
+                        hour=block.end_time.hour,
+                        minute=block.end_time.minute,
+                        second=0,
+                        microsecond=0,
+                        tzinfo=None,
+                    )
+
+                # Skip the leading pool entries whose content can never be available again
+                pool_start = pool_cursors.get(block_name, 0)
+                while pool_start < len(block_filtered):
+                    content = block_filtered[pool_start][0]
+                    content_id = content.get("plex_key", content.get("id", ""))
+                    if content_id and (
+                        content_id not in used_content_ids or content_id in releasable_ids
+                    ):
+                        break
+                    pool_start += 1
+                pool_cursors[block_name] = pool_start
+
+                # Scoring context only depends on the forbidden program's position
+                scoring_context = ScoringContext(
+                    current_time=forbidden_prog.start_time,
+                    block_start_time=block_start_time,
+                    block_end_time=block_end_time,
+                    is_first_in_block=first_in_block[prog_idx],
+                    is_schedule_start=(prog_idx == 0),  # First program of entire schedule
+                    current_year=today.year,
+                    current_month=today.month,
+                )
+
+                # Find best non-forbidden content not already used.
+                # Candidates are scored lazily so scoring stops at the first acceptable one.
+                candidates = [
+                    (content, meta)
+                    for content, meta in islice(block_filtered, pool_start, None)
+                    if (content_id := content.get("plex_key", content.get("id", "")))
+                    and content_id not in used_content_ids
+                ]
+                scores = self.scoring_engine.iter_scores(
+                    candidates, profile, block_dict_for_scoring, scoring_context
+                )
+                for (content, meta), score in zip(candidates, scores, strict=True):
+                    # Only use if not forbidden
+                    if not score.forbidden_violations:
                         replacement = ScheduledProgram(
-                            content=alt_prog.content,
-                            content_meta=alt_prog.content_meta,
+                            content=content,
+                            content_meta=meta,
                             start_time=forbidden_prog.start_time,
                             end_time=forbidden_prog.start_time
-                            + timedelta(milliseconds=alt_prog.content.get("duration_ms", 0)),
+                            + timedelta(milliseconds=content.get("duration_ms", 0)),
                             block_name=block_name,
                             position=forbidden_prog.position,
-                            score=alt_prog.score,  # Keep original score
+                            score=score,
                             is_replacement=True,
                             replacement_reason="forbidden",
-                            replaced_title=forbidden_prog.content.get("title"),
+                            replaced_title=forbidden_title,
                         )
-                        used_content_ids.add(alt_id)
+                        used_content_ids.add(content.get("plex_key", content.get("id", "")))
                         logger.info(
-                            f"Replaced forbidden '{forbidden_prog.content.get('title')}' "
-                            f"with '{alt_prog.content.get('title')}' from iteration #{_.iteration}"
+                            f"Replaced forbidden '{forbidden_title}' "
+                            f"with '{content.get('title')}' from pre-filtered pool"
                         )
                         break
 
-            # Strategy 2: Find replacement from pre-filtered pool
-            if replacement is None:
-                # Get block criteria for pre-filtering
-                block_dict = time_block_map.get(block_name, {})
-                block_filtered = self._prefilter_for_block(filtered_contents, block_dict)
-
-                # Find best non-forbidden content not already used
-                for content, meta in block_filtered:
-                    content_id = content.get("plex_key", content.get("id", ""))
-                    if content_id and content_id not in used_content_ids:
-                        # Score this content for the current position
-                        from app.core.blocks.time_block_manager import TimeBlockManager
-
-                        block_manager = TimeBlockManager(profile)
-                        block = block_manager.get_block_for_datetime(forbidden_prog.start_time)
-                        block_dict_for_scoring = block.to_dict() if block else None
-
-                        # Create scoring context with proper block timing
-                        block_start_time = None
-                        block_end_time = None
-                        if block_dict_for_scoring:
-                            from app.core.blocks.time_block_manager import _get_local_timezone
-
-                            block_start_str = block_dict_for_scoring.get("start_time", "00:00")
-                            block_end_str = block_dict_for_scoring.get("end_time", "00:00")
-                            ref_dt = forbidden_prog.start_time
-                            try:
-                                parts = block_start_str.split(":")
-                                hour, minute = int(parts[0]), int(parts[1]) if len(parts) > 1 else 0
-                                if ref_dt.tzinfo is not None:
-                                    local_tz = _get_local_timezone()
-                                    local_ref = ref_dt.astimezone(local_tz)
-                                else:
-                                    local_ref = ref_dt
-                                block_start_time = local_ref.replace(
-                                    hour=hour, minute=minute, second=0, microsecond=0, tzinfo=None
-                                )
-                            except (ValueError, IndexError):
-                                pass
-                            try:
-                                parts = block_end_str.split(":")
-                                hour, minute = int(parts[0]), int(parts[1]) if len(parts) > 1 else 0
-                                if ref_dt.tzinfo is not None:
-                                    local_tz = _get_local_timezone()
-                                    local_ref = ref_dt.astimezone(local_tz)
-                                else:
-                                    local_ref = ref_dt
-                                block_end_time = local_ref.replace(
-                                    hour=hour, minute=minute, second=0, microsecond=0, tzinfo=None
-                                )
-                            except (ValueError, IndexError):
-                                pass
-
-                        scoring_context = ScoringContext(
-                            current_time=forbidden_prog.start_time,
-                            block_start_time=block_start_time,
-                            block_end_time=block_end_time,
-                            is_first_in_block=(
-                                prog_idx == 0 or new_programs[prog_idx - 1].block_name != block_name
-                            ),
-                            is_schedule_start=(prog_idx == 0),  # First program of entire schedule
-                        )
-
-                        score = self.scoring_engine.score(
-                            content, meta, profile, block_dict_for_scoring, scoring_context
-                        )
-
-                        # Only use if not forbidden
-                        if not score.forbidden_violations:
-                            replacement = ScheduledProgram(
-                                content=content,
-                                content_meta=meta,
-                                start_time=forbidden_prog.start_time,
-                                end_time=forbidden_prog.start_time
-                                + timedelta(milliseconds=content.get("duration_ms", 0)),
-                                block_name=block_name,
-                                position=forbidden_prog.position,
-                                score=score,
-                                is_replacement=True,
-                                replacement_reason="forbidden",
-                                replaced_title=forbidden_prog.content.get("title"),
-                            )
-                            used_content_ids.add(content_id)
-                            logger.info(
-                                f"Replaced forbidden '{forbidden_prog.content.get('title')}' "
-                                f"with '{content.get('title')}' from pre-filtered pool"
-                            )
-                            break
-
             # Apply replacement if found
             if replacement:
+                if new_programs is None:
+                    new_programs = list(best_result.programs)
                 new_programs[prog_idx] = replacement
                 # Mark old content as available again (remove from used)
                 if forbidden_id:
@@ -1680,33 +1977,25 @@ class ProgrammingGenerator:
                 replaced_count += 1
             else:
                 logger.warning(
-                    f"Could not find replacement for forbidden '{forbidden_prog.content.get('title')}' "
+                    f"Could not find replacement for forbidden '{forbidden_title}' "
                     f"in block '{block_name}'"
                 )
 
         logger.info(f"Replaced {replaced_count}/{len(forbidden_programs)} forbidden programs")
 
         # If no replacements were made, return original
-        if replaced_count == 0:
+        if new_programs is None:
             return best_result
 
-        # Recalculate consecutive timings after replacements (programs may have different durations)
-        self._recalculate_consecutive_timings(new_programs)
-
-        # Recalculate block names based on new start times
-        self._recalculate_block_names(new_programs, profile)
-
-        # Recalculate full scores with new block criteria (important for forbidden detection)
-        self._recalculate_full_scores(new_programs, profile)
+        # Recalculate consecutive timings (programs may have different durations), block names
+        # and full scores with the new block criteria (important for forbidden detection)
+        forbidden_count = self._recalculate_programs(new_programs, profile)
 
         # Recalculate timing scores for the new program list
         self._recalculate_timing_scores(new_programs, profile)
 
-        # Recalculate totals after timing recalculation
-        # Also recount forbidden programs after full score recalculation
-        forbidden_count = sum(
-            1 for p in new_programs if p.score and len(p.score.forbidden_violations) > 0
-        )
+        # Recalculate totals after timing recalculation (timing updates never change
+        # forbidden violations, so the count from the full score recalculation still holds)
         total_score = sum((p.score.total_score or 0.0) for p in new_programs)
         avg_score = total_score / len(new_programs) if new_programs else 0.0
 
@@ -1747,59 +2036,43 @@ class ProgrammingGenerator:
         Returns:
             Improved ProgrammingResult with is_improved=True if improvements were made
         """
-        # Build a map of block_name -> programs from other iterations with their scores
-        other_iterations_map: dict[str, list[tuple[ScheduledProgram, ProgrammingResult]]] = {}
-        for result in all_results:
-            if result.iteration == best_result.iteration:
-                continue
-            for prog in result.programs:
-                block_name = prog.block_name
-                if block_name not in other_iterations_map:
-                    other_iterations_map[block_name] = []
-                other_iterations_map[block_name].append((prog, result))
-
-        # Sort each block's alternatives by score descending
-        for block_name in other_iterations_map:
-            other_iterations_map[block_name].sort(
-                key=lambda x: x[0].score.total_score or 0.0, reverse=True
-            )
+        # Build a map of block_name -> alternatives from other iterations, sorted by score
+        # descending. Programs with forbidden violations are never improvement candidates.
+        other_iterations_map = self._build_alternatives_map(all_results, best_result)
+        for alternatives in other_iterations_map.values():
+            alternatives.sort()
+        # Negated scores per block (ascending) to locate the higher-score prefix with bisect
+        negated_scores_map = {
+            block_name: [alternative[0] for alternative in alternatives]
+            for block_name, alternatives in other_iterations_map.items()
+        }
 
         # Track used content IDs to avoid duplicates
-        used_content_ids: set[str] = set()
-        for prog in best_result.programs:
-            content_id = prog.content.get("plex_key", prog.content.get("id", ""))
-            if content_id:
-                used_content_ids.add(content_id)
+        used_content_ids: set[str] = {
+            content_id for prog in best_result.programs if (content_id := prog.content_key)
+        }
 
         # Process each program in the best result
         improved_count = 0
-        new_programs = list(best_result.programs)
+        # Copied on the first improvement only
+        new_programs: list[ScheduledProgram] | None = None
 
         for prog_idx, current_prog in enumerate(best_result.programs):
             block_name = current_prog.block_name
             current_score = current_prog.score.total_score or 0.0
-            current_id = current_prog.content.get("plex_key", current_prog.content.get("id", ""))
+            current_id = current_prog.content_key
 
             if block_name not in other_iterations_map:
                 continue
 
-            # Find candidates with higher scores that aren't already used and have no forbidden violations
-            candidates: list[tuple[ScheduledProgram, ProgrammingResult]] = []
-            for alt_prog, alt_result in other_iterations_map[block_name]:
-                alt_id = alt_prog.content.get("plex_key", alt_prog.content.get("id", ""))
-                alt_score = alt_prog.score.total_score or 0.0
-                # Skip programs with forbidden violations
-                has_forbidden = (
-                    len(alt_prog.score.forbidden_violations) > 0 if alt_prog.score else False
-                )
-
-                if (
-                    alt_id
-                    and alt_id not in used_content_ids
-                    and alt_score > current_score
-                    and not has_forbidden
-                ):
-                    candidates.append((alt_prog, alt_result))
+            # Find candidates with higher scores that aren't already used
+            # (alternatives scoring higher than the current program form a prefix)
+            higher_count = bisect_left(negated_scores_map[block_name], -current_score)
+            candidates: list[tuple[ScheduledProgram, ProgrammingResult]] = [
+                (alt_prog, alt_result)
+                for _, _, alt_prog, alt_result in other_iterations_map[block_name][:higher_count]
+                if alt_prog.content_key and alt_prog.content_key not in used_content_ids
+            ]
 
             if not candidates:
                 continue
@@ -1808,15 +2081,14 @@ class ProgrammingGenerator:
             selected = self._select_improvement_with_randomness(candidates, randomness)
             if selected:
                 alt_prog, alt_result = selected
-                alt_id = alt_prog.content.get("plex_key", alt_prog.content.get("id", ""))
+                alt_id = alt_prog.content_key
 
                 # Create replacement program with adjusted times
                 replacement = ScheduledProgram(
                     content=alt_prog.content,
                     content_meta=alt_prog.content_meta,
                     start_time=current_prog.start_time,
-                    end_time=current_prog.start_time
-                    + timedelta(milliseconds=alt_prog.content.get("duration_ms", 0)),
+                    end_time=current_prog.start_time + alt_prog.duration,
                     block_name=block_name,
                     position=current_prog.position,
                     score=alt_prog.score,
@@ -1825,6 +2097,8 @@ class ProgrammingGenerator:
                     replaced_title=current_prog.content.get("title"),
                 )
 
+                if new_programs is None:
+                    new_programs = list(best_result.programs)
                 new_programs[prog_idx] = replacement
                 used_content_ids.add(alt_id)
                 if current_id:
@@ -1837,29 +2111,21 @@ class ProgrammingGenerator:
                     f"from iteration #{alt_result.iteration}"
                 )
 
-        if improved_count == 0:
+        if new_programs is None:
             logger.info("No improvements possible")
             return best_result
 
         logger.info(f"Improved {improved_count} programs")
 
-        # Recalculate consecutive timings after replacements (programs may have different durations)
-        self._recalculate_consecutive_timings(new_programs)
-
-        # Recalculate block names based on new start times
-        self._recalculate_block_names(new_programs, profile)
-
-        # Recalculate full scores with new block criteria (important for forbidden detection)
-        self._recalculate_full_scores(new_programs, profile)
+        # Recalculate consecutive timings (programs may have different durations), block names
+        # and full scores with the new block criteria (important for forbidden detection)
+        forbidden_count = self._recalculate_programs(new_programs, profile)
 
         # Recalculate timing scores for the new program list
         self._recalculate_timing_scores(new_programs, profile)
 
-        # Recalculate totals after timing recalculation
-        # Also count forbidden programs
-        forbidden_count = sum(
-            1 for p in new_programs if p.score and len(p.score.forbidden_violations) > 0
-        )
+        # Recalculate totals after timing recalculation (timing updates never change
+        # forbidden violations, so the count from the full score recalculation still holds)
         total_score = sum((p.score.total_score or 0.0) for p in new_programs)
         avg_score = total_score / len(new_programs) if new_programs else 0.0
 
@@ -1901,19 +2167,8 @@ class ProgrammingGenerator:
             adjusted = base_weight * (1 - randomness) + randomness
             weights.append(adjusted)
 
-        # Normalize weights
-        total_weight = sum(weights)
-        if total_weight <= 0:
+        if not any(weights):
             return candidates[0]
 
-        normalized = [w / total_weight for w in weights]
-
         # Weighted random selection
-        r = random.random()
-        cumulative = 0.0
-        for i, weight in enumerate(normalized):
-            cumulative += weight
-            if r <= cumulative:
-                return candidates[i]
-
-        return candidates[0]
+        return random.choices(candidates, weights=weights, k=1)[0]
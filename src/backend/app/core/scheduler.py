@@ -2,22 +2,170 @@
 
 import asyncio
 import logging
-import threading
+import re
+import time
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.core.job_manager import JobType, get_job_manager
+from app.db.database import async_session_maker, vacuum_db
+from app.services.schedule_service import ScheduleService
 
 logger = logging.getLogger(__name__)
 
+# Cron expression with exactly five fields: minute hour day month day_of_week
+_CRON_RE = re.compile(r"^\s*\S+\s+\S+\s+\S+\s+\S+\s+\S+\s*$")
+
+# How long a loaded schedule is reused before being read from the database again
+SCHEDULE_CACHE_TTL_SECONDS = 5.0
+
+# Delay used to batch schedule status updates submitted close together
+STATUS_FLUSH_DELAY_SECONDS = 0.05
+
+# Interval between incremental vacuum passes on the database
+DB_VACUUM_INTERVAL_HOURS = 1
+
+# Maximum number of manually triggered schedule runs executing at the same time
+MAX_CONCURRENT_AD_HOC_RUNS = 8
+
+
+@lru_cache(maxsize=512)
+def _build_trigger_cached(
+    mode: str, expression: str, time_str: str, frequency: str, days: tuple
+) -> CronTrigger | None:
+    """Build a CronTrigger for a normalized schedule config.
+
+    Triggers are not modified after creation, so identical configs share one instance.
+    Invalid configs raise and are not cached.
+    """
+    if mode == "cron":
+        # Parse cron expression: minute hour day month day_of_week
+        minute, hour, day, month, day_of_week = expression.split()
+        return CronTrigger(minute=minute, hour=hour, day=day, month=month, day_of_week=day_of_week)
+
+    hour, minute = time_str.split(":")
+    hour = int(hour)
+    minute = int(minute)
+
+    if frequency == "daily":
+        return CronTrigger(hour=hour, minute=minute)
+    elif frequency == "weekly":
+        # days is list of day indices (0=Monday, 6=Sunday)
+        if days:
+            day_of_week = ",".join(str(d) for d in days)
+            return CronTrigger(hour=hour, minute=minute, day_of_week=day_of_week)
+        else:
+            # Default to Monday
+            return CronTrigger(hour=hour, minute=minute, day_of_week="0")
+    elif frequency == "specific_days":
+        if days:
+            day_of_week = ",".join(str(d) for d in days)
+            return CronTrigger(hour=hour, minute=minute, day_of_week=day_of_week)
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class _ScheduleRun:
+    """Fields of a schedule read when executing it (plain values, not an ORM instance)."""
+
+    id: str
+    name: str
+    enabled: bool
+    schedule_type: str
+    channel_id: str
+    profile_id: str | None
+    execution_params: dict[str, Any]
+
+
+class _StatusWriter:
+    """
+    Buffers schedule execution status updates and writes them in batches.
+
+    Schedules firing together (e.g. several "daily 06:00" schedules) submit their
+    status changes within a few milliseconds of each other. Updates are collected for
+    a short delay and written in one transaction; for a schedule updated several times
+    within that delay, only its latest status is written.
+    """
+
+    def __init__(self, delay: float = STATUS_FLUSH_DELAY_SECONDS) -> None:
+        self._delay = delay
+        # schedule_id -> column values, latest update wins
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._event = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flush task and write what is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._flush()
+
+    async def submit(self, schedule_id: str, status: str, next_run: datetime | None) -> None:
+        """Queue a status update (written immediately if the writer is not running)."""
+        values: dict[str, Any] = {
+            "id": schedule_id,
+            "last_execution_at": datetime.utcnow(),
+            "last_execution_status": status,
+        }
+        if next_run:
+            values["next_execution_at"] = next_run
+        self._pending[schedule_id] = values
+
+        if self._task is None:
+            await self._flush()
+        else:
+            self._event.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._event.wait()
+            # Give other schedules firing in the same tick a chance to join the batch
+            await asyncio.sleep(self._delay)
+            self._event.clear()
+            # Shielded so stopping the writer never interrupts a batch being written
+            await asyncio.shield(self._flush())
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+        updates = list(self._pending.values())
+        self._pending.clear()
+        try:
+            async with async_session_maker() as session:
+                service = ScheduleService(session)
+                await service.update_execution_statuses(updates)
+        except Exception as e:
+            logger.error(f"Error updating execution status of {len(updates)} schedules: {e}")
+
 
 class SchedulerManager:
     """Manages APScheduler for scheduled programming/scoring jobs."""
 
-    def __init__(self) -> None:
+    def __init__(self, max_concurrent_ad_hoc: int = MAX_CONCURRENT_AD_HOC_RUNS) -> None:
         self._scheduler: AsyncIOScheduler | None = None
         self._started = False
+        # Manually triggered runs, kept referenced until done so they cannot be collected
+        self._ad_hoc_tasks: set[asyncio.Task] = set()
+        self._max_concurrent_ad_hoc = max_concurrent_ad_hoc
+        # schedule_id -> (loaded_at monotonic time, schedule fields)
+        self._schedule_cache: dict[str, tuple[float, _ScheduleRun]] = {}
+        self._status_writer = _StatusWriter()
 
     async def start(self) -> None:
         """Initialize and start the scheduler."""
@@ -26,56 +174,92 @@ class SchedulerManager:
             return
 
         self._scheduler = AsyncIOScheduler()
+
+        # Sync schedules from database before starting: APScheduler adds the jobs queued
+        # before start() in one batch instead of waking up its loop for every job
+        schedule_ids = await self._sync_schedules_from_db()
+        self._scheduler.add_job(
+            vacuum_db,
+            trigger=IntervalTrigger(hours=DB_VACUUM_INTERVAL_HOURS),
+            id="db_vacuum",
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+        )
+
         self._scheduler.start()
+        self._status_writer.start()
         self._started = True
         logger.info("APScheduler started")
 
-        # Sync schedules from database
-        await self._sync_schedules_from_db()
+        # Next run times are only known once the jobs are scheduled
+        await self._store_next_executions(schedule_ids)
 
     async def stop(self) -> None:
         """Stop the scheduler gracefully."""
+        # Let manually triggered runs finish first
+        if self._ad_hoc_tasks:
+            await asyncio.gather(*self._ad_hoc_tasks, return_exceptions=True)
+
         if self._scheduler and self._started:
             self._scheduler.shutdown(wait=True)
+            await self._status_writer.stop()
             self._started = False
             logger.info("APScheduler stopped")
 
-    async def _sync_schedules_from_db(self) -> None:
-        """Load all enabled schedules from database and register them."""
-        from app.db.database import async_session_maker
-        from app.services.schedule_service import ScheduleService
-
+    async def _sync_schedules_from_db(self) -> list[str]:
+        """Load all enabled schedules from database and register them. Returns their IDs."""
+        registered: list[str] = []
         try:
             async with async_session_maker() as session:
                 service = ScheduleService(session)
                 schedules = await service.list_schedules(enabled=True)
 
                 for schedule in schedules:
-                    await self._register_schedule(schedule)
-                    logger.info(f"Registered schedule: {schedule.name} ({schedule.id})")
+                    if await self._register_schedule(schedule):
+                        registered.append(schedule.id)
+                        logger.info(f"Registered schedule: {schedule.name} ({schedule.id})")
 
                 logger.info(f"Synced {len(schedules)} schedules from database")
         except Exception as e:
             logger.error(f"Error syncing schedules: {e}")
+        return registered
 
-    async def _register_schedule(self, schedule: Any) -> None:
-        """Register a schedule with APScheduler."""
-        if not self._scheduler:
+    async def _store_next_executions(self, schedule_ids: list[str]) -> None:
+        """Write the next run time of the given registered schedules in one batch."""
+        if not self._scheduler or not schedule_ids:
             return
 
+        next_runs: dict[str, datetime] = {}
+        for schedule_id in schedule_ids:
+            job = self._scheduler.get_job(f"schedule_{schedule_id}")
+            if job and job.next_run_time:
+                next_runs[schedule_id] = job.next_run_time
+
+        try:
+            async with async_session_maker() as session:
+                service = ScheduleService(session)
+                await service.update_next_executions(next_runs)
+        except Exception as e:
+            logger.error(f"Error updating next_execution: {e}")
+
+    async def _register_schedule(self, schedule: Any) -> bool:
+        """
+        Register a schedule with APScheduler. Returns True if a job was added.
+
+        Before the scheduler is started the job is only queued, and its next run time
+        is stored by the caller once the scheduler runs.
+        """
+        if not self._scheduler:
+            return False
+
         trigger = self._build_trigger(schedule.schedule_config)
         if not trigger:
             logger.warning(f"Could not build trigger for schedule {schedule.id}")
-            return
+            return False
 
-        # Remove existing job if any
+        # Add new job (replace_existing swaps out a previously registered job, if any)
         job_id = f"schedule_{schedule.id}"
-        try:
-            self._scheduler.remove_job(job_id)
-        except Exception:
-            pass
-
-        # Add new job
         self._scheduler.add_job(
             self._execute_schedule,
             trigger=trigger,
@@ -86,9 +270,15 @@ class SchedulerManager:
         )
 
         # Update next_execution_at
-        job = self._scheduler.get_job(job_id)
-        if job and job.next_run_time:
-            await self._update_next_execution(schedule.id, job.next_run_time)
+        if self._started:
+            job = self._scheduler.get_job(job_id)
+            # Skip the database round-trip when the stored time is already current. The
+            # SQLite DateTime column keeps the wall-clock time and drops tzinfo, so compare
+            # APScheduler's aware time the same way
+            if job and job.next_run_time:
+                if job.next_run_time.replace(tzinfo=None) != schedule.next_execution_at:
+                    await self._update_next_execution(schedule.id, job.next_run_time)
+        return True
 
     def _build_trigger(self, schedule_config: dict) -> CronTrigger | None:
         """Convert schedule config to APScheduler CronTrigger."""
@@ -96,19 +286,10 @@ class SchedulerManager:
 
         if mode == "cron":
             expression = schedule_config.get("expression", "")
-            if not expression:
+            if not expression or not _CRON_RE.match(expression):
                 return None
             try:
-                # Parse cron expression: minute hour day month day_of_week
-                parts = expression.split()
-                if len(parts) == 5:
-                    return CronTrigger(
-                        minute=parts[0],
-                        hour=parts[1],
-                        day=parts[2],
-                        month=parts[3],
-                        day_of_week=parts[4],
-                    )
+                return _build_trigger_cached(mode, expression, "", "", ())
             except Exception as e:
                 logger.error(f"Invalid cron expression '{expression}': {e}")
                 return None
@@ -116,27 +297,11 @@ class SchedulerManager:
         elif mode == "simple":
             time_str = schedule_config.get("time", "06:00")
             frequency = schedule_config.get("frequency", "daily")
-            days = schedule_config.get("days", [])
+            # Sorted tuple so equivalent day lists share one cache entry
+            days = tuple(sorted(schedule_config.get("days", []), key=str))
 
             try:
-                hour, minute = time_str.split(":")
-                hour = int(hour)
-                minute = int(minute)
-
-                if frequency == "daily":
-                    return CronTrigger(hour=hour, minute=minute)
-                elif frequency == "weekly":
-                    # days is list of day indices (0=Monday, 6=Sunday)
-                    if days:
-                        day_of_week = ",".join(str(d) for d in days)
-                        return CronTrigger(hour=hour, minute=minute, day_of_week=day_of_week)
-                    else:
-                        # Default to Monday
-                        return CronTrigger(hour=hour, minute=minute, day_of_week="0")
-                elif frequency == "specific_days":
-                    if days:
-                        day_of_week = ",".join(str(d) for d in days)
-                        return CronTrigger(hour=hour, minute=minute, day_of_week=day_of_week)
+                return _build_trigger_cached(mode, "", time_str, frequency, days)
             except Exception as e:
                 logger.error(f"Invalid simple schedule config: {e}")
                 return None
@@ -147,13 +312,10 @@ class SchedulerManager:
         """Execute a scheduled task (programming or scoring)."""
         logger.info(f"Executing schedule: {schedule_id}")
 
-        from app.db.database import async_session_maker
-        from app.services.schedule_service import ScheduleService
-
         try:
             async with async_session_maker() as session:
                 service = ScheduleService(session)
-                schedule = await service.get_schedule(schedule_id)
+                schedule = await self._get_schedule_cached(service, schedule_id)
 
                 if not schedule:
                     logger.error(f"Schedule not found: {schedule_id}")
@@ -163,9 +325,8 @@ class SchedulerManager:
                     logger.info(f"Schedule {schedule_id} is disabled, skipping")
                     return
 
-                # Update status to running
-                await service.update_execution_status(schedule_id, "running", None)
-                await session.commit()
+            # Update status to running
+            await self._status_writer.submit(schedule_id, "running", None)
 
             # Execute based on type
             if schedule.schedule_type == "programming":
@@ -178,28 +339,19 @@ class SchedulerManager:
         except Exception as e:
             logger.error(f"Error executing schedule {schedule_id}: {e}")
             # Update status to failed
-            try:
-                async with async_session_maker() as session:
-                    service = ScheduleService(session)
-                    job = (
-                        self._scheduler.get_job(f"schedule_{schedule_id}")
-                        if self._scheduler
-                        else None
-                    )
-                    next_run = job.next_run_time if job else None
-                    await service.update_execution_status(schedule_id, "failed", next_run)
-                    await session.commit()
-            except Exception:
-                pass
+            await self._submit_status(schedule_id, "failed")
 
-    async def _execute_programming(self, schedule: Any) -> None:
+    async def _submit_status(self, schedule_id: str, status: str) -> None:
+        """Record the outcome of an execution together with the schedule's next run."""
+        job = self._scheduler.get_job(f"schedule_{schedule_id}") if self._scheduler else None
+        next_run = job.next_run_time if job else None
+        await self._status_writer.submit(schedule_id, status, next_run)
+
+    async def _execute_programming(self, schedule: _ScheduleRun) -> None:
         """Execute a programming schedule."""
         from app.api.routes.programming import ProgrammingRequest, _run_programming
-        from app.core.job_manager import JobType, get_job_manager
-        from app.db.database import async_session_maker
-        from app.services.schedule_service import ScheduleService
 
-        params = schedule.execution_params or {}
+        params = schedule.execution_params
 
         # Build ProgrammingRequest from stored params
         request = ProgrammingRequest(
@@ -229,42 +381,26 @@ class SchedulerManager:
             total_iterations=request.iterations,
         )
 
-        # Run programming in thread
-        def run_in_thread() -> None:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(_run_programming(job_id, request, schedule_id=schedule.id))
-            finally:
-                loop.close()
-
-        thread = threading.Thread(target=run_in_thread, daemon=True)
-        thread.start()
-
-        # Wait for completion (with timeout)
-        thread.join(timeout=3600)  # 1 hour timeout
+        # Run programming (the generator itself runs in an executor) and wait for completion
+        # (with timeout)
+        try:
+            await asyncio.wait_for(
+                _run_programming(job_id, request, schedule_id=schedule.id), timeout=3600
+            )  # 1 hour timeout
+        except TimeoutError:
+            logger.error(f"Scheduled programming timed out for schedule {schedule.id}")
 
         # Update schedule status
         job = await job_manager.get_job(job_id)
         status = "success" if job and job.status.value == "completed" else "failed"
 
-        async with async_session_maker() as session:
-            service = ScheduleService(session)
-            scheduler_job = (
-                self._scheduler.get_job(f"schedule_{schedule.id}") if self._scheduler else None
-            )
-            next_run = scheduler_job.next_run_time if scheduler_job else None
-            await service.update_execution_status(schedule.id, status, next_run)
-            await session.commit()
+        await self._submit_status(schedule.id, status)
 
-    async def _execute_scoring(self, schedule: Any) -> None:
+    async def _execute_scoring(self, schedule: _ScheduleRun) -> None:
         """Execute a scoring schedule."""
         from app.api.routes.scoring import ScoringRequest, _run_scoring
-        from app.core.job_manager import JobType, get_job_manager
-        from app.db.database import async_session_maker
-        from app.services.schedule_service import ScheduleService
 
-        params = schedule.execution_params or {}
+        params = schedule.execution_params
 
         # Build ScoringRequest from stored params
         request = ScoringRequest(
@@ -283,51 +419,56 @@ class SchedulerManager:
             profile_id=request.profile_id,
         )
 
-        # Run scoring in thread
-        def run_in_thread() -> None:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(_run_scoring(job_id, request, schedule_id=schedule.id))
-            finally:
-                loop.close()
-
-        thread = threading.Thread(target=run_in_thread, daemon=True)
-        thread.start()
-
-        # Wait for completion (with timeout)
-        thread.join(timeout=1800)  # 30 min timeout
+        # Run scoring (the scoring loop itself runs in an executor) and wait for completion
+        # (with timeout)
+        try:
+            await asyncio.wait_for(
+                _run_scoring(job_id, request, schedule_id=schedule.id), timeout=1800
+            )  # 30 min timeout
+        except TimeoutError:
+            logger.error(f"Scheduled scoring timed out for schedule {schedule.id}")
 
         # Update schedule status
         job = await job_manager.get_job(job_id)
         status = "success" if job and job.status.value == "completed" else "failed"
 
-        async with async_session_maker() as session:
-            service = ScheduleService(session)
-            scheduler_job = (
-                self._scheduler.get_job(f"schedule_{schedule.id}") if self._scheduler else None
-            )
-            next_run = scheduler_job.next_run_time if scheduler_job else None
-            await service.update_execution_status(schedule.id, status, next_run)
-            await session.commit()
+        await self._submit_status(schedule.id, status)
 
     async def _update_next_execution(self, schedule_id: str, next_run: datetime) -> None:
         """Update schedule's next_execution_at in database."""
-        from app.db.database import async_session_maker
-        from app.services.schedule_service import ScheduleService
-
         try:
             async with async_session_maker() as session:
                 service = ScheduleService(session)
-                schedule = await service.get_schedule(schedule_id)
-                if schedule:
-                    schedule.next_execution_at = next_run
-                    await session.commit()
+                await service.update_next_executions({schedule_id: next_run})
         except Exception as e:
             logger.error(f"Error updating next_execution: {e}")
 
+    async def _get_schedule_cached(self, service: Any, schedule_id: str) -> _ScheduleRun | None:
+        """Get the fields of a schedule, reusing ones loaded within the last few seconds."""
+        now = time.monotonic()
+        cached = self._schedule_cache.get(schedule_id)
+        if cached and now - cached[0] < SCHEDULE_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        schedule = await service.get_schedule(schedule_id)
+        if not schedule:
+            self._schedule_cache.pop(schedule_id, None)
+            return None
+        run = _ScheduleRun(
+            id=schedule.id,
+            name=schedule.name,
+            enabled=schedule.enabled,
+            schedule_type=schedule.schedule_type,
+            channel_id=schedule.channel_id,
+            profile_id=schedule.profile_id,
+            execution_params=dict(schedule.execution_params or {}),
+        )
+        self._schedule_cache[schedule_id] = (now, run)
+        return run
+
     async def add_schedule(self, schedule: Any) -> None:
         """Add or update a schedule in APScheduler."""
+        self._schedule_cache.pop(schedule.id, None)
         if schedule.enabled:
             await self._register_schedule(schedule)
         else:
@@ -335,6 +476,7 @@ class SchedulerManager:
 
     async def remove_schedule(self, schedule_id: str) -> None:
         """Remove a schedule from APScheduler."""
+        self._schedule_cache.pop(schedule_id, None)
         if not self._scheduler:
             return
 
@@ -346,9 +488,17 @@ class SchedulerManager:
             pass
 
     async def run_schedule_now(self, schedule_id: str) -> str:
-        """Trigger immediate execution of a schedule. Returns job_id."""
-        from app.db.database import async_session_maker
-        from app.services.schedule_service import ScheduleService
+        """
+        Trigger immediate execution of a schedule. Returns job_id.
+
+        Raises:
+            ValueError: If the schedule does not exist
+            RuntimeError: If too many manual runs are already in progress
+        """
+        if len(self._ad_hoc_tasks) >= self._max_concurrent_ad_hoc:
+            raise RuntimeError(
+                f"Too many schedule runs in progress (max {self._max_concurrent_ad_hoc})"
+            )
 
         async with async_session_maker() as session:
             service = ScheduleService(session)
@@ -358,7 +508,9 @@ class SchedulerManager:
                 raise ValueError(f"Schedule not found: {schedule_id}")
 
         # Execute in background
-        asyncio.create_task(self._execute_schedule(schedule_id))
+        task = asyncio.create_task(self._execute_schedule(schedule_id))
+        self._ad_hoc_tasks.add(task)
+        task.add_done_callback(self._ad_hoc_tasks.discard)
 
         return schedule_id
 
@@ -1,12 +1,48 @@
 """Base criterion abstract class for scoring."""
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
+_T = TypeVar("_T")
 
-@dataclass
+# Maximum number of (profile, block) entries kept per criterion before the cache is reset
+_POLICY_CACHE_MAX_SIZE = 256
+
+# Maximum number of metadata lists kept in the lowercased-values cache before it is reset
+_LOWERED_CACHE_MAX_SIZE = 4096
+
+# id(metadata list) -> (metadata list, lowercased values)
+_lowered_cache: dict[int, tuple[Any, tuple[str, ...]]] = {}
+
+
+def lowered_meta_values(content_meta: dict[str, Any], key: str) -> tuple[str, ...]:
+    """
+    Return the strings in content_meta[key] lowercased and interned.
+
+    The same metadata is scored by several criteria and again on every generation
+    iteration, so the result is cached by identity of the metadata list. The list is kept
+    alongside the values so a reused id never returns a stale entry.
+    """
+    values = content_meta.get(key)
+    if not values:
+        return ()
+
+    cached = _lowered_cache.get(id(values))
+    if cached is not None and cached[0] is values:
+        return cached[1]
+
+    lowered = tuple(sys.intern(v.lower()) for v in values)
+    if len(_lowered_cache) >= _LOWERED_CACHE_MAX_SIZE:
+        _lowered_cache.clear()
+    _lowered_cache[id(values)] = (values, lowered)
+    return lowered
+
+
+@dataclass(slots=True)
 class ScoringContext:
     """Context for scoring a content item at a specific position."""
 
@@ -16,9 +52,11 @@ class ScoringContext:
     is_first_in_block: bool = False  # Whether this is the first program in the block
     is_last_in_block: bool = False  # Whether this is the last program in the block
     is_schedule_start: bool = False  # Whether this is the very first program of the entire schedule
+    current_year: int | None = None  # Calendar year for age-based bonuses (None = now)
+    current_month: int | None = None  # Calendar month for seasonal bonuses (None = now)
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleViolation:
     """Rule violation or match detected for a criterion."""
 
@@ -27,7 +65,7 @@ class RuleViolation:
     penalty_or_bonus: float  # Points applied (negative for penalty, positive for bonus)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MFPPolicyConfig:
     """M/F/P (Mandatory/Forbidden/Preferred) point policy configuration."""
 
@@ -40,8 +78,13 @@ class MFPPolicyConfig:
 # Default MFP policy
 DEFAULT_MFP_POLICY = MFPPolicyConfig()
 
+_MFP_POLICY_KEYS = tuple(f.name for f in fields(MFPPolicyConfig))
 
-@dataclass
+# Shared read-only fallback for missing config sections
+_EMPTY_DICT: dict[str, Any] = {}
+
+
+@dataclass(slots=True)
 class CriterionResult:
     """Result of a criterion calculation."""
 
@@ -56,6 +99,23 @@ class CriterionResult:
     skipped: bool = False  # If True, this criterion is not applicable and excluded from total
 
 
+@dataclass(slots=True)
+class _PreparedRules:
+    """M/F/P rule values as (original, lowercased) pairs plus lowercased lookup sets."""
+
+    forbidden: tuple[tuple[str, str], ...]
+    forbidden_set: frozenset[str]
+    mandatory: tuple[tuple[str, str], ...]
+    mandatory_set: frozenset[str]
+    preferred: tuple[tuple[str, str], ...]
+    preferred_set: frozenset[str]
+    empty: bool  # No forbidden, mandatory or preferred values at all
+
+
+def _lowered(values: list[str] | None) -> tuple[tuple[str, str], ...]:
+    return tuple((v, v.lower()) for v in values or [])
+
+
 class BaseCriterion(ABC):
     """Abstract base class for scoring criteria."""
 
@@ -63,6 +123,44 @@ class BaseCriterion(ABC):
     weight_key: str = "base"
     default_weight: float = 10.0
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Criterion names key the per-content result dicts; interned names compare by identity
+        cls.name = sys.intern(cls.name)
+
+    def __init__(self) -> None:
+        # (kind, id(profile), id(block)) -> (profile, block, value)
+        self._policy_cache: dict[tuple[str, int, int], tuple[Any, Any, Any]] = {}
+
+    def _cached_policy(
+        self,
+        kind: str,
+        profile: dict[str, Any],
+        block: dict[str, Any] | None,
+        build: Callable[[], _T],
+    ) -> _T:
+        """
+        Return a per-(profile, block) value, building it on first use.
+
+        Profiles and blocks do not change during a scoring run, so the value is looked
+        up by object identity. The objects are kept alongside the value so a reused id
+        never returns a stale entry.
+        """
+        key = (kind, id(profile), id(block))
+        cached = self._policy_cache.get(key)
+        if cached is not None and cached[0] is profile and cached[1] is block:
+            return cached[2]
+
+        value = build()
+        if len(self._policy_cache) >= _POLICY_CACHE_MAX_SIZE:
+            self._policy_cache.clear()
+        self._policy_cache[key] = (profile, block, value)
+        return value
+
+    def clear_policy_cache(self) -> None:
+        """Drop cached per-(profile, block) values and the references they hold."""
+        self._policy_cache.clear()
+
     @abstractmethod
     def calculate(
         self,
@@ -98,6 +196,15 @@ class BaseCriterion(ABC):
         block: dict[str, Any] | None = None,
     ) -> float:
         """Get multiplier for this criterion from block or profile."""
+        return self._cached_policy(
+            "multiplier", profile, block, lambda: self._build_multiplier(profile, block)
+        )
+
+    def _build_multiplier(
+        self,
+        profile: dict[str, Any],
+        block: dict[str, Any] | None = None,
+    ) -> float:
         # Block-level multiplier takes priority
         if block:
             block_criteria = block.get("criteria", {})
@@ -118,45 +225,43 @@ class BaseCriterion(ABC):
         block: dict[str, Any] | None = None,
     ) -> MFPPolicyConfig:
         """Get M/F/P policy from block or profile."""
-        # Block-level policy takes priority
-        if block:
-            block_criteria = block.get("criteria", {})
-            block_policy = block_criteria.get("mfp_policy", {})
-            if block_policy:
-                return MFPPolicyConfig(
-                    mandatory_matched_bonus=block_policy.get(
-                        "mandatory_matched_bonus", DEFAULT_MFP_POLICY.mandatory_matched_bonus
-                    ),
-                    mandatory_missed_penalty=block_policy.get(
-                        "mandatory_missed_penalty", DEFAULT_MFP_POLICY.mandatory_missed_penalty
-                    ),
-                    forbidden_detected_penalty=block_policy.get(
-                        "forbidden_detected_penalty", DEFAULT_MFP_POLICY.forbidden_detected_penalty
-                    ),
-                    preferred_matched_bonus=block_policy.get(
-                        "preferred_matched_bonus", DEFAULT_MFP_POLICY.preferred_matched_bonus
-                    ),
-                )
-
-        # Fall back to profile-level policy
-        profile_policy = profile.get("mfp_policy", {})
-        if profile_policy:
-            return MFPPolicyConfig(
-                mandatory_matched_bonus=profile_policy.get(
-                    "mandatory_matched_bonus", DEFAULT_MFP_POLICY.mandatory_matched_bonus
-                ),
-                mandatory_missed_penalty=profile_policy.get(
-                    "mandatory_missed_penalty", DEFAULT_MFP_POLICY.mandatory_missed_penalty
-                ),
-                forbidden_detected_penalty=profile_policy.get(
-                    "forbidden_detected_penalty", DEFAULT_MFP_POLICY.forbidden_detected_penalty
-                ),
-                preferred_matched_bonus=profile_policy.get(
-                    "preferred_matched_bonus", DEFAULT_MFP_POLICY.preferred_matched_bonus
-                ),
-            )
-
-        return DEFAULT_MFP_POLICY
+        return self._cached_policy(
+            "mfp_policy", profile, block, lambda: self._build_mfp_policy(profile, block)
+        )
+
+    def _build_mfp_policy(
+        self,
+        profile: dict[str, Any],
+        block: dict[str, Any] | None = None,
+    ) -> MFPPolicyConfig:
+        # Block-level policy takes priority, then profile-level policy
+        block_criteria = (block or _EMPTY_DICT).get("criteria") or _EMPTY_DICT
+        policy = block_criteria.get("mfp_policy") or profile.get("mfp_policy") or _EMPTY_DICT
+
+        # Most profiles do not override anything: share the default policy
+        if not any(key in policy for key in _MFP_POLICY_KEYS):
+            return DEFAULT_MFP_POLICY
+
+        return MFPPolicyConfig(
+            **{key: policy.get(key, getattr(DEFAULT_MFP_POLICY, key)) for key in _MFP_POLICY_KEYS}
+        )
+
+    def get_scoring_params(
+        self,
+        profile: dict[str, Any],
+        block: dict[str, Any] | None = None,
+    ) -> tuple[float, float, MFPPolicyConfig]:
+        """Get (weight, multiplier, M/F/P policy) for a profile and block with one cache lookup."""
+        return self._cached_policy(
+            "scoring_params",
+            profile,
+            block,
+            lambda: (
+                self.get_weight(profile),
+                self._build_multiplier(profile, block),
+                self._build_mfp_policy(profile, block),
+            ),
+        )
 
     def check_rules(
         self,
@@ -181,20 +286,23 @@ class BaseCriterion(ABC):
             return 0.0, None
 
         policy = mfp_policy or DEFAULT_MFP_POLICY
-        content_lower = [v.lower() for v in content_values if v]
+        prepared = self.get_prepared_rules(rules)
+        if prepared.empty:
+            return 0.0, None
+
+        content_lower = {v.lower() for v in content_values if v}
 
         # Forbidden check (highest priority - checked first)
-        forbidden = rules.get("forbidden_values") or []
-        for f in forbidden:
-            if f.lower() in content_lower:
-                # Use rules-level penalty if defined, otherwise use MFP policy
-                penalty = rules.get("forbidden_penalty", policy.forbidden_detected_penalty)
-                return penalty, RuleViolation("forbidden", [f], penalty)
+        if not prepared.forbidden_set.isdisjoint(content_lower):
+            for f, f_lower in prepared.forbidden:
+                if f_lower in content_lower:
+                    # Use rules-level penalty if defined, otherwise use MFP policy
+                    penalty = rules.get("forbidden_penalty", policy.forbidden_detected_penalty)
+                    return penalty, RuleViolation("forbidden", [f], penalty)
 
         # Mandatory check
-        mandatory = rules.get("mandatory_values") or []
-        if mandatory:
-            missing = [m for m in mandatory if m.lower() not in content_lower]
+        if prepared.mandatory:
+            missing = [m for m, m_lower in prepared.mandatory if m_lower not in content_lower]
             if missing:
                 # Use rules-level penalty if defined, otherwise use MFP policy
                 penalty = rules.get("mandatory_penalty", policy.mandatory_missed_penalty)
@@ -202,18 +310,83 @@ class BaseCriterion(ABC):
             else:
                 # All mandatory values present - apply bonus
                 bonus = policy.mandatory_matched_bonus
-                return bonus, RuleViolation("mandatory", mandatory, bonus)
+                return bonus, RuleViolation("mandatory", rules.get("mandatory_values"), bonus)
 
         # Preferred check (bonus)
-        preferred = rules.get("preferred_values") or []
-        for p in preferred:
-            if p.lower() in content_lower:
-                # Use rules-level bonus if defined, otherwise use MFP policy
-                bonus = rules.get("preferred_bonus", policy.preferred_matched_bonus)
-                return bonus, RuleViolation("preferred", [p], bonus)
+        if not prepared.preferred_set.isdisjoint(content_lower):
+            for p, p_lower in prepared.preferred:
+                if p_lower in content_lower:
+                    # Use rules-level bonus if defined, otherwise use MFP policy
+                    bonus = rules.get("preferred_bonus", policy.preferred_matched_bonus)
+                    return bonus, RuleViolation("preferred", [p], bonus)
 
         return 0.0, None
 
+    def check_category_rules(
+        self,
+        category: str,
+        rules: dict[str, Any],
+        mfp_policy: MFPPolicyConfig,
+    ) -> tuple[float, RuleViolation | None]:
+        """
+        Check mandatory/forbidden/preferred rules for content with a single category.
+
+        Used by criteria that place content in exactly one category (type, rating
+        tier, duration range). Unlike check_rules, mandatory values are alternatives:
+        the category must be one of them.
+
+        Args:
+            category: The content's lowercase category
+            rules: Rules dict with mandatory_values, forbidden_values, preferred_values, etc.
+            mfp_policy: M/F/P policy config
+
+        Returns:
+            Tuple of (adjustment, violation), (0.0, None) if no rule applies
+        """
+        prepared = self.get_prepared_rules(rules)
+
+        # Check forbidden first (highest priority)
+        if category in prepared.forbidden_set:
+            penalty = rules.get("forbidden_penalty", mfp_policy.forbidden_detected_penalty)
+            return penalty, RuleViolation("forbidden", [category], penalty)
+
+        # Check mandatory (category must be IN the mandatory list)
+        if prepared.mandatory and category not in prepared.mandatory_set:
+            penalty = rules.get("mandatory_penalty", mfp_policy.mandatory_missed_penalty)
+            return penalty, RuleViolation("mandatory", [m for _, m in prepared.mandatory], penalty)
+
+        # Check preferred (bonus if in preferred list)
+        if category in prepared.preferred_set:
+            bonus = rules.get("preferred_bonus", mfp_policy.preferred_matched_bonus)
+            return bonus, RuleViolation("preferred", [category], bonus)
+
+        # If mandatory is defined and category matches, give bonus
+        if prepared.mandatory:
+            bonus = mfp_policy.mandatory_matched_bonus
+            return bonus, RuleViolation("mandatory", [category], bonus)
+
+        return 0.0, None
+
+    def get_prepared_rules(self, rules: dict[str, Any]) -> _PreparedRules:
+        """Return the lowercased M/F/P values of a rules dict, prepared once per dict."""
+        return self._cached_policy("rules", rules, None, lambda: self._prepare_rules(rules))
+
+    @staticmethod
+    def _prepare_rules(rules: dict[str, Any]) -> _PreparedRules:
+        """Lowercase rule values once so check_rules can match them with set lookups."""
+        forbidden = _lowered(rules.get("forbidden_values"))
+        mandatory = _lowered(rules.get("mandatory_values"))
+        preferred = _lowered(rules.get("preferred_values"))
+        return _PreparedRules(
+            forbidden=forbidden,
+            forbidden_set=frozenset(lower for _, lower in forbidden),
+            mandatory=mandatory,
+            mandatory_set=frozenset(lower for _, lower in mandatory),
+            preferred=preferred,
+            preferred_set=frozenset(lower for _, lower in preferred),
+            empty=not (forbidden or mandatory or preferred),
+        )
+
     def evaluate(
         self,
         content: dict[str, Any],
@@ -224,9 +397,8 @@ class BaseCriterion(ABC):
     ) -> CriterionResult:
         """Evaluate criterion and return detailed result."""
         score = self.calculate(content, content_meta, profile, block, context)
-        weight = self.get_weight(profile)
-        multiplier = self.get_multiplier(profile, block)
-        clamped_score = max(0.0, min(100.0, score))
+        weight, multiplier, _ = self.get_scoring_params(profile, block)
+        clamped_score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
         weighted_score = clamped_score * weight / 100.0
         return CriterionResult(
             name=self.name,
@@ -193,9 +193,7 @@ class AgeCriterion(BaseCriterion):
     ) -> CriterionResult:
         """Evaluate criterion with optional rules check."""
         score = self.calculate(content, content_meta, profile, block, context)
-        weight = self.get_weight(profile)
-        multiplier = self.get_multiplier(profile, block)
-        mfp_policy = self.get_mfp_policy(profile, block)
+        weight, multiplier, mfp_policy = self.get_scoring_params(profile, block)
 
         rule_violation = None
 
@@ -250,7 +248,7 @@ class AgeCriterion(BaseCriterion):
                 adjustment, rule_violation = self.check_rules(content_values, age_rules, mfp_policy)
                 score += adjustment
 
-        score = max(0.0, min(100.0, score))
+        score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
         weighted_score = score * weight / 100.0
         return CriterionResult(
             name=self.name,
@@ -1,5 +1,8 @@
 """BonusCriterion - Contextual bonuses scoring with M/F/P support."""
 
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -10,9 +13,86 @@ from app.core.scoring.base_criterion import (
     MFPPolicyConfig,
     RuleViolation,
     ScoringContext,
+    lowered_meta_values,
 )
 
 
+@dataclass(slots=True)
+class _BonusRules:
+    """Lowercased bonus_rules values, prepared once per rules dict."""
+
+    forbidden: frozenset[str]
+    preferred: tuple[str, ...]  # In rule order, for reporting
+    preferred_set: frozenset[str]
+    mandatory: tuple[str, ...]  # In rule order, for reporting
+    # Per CATEGORY_* group: its forbidden categories in group order (empty if none)
+    forbidden_in_group: dict[tuple[str, ...], tuple[str, ...]]
+    # CATEGORY_* groups with at least one preferred category
+    preferred_groups: frozenset[tuple[str, ...]]
+
+
+def _compile_any(values: list[str]) -> re.Pattern[str] | None:
+    """Compile lowercased values into one regex matching any of them as a substring."""
+    if not values:
+        return None
+    return re.compile("|".join(re.escape(v.lower()) for v in values))
+
+
+def _matches_either_way(
+    pattern: re.Pattern[str] | None, joined: str, values: tuple[str, ...]
+) -> bool:
+    """
+    True if a pattern value is in one of the values, or one of the values is in a pattern value.
+
+    joined holds the lowercased pattern values separated by NUL characters.
+    """
+    if pattern is None:
+        return False
+    return any(pattern.search(v) or v in joined for v in values)
+
+
+HOLIDAY_KEYWORDS_RE = _compile_any(
+    ["christmas", "holiday", "thanksgiving", "halloween", "noel", "noël"]
+)
+
+# Release age buckets (bisect_left): <= 2 years, <= 5 years, <= 20 years, older
+AGE_BUCKET_BOUNDS = (2, 5, 20)
+RECENT_LABELS = ("Sortie récente", "Assez récent")
+RECENT_BASE_BONUS = (0.5, 0.25)  # Share of preferred_matched_bonus per recent bucket
+
+# Box office buckets by revenue over budget: not profitable, > 1x, > 2x, > 3x
+ROI_LABELS = ("", "Rentable", "Succès commercial (2x+ ROI)", "Blockbuster (3x+ ROI)")
+ROI_BASE_BONUS = (0.0, 0.15, 0.25, 0.4)  # Share of preferred_matched_bonus per bucket
+
+
+@dataclass(slots=True)
+class _ProfileBonusConfig:
+    """Profile bonus settings read once, with keyword lists compiled into regexes."""
+
+    holiday_enabled: bool
+    keyword_scans: bool  # Any of the holiday, keyword safety or educational bonuses enabled
+    # enhanced_criteria.keywords_safety
+    safety_enabled: bool
+    safe: re.Pattern[str] | None
+    safe_bonus: float
+    dangerous: re.Pattern[str] | None
+    dangerous_penalty: float
+    # enhanced_criteria.collections_franchises
+    collections_enabled: bool
+    collections: re.Pattern[str] | None
+    collections_joined: str
+    collection_bonus: float
+    # enhanced_criteria.cast_crew
+    cast_enabled: bool
+    actors: re.Pattern[str] | None
+    actors_joined: str
+    actor_bonus: float
+    # enhanced_criteria.educational_value
+    educational_enabled: bool
+    educational: re.Pattern[str] | None
+    educational_bonus: float
+
+
 class BonusCriterion(BaseCriterion):
     """Score based on contextual bonuses with configurable M/F/P policy."""
 
@@ -20,13 +100,21 @@ class BonusCriterion(BaseCriterion):
     weight_key = "bonus"
     default_weight = 20.0
 
-    # Bonus category definitions (for M/F/P matching)
-    CATEGORY_RECENT = ["recent", "recency"]
-    CATEGORY_OLD = ["old", "classic", "vintage", "retro", "ancient"]
-    CATEGORY_BLOCKBUSTER = ["blockbuster", "commercial", "success"]
-    CATEGORY_COLLECTION = ["collection", "franchise"]
-    CATEGORY_POPULAR = ["popular", "trending"]
-    CATEGORY_HOLIDAY = ["holiday", "seasonal", "christmas", "halloween"]
+    # Bonus category definitions (for M/F/P matching), lowercase and in reporting order
+    CATEGORY_RECENT = ("recent", "recency")
+    CATEGORY_OLD = ("old", "classic", "vintage", "retro", "ancient")
+    CATEGORY_BLOCKBUSTER = ("blockbuster", "commercial", "success")
+    CATEGORY_COLLECTION = ("collection", "franchise")
+    CATEGORY_POPULAR = ("popular", "trending")
+    CATEGORY_HOLIDAY = ("holiday", "seasonal", "christmas", "halloween")
+    CATEGORY_GROUPS = (
+        CATEGORY_RECENT,
+        CATEGORY_OLD,
+        CATEGORY_BLOCKBUSTER,
+        CATEGORY_COLLECTION,
+        CATEGORY_POPULAR,
+        CATEGORY_HOLIDAY,
+    )
 
     def calculate(
         self,
@@ -39,7 +127,7 @@ class BonusCriterion(BaseCriterion):
         """Calculate contextual bonus score."""
         mfp_policy = self.get_mfp_policy(profile, block)
         score, _, _, _ = self._calculate_with_bonuses(
-            content, content_meta, profile, block, context, mfp_policy
+            content, content_meta, profile, block, context, mfp_policy, describe=False
         )
         return score
 
@@ -75,14 +163,20 @@ class BonusCriterion(BaseCriterion):
         block: dict[str, Any] | None = None,
         context: ScoringContext | None = None,
         mfp_policy: MFPPolicyConfig | None = None,
+        describe: bool = True,
     ) -> tuple[float, list[str], list[str], RuleViolation | None]:
         """
         Calculate contextual bonus score with applied bonus tracking using M/F/P policy.
 
+        When describe is False the human-readable bonuses_applied list is left empty,
+        skipping the string formatting for callers that only need the score.
+
         Returns:
             Tuple of (score, bonuses_applied, bonus_categories_earned, rule_violation)
         """
         policy = mfp_policy or DEFAULT_MFP_POLICY
+        # Base bonuses are shares of preferred_matched_bonus (see _get_scaled_bonus)
+        base_bonus = policy.preferred_matched_bonus
         score = 50.0  # Base score (neutral)
         bonuses_applied: list[str] = []
         bonus_categories_earned: list[str] = []
@@ -95,15 +189,17 @@ class BonusCriterion(BaseCriterion):
         if block:
             bonus_rules = block.get("criteria", {}).get("bonus_rules")
 
-        forbidden_categories = (
-            [v.lower() for v in (bonus_rules.get("forbidden_values") or [])] if bonus_rules else []
-        )
-        preferred_categories = (
-            [v.lower() for v in (bonus_rules.get("preferred_values") or [])] if bonus_rules else []
-        )
-        mandatory_categories = (
-            [v.lower() for v in (bonus_rules.get("mandatory_values") or [])] if bonus_rules else []
+        rules = (
+            self._cached_policy(
+                "bonus_rules", bonus_rules, None, lambda: self._prepare_bonus_rules(bonus_rules)
+            )
+            if bonus_rules
+            else _NO_BONUS_RULES
         )
+        forbidden_in_group = rules.forbidden_in_group
+        preferred_groups = rules.preferred_groups
+        preferred_categories = rules.preferred_set
+        mandatory_categories = rules.mandatory
 
         # Get penalties/bonuses from rules or MFP policy
         forbidden_penalty = (
@@ -117,71 +213,53 @@ class BonusCriterion(BaseCriterion):
             else policy.preferred_matched_bonus
         )
 
-        # Helper to check category match
-        def is_forbidden(categories: list[str]) -> bool:
-            return any(c in forbidden_categories for c in categories)
-
-        def is_preferred(categories: list[str]) -> bool:
-            return any(c in preferred_categories for c in categories)
-
-        def is_mandatory(categories: list[str]) -> bool:
-            return any(c in mandatory_categories for c in categories)
-
-        # Track forbidden categories detected for final violation reporting
-        forbidden_detected: list[str] = []
+        # Forbidden categories detected for final violation reporting. Only the release-year
+        # section detects any, and its recent/old branches are exclusive, so this is set at
+        # most once to one of the precomputed per-group tuples
+        forbidden_detected: tuple[str, ...] = ()
 
-        current_year = datetime.now().year
+        # Callers scoring many items fill the calendar fields once in the context
+        current_year = (
+            context.current_year if context and context.current_year else datetime.now().year
+        )
 
         # ========== RELEASE YEAR BONUS ==========
         # Categories: "recent", "recency" for new / "old", "classic", "vintage" for old
         content_year = content.get("year")
         if content_year:
-            age = current_year - content_year
-            recent_forbidden = is_forbidden(self.CATEGORY_RECENT)
-            recent_preferred = is_preferred(self.CATEGORY_RECENT)
-            old_forbidden = is_forbidden(self.CATEGORY_OLD)
-            old_preferred = is_preferred(self.CATEGORY_OLD)
-
-            if age <= 2:
+            age_bucket = bisect_left(AGE_BUCKET_BOUNDS, current_year - content_year)
+            recent_forbidden = forbidden_in_group[self.CATEGORY_RECENT]
+            recent_preferred = self.CATEGORY_RECENT in preferred_groups
+            old_forbidden = forbidden_in_group[self.CATEGORY_OLD]
+            old_preferred = self.CATEGORY_OLD in preferred_groups
+
+            if age_bucket <= 1:
+                # Very recent (<= 2 years) or fairly recent (<= 5 years) release
                 if recent_forbidden:
                     # Recent content is forbidden - mark for penalty
-                    forbidden_detected.extend(
-                        [c for c in self.CATEGORY_RECENT if c in forbidden_categories]
-                    )
+                    forbidden_detected = recent_forbidden
                 else:
-                    # Very recent release: apply preferred_bonus if preferred, otherwise base bonus
+                    # Full preferred_bonus if preferred, otherwise the bucket's base bonus
                     if recent_preferred:
                         bonus = preferred_bonus
                     else:
-                        bonus = self._get_scaled_bonus(0.5, policy)  # Base bonus for recent
+                        bonus = base_bonus * RECENT_BASE_BONUS[age_bucket]
                     score += bonus
-                    bonuses_applied.append(f"Sortie récente ({content_year}): +{bonus:.0f}")
+                    if describe:
+                        label = RECENT_LABELS[age_bucket]
+                        bonuses_applied.append(f"{label} ({content_year}): +{bonus:.0f}")
                     bonus_categories_earned.extend(self.CATEGORY_RECENT)
-            elif age <= 5:
-                if recent_forbidden:
-                    forbidden_detected.extend(
-                        [c for c in self.CATEGORY_RECENT if c in forbidden_categories]
-                    )
-                else:
-                    # Fairly recent: apply full preferred_bonus if preferred, otherwise smaller base bonus
-                    if recent_preferred:
-                        bonus = preferred_bonus  # Full bonus when preferred
-                    else:
-                        bonus = self._get_scaled_bonus(0.25, policy)  # Smaller base bonus
-                    score += bonus
-                    bonuses_applied.append(f"Assez récent ({content_year}): +{bonus:.0f}")
-                    bonus_categories_earned.extend(self.CATEGORY_RECENT)
-            elif age > 20:
+            elif age_bucket == 3:
+                # Older than 20 years
                 if old_forbidden:
                     # Old content is forbidden - mark for penalty
-                    forbidden_detected.extend(
-                        [c for c in self.CATEGORY_OLD if c in forbidden_categories]
-                    )
+                    forbidden_detected = old_forbidden
                 elif old_preferred:
                     # Old content is preferred - apply full preferred_bonus
                     bonus = preferred_bonus
                     score += bonus
-                    bonuses_applied.append(f"Classique ({content_year}): +{bonus:.0f}")
+                    if describe:
+                        bonuses_applied.append(f"Classique ({content_year}): +{bonus:.0f}")
                     bonus_categories_earned.extend(self.CATEGORY_OLD)
                 # If neither preferred nor forbidden: neutral (no adjustment)
 
@@ -189,43 +267,28 @@ class BonusCriterion(BaseCriterion):
         # Category: "blockbuster"
         revenue = content_meta.get("revenue") or 0
         budget = content_meta.get("budget") or 0
-        blockbuster_forbidden = is_forbidden(self.CATEGORY_BLOCKBUSTER)
-        blockbuster_preferred = is_preferred(self.CATEGORY_BLOCKBUSTER)
-
-        if budget and revenue and not blockbuster_forbidden:
-            if revenue > budget * 3:
-                # Mega blockbuster: full preferred_bonus if preferred, otherwise base
-                if blockbuster_preferred:
-                    bonus = preferred_bonus
-                else:
-                    bonus = self._get_scaled_bonus(0.4, policy)  # Base bonus
-                score += bonus
-                bonuses_applied.append(f"Blockbuster (3x+ ROI): +{bonus:.0f}")
-                bonus_categories_earned.extend(self.CATEGORY_BLOCKBUSTER)
-            elif revenue > budget * 2:
-                # Big success: full preferred_bonus if preferred
+        blockbuster_forbidden = forbidden_in_group[self.CATEGORY_BLOCKBUSTER]
+        blockbuster_preferred = self.CATEGORY_BLOCKBUSTER in preferred_groups
+
+        if budget > 0 and revenue and not blockbuster_forbidden:
+            # 0: not profitable, 1: profitable, 2: 2x+ ROI, 3: 3x+ ROI
+            roi_bucket = bisect_left((budget, budget * 2, budget * 3), revenue)
+            if roi_bucket:
+                # Full preferred_bonus if preferred, otherwise the bucket's base bonus
                 if blockbuster_preferred:
                     bonus = preferred_bonus
                 else:
-                    bonus = self._get_scaled_bonus(0.25, policy)
+                    bonus = base_bonus * ROI_BASE_BONUS[roi_bucket]
                 score += bonus
-                bonuses_applied.append(f"Succès commercial (2x+ ROI): +{bonus:.0f}")
-                bonus_categories_earned.extend(self.CATEGORY_BLOCKBUSTER)
-            elif revenue > budget:
-                # Profitable: full preferred_bonus if preferred (still profitable)
-                if blockbuster_preferred:
-                    bonus = preferred_bonus
-                else:
-                    bonus = self._get_scaled_bonus(0.15, policy)
-                score += bonus
-                bonuses_applied.append(f"Rentable: +{bonus:.0f}")
+                if describe:
+                    bonuses_applied.append(f"{ROI_LABELS[roi_bucket]}: +{bonus:.0f}")
                 bonus_categories_earned.extend(self.CATEGORY_BLOCKBUSTER)
 
         # ========== COLLECTION MEMBERSHIP BONUS ==========
         # Categories: "collection", "franchise"
         collections = content_meta.get("collections") or []
-        collection_forbidden = is_forbidden(self.CATEGORY_COLLECTION)
-        collection_preferred = is_preferred(self.CATEGORY_COLLECTION)
+        collection_forbidden = forbidden_in_group[self.CATEGORY_COLLECTION]
+        collection_preferred = self.CATEGORY_COLLECTION in preferred_groups
 
         if collections and not collection_forbidden:
             if collection_preferred:
@@ -234,19 +297,20 @@ class BonusCriterion(BaseCriterion):
             else:
                 # Base bonus: scaled by number of collections
                 bonus = min(
-                    self._get_scaled_bonus(0.3, policy),
-                    len(collections) * self._get_scaled_bonus(0.15, policy),
+                    base_bonus * 0.3,
+                    len(collections) * (base_bonus * 0.15),
                 )
             score += bonus
-            coll_names = ", ".join(collections[:2])
-            bonuses_applied.append(f"Collection ({coll_names}): +{bonus:.0f}")
+            if describe:
+                coll_names = ", ".join(collections[:2])
+                bonuses_applied.append(f"Collection ({coll_names}): +{bonus:.0f}")
             bonus_categories_earned.extend(self.CATEGORY_COLLECTION)
 
         # ========== POPULARITY BONUS ==========
         # Category: "popular"
         vote_count = content_meta.get("vote_count") or 0
-        popular_forbidden = is_forbidden(self.CATEGORY_POPULAR)
-        popular_preferred = is_preferred(self.CATEGORY_POPULAR)
+        popular_forbidden = forbidden_in_group[self.CATEGORY_POPULAR]
+        popular_preferred = self.CATEGORY_POPULAR in preferred_groups
 
         if not popular_forbidden:
             if vote_count > 10000:
@@ -254,120 +318,121 @@ class BonusCriterion(BaseCriterion):
                 if popular_preferred:
                     bonus = preferred_bonus
                 else:
-                    bonus = self._get_scaled_bonus(0.3, policy)  # Base bonus
+                    bonus = base_bonus * 0.3  # Base bonus
                 score += bonus
-                bonuses_applied.append(f"Très populaire ({vote_count} votes): +{bonus:.0f}")
+                if describe:
+                    bonuses_applied.append(f"Très populaire ({vote_count} votes): +{bonus:.0f}")
                 bonus_categories_earned.extend(self.CATEGORY_POPULAR)
             elif vote_count > 5000:
                 # Popular: full preferred_bonus if preferred
                 if popular_preferred:
                     bonus = preferred_bonus
                 else:
-                    bonus = self._get_scaled_bonus(0.15, policy)
+                    bonus = base_bonus * 0.15
                 score += bonus
-                bonuses_applied.append(f"Populaire ({vote_count} votes): +{bonus:.0f}")
+                if describe:
+                    bonuses_applied.append(f"Populaire ({vote_count} votes): +{bonus:.0f}")
                 bonus_categories_earned.extend(self.CATEGORY_POPULAR)
 
         # ========== SEASONAL/HOLIDAY BONUS ==========
         # Categories: "holiday", "seasonal"
-        bonuses_config = profile.get("strategies", {}).get("bonuses", {})
-        holiday_forbidden = is_forbidden(self.CATEGORY_HOLIDAY)
-        holiday_preferred = is_preferred(self.CATEGORY_HOLIDAY)
-
-        if bonuses_config.get("holiday_bonus", False) and not holiday_forbidden:
-            content_keywords = [k.lower() for k in content_meta.get("keywords", [])]
-            holiday_keywords = ["christmas", "holiday", "thanksgiving", "halloween", "noel", "noël"]
-
-            if any(k in kw for kw in content_keywords for k in holiday_keywords):
-                current_month = datetime.now().month
+        config = self._cached_policy(
+            "profile_bonus_config", profile, None, lambda: self._compile_profile(profile)
+        )
+        holiday_forbidden = forbidden_in_group[self.CATEGORY_HOLIDAY]
+        holiday_preferred = self.CATEGORY_HOLIDAY in preferred_groups
+
+        # Content keywords joined once so each keyword regex scans all of them in a
+        # single search; the patterns contain no NUL, so a match never spans two keywords
+        keywords_text = None
+        if config.keyword_scans:
+            content_keywords = lowered_meta_values(content_meta, "keywords")
+            if content_keywords:
+                keywords_text = "\0".join(content_keywords)
+
+        if config.holiday_enabled and not holiday_forbidden:
+            if keywords_text is not None and HOLIDAY_KEYWORDS_RE.search(keywords_text):
+                current_month = (
+                    context.current_month
+                    if context and context.current_month
+                    else datetime.now().month
+                )
                 if current_month in [10, 11, 12]:
                     if holiday_preferred:
                         bonus = preferred_bonus
                     else:
-                        bonus = self._get_scaled_bonus(0.4, policy)  # Base holiday bonus
+                        bonus = base_bonus * 0.4  # Base holiday bonus
                     score += bonus
-                    bonuses_applied.append(f"Contenu de saison: +{bonus:.0f}")
+                    if describe:
+                        bonuses_applied.append(f"Contenu de saison: +{bonus:.0f}")
                     bonus_categories_earned.extend(self.CATEGORY_HOLIDAY)
 
         # ========== ENHANCED CRITERIA BONUSES ==========
-        enhanced = profile.get("enhanced_criteria", {})
-
         # Keywords safety bonus (uses profile config, not MFP)
-        keywords_safety = enhanced.get("keywords_safety", {})
-        if keywords_safety.get("enabled", False):
-            content_keywords = [k.lower() for k in content_meta.get("keywords", [])]
-            safe_keywords = [k.lower() for k in keywords_safety.get("safe_keywords", [])]
-            dangerous_keywords = [k.lower() for k in keywords_safety.get("dangerous_keywords", [])]
-
-            for kw in content_keywords:
-                if any(safe in kw for safe in safe_keywords):
-                    bonus = keywords_safety.get("safe_bonus_points", 5)
-                    score += bonus
+        if config.safety_enabled and keywords_text is not None:
+            safe_re = config.safe
+            if safe_re is not None and safe_re.search(keywords_text):
+                bonus = config.safe_bonus
+                score += bonus
+                if describe:
                     bonuses_applied.append(f"Mot-clé sûr: +{bonus}")
-                    break
 
-            for kw in content_keywords:
-                if any(danger in kw for danger in dangerous_keywords):
-                    penalty = keywords_safety.get("dangerous_penalty_points", -100)
-                    score += penalty
+            dangerous_re = config.dangerous
+            if dangerous_re is not None and dangerous_re.search(keywords_text):
+                penalty = config.dangerous_penalty
+                score += penalty
+                if describe:
                     bonuses_applied.append(f"Mot-clé dangereux: {penalty}")
-                    break
 
         # Collections/Franchises bonus (enhanced - uses profile config)
-        collections_config = enhanced.get("collections_franchises", {})
-        if collections_config.get("enabled", False):
-            content_collections = [c.lower() for c in (content_meta.get("collections") or [])]
-            preferred_collections = [
-                c.lower() for c in collections_config.get("preferred_collections", [])
-            ]
-
-            for coll in content_collections:
-                if any(pref in coll or coll in pref for pref in preferred_collections):
-                    bonus = collections_config.get("collection_bonus_points", 10)
-                    score += bonus
+        if config.collections_enabled:
+            content_collections = lowered_meta_values(content_meta, "collections")
+            if _matches_either_way(
+                config.collections, config.collections_joined, content_collections
+            ):
+                bonus = config.collection_bonus
+                score += bonus
+                if describe:
                     bonuses_applied.append(f"Collection préférée: +{bonus}")
-                    break
 
         # Cast/Crew bonus (uses profile config)
-        cast_config = enhanced.get("cast_crew", {})
-        if cast_config.get("enabled", False):
-            content_cast = [c.lower() for c in content_meta.get("cast", [])]
-            preferred_actors = [a.lower() for a in cast_config.get("preferred_actors", [])]
-
-            for actor in content_cast[:5]:
-                if any(pref in actor or actor in pref for pref in preferred_actors):
-                    bonus = cast_config.get("popular_actor_bonus", 3)
-                    score += bonus
+        if config.cast_enabled:
+            content_cast = lowered_meta_values(content_meta, "cast")
+            if _matches_either_way(config.actors, config.actors_joined, content_cast[:5]):
+                bonus = config.actor_bonus
+                score += bonus
+                if describe:
                     bonuses_applied.append(f"Acteur préféré: +{bonus}")
-                    break
 
         # Educational value bonus (uses profile config)
-        edu_config = enhanced.get("educational_value", {})
-        if edu_config.get("enabled", False):
-            content_keywords = [k.lower() for k in content_meta.get("keywords", [])]
-            edu_keywords = [k.lower() for k in edu_config.get("educational_keywords", [])]
+        if config.educational_enabled and keywords_text is not None:
+            edu_re = config.educational
 
-            if any(edu in kw for kw in content_keywords for edu in edu_keywords):
-                bonus = edu_config.get("bonus_points", 5)
+            if edu_re is not None and edu_re.search(keywords_text):
+                bonus = config.educational_bonus
                 score += bonus
-                bonuses_applied.append(f"Contenu éducatif: +{bonus}")
+                if describe:
+                    bonuses_applied.append(f"Contenu éducatif: +{bonus}")
 
         # ========== M/F/P RULE CHECKING ==========
         rule_violation = None
 
         # Check forbidden categories (highest priority)
-        # Use forbidden_detected list built during category evaluation
+        # Use forbidden_detected built during category evaluation
         if forbidden_detected:
             score += forbidden_penalty
-            bonuses_applied.append(
-                f"Catégorie interdite ({', '.join(forbidden_detected)}): {forbidden_penalty:.0f}"
-            )
-            rule_violation = RuleViolation("forbidden", forbidden_detected, forbidden_penalty)
+            if describe:
+                bonuses_applied.append(
+                    f"Catégorie interdite ({', '.join(forbidden_detected)}): {forbidden_penalty:.0f}"
+                )
+            rule_violation = RuleViolation("forbidden", list(forbidden_detected), forbidden_penalty)
+
+        # CATEGORY_* values are already lowercase; the list keeps earning order for reporting
+        earned = set(bonus_categories_earned)
 
         # Check mandatory categories (if no forbidden violation)
         if not rule_violation and mandatory_categories:
-            earned_lower = [c.lower() for c in bonus_categories_earned]
-            missing_mandatory = [m for m in mandatory_categories if m not in earned_lower]
+            missing_mandatory = [m for m in mandatory_categories if m not in earned]
             if missing_mandatory:
                 penalty = (
                     bonus_rules.get("mandatory_penalty", policy.mandatory_missed_penalty)
@@ -375,15 +440,15 @@ class BonusCriterion(BaseCriterion):
                     else policy.mandatory_missed_penalty
                 )
                 score += penalty
-                bonuses_applied.append(
-                    f"Bonus requis manquant ({', '.join(missing_mandatory)}): {penalty:.0f}"
-                )
+                if describe:
+                    bonuses_applied.append(
+                        f"Bonus requis manquant ({', '.join(missing_mandatory)}): {penalty:.0f}"
+                    )
                 rule_violation = RuleViolation("mandatory", missing_mandatory, penalty)
 
         # Check preferred categories match (for reporting, bonus already applied above)
         if not rule_violation and preferred_categories:
-            earned_lower = [c.lower() for c in bonus_categories_earned]
-            matched_preferred = [p for p in preferred_categories if p in earned_lower]
+            matched_preferred = [p for p in rules.preferred if p in earned]
             if matched_preferred:
                 bonus = (
                     bonus_rules.get("preferred_bonus", policy.preferred_matched_bonus)
@@ -394,6 +459,60 @@ class BonusCriterion(BaseCriterion):
 
         return max(0.0, min(100.0, score)), bonuses_applied, bonus_categories_earned, rule_violation
 
+    @classmethod
+    def _prepare_bonus_rules(cls, bonus_rules: dict[str, Any]) -> _BonusRules:
+        """Lowercase the bonus_rules category values and resolve each category group once."""
+        forbidden = frozenset(v.lower() for v in (bonus_rules.get("forbidden_values") or []))
+        preferred = tuple(v.lower() for v in (bonus_rules.get("preferred_values") or []))
+        preferred_set = frozenset(preferred)
+        return _BonusRules(
+            forbidden=forbidden,
+            preferred=preferred,
+            preferred_set=preferred_set,
+            mandatory=tuple(v.lower() for v in (bonus_rules.get("mandatory_values") or [])),
+            forbidden_in_group={
+                group: tuple(c for c in group if c in forbidden) for group in cls.CATEGORY_GROUPS
+            },
+            preferred_groups=frozenset(
+                group for group in cls.CATEGORY_GROUPS if not preferred_set.isdisjoint(group)
+            ),
+        )
+
+    @staticmethod
+    def _compile_profile(profile: dict[str, Any]) -> _ProfileBonusConfig:
+        """Read the profile bonus settings and compile its keyword lists once."""
+        bonuses_config = profile.get("strategies", {}).get("bonuses", {})
+        enhanced = profile.get("enhanced_criteria", {})
+        keywords_safety = enhanced.get("keywords_safety", {})
+        collections_config = enhanced.get("collections_franchises", {})
+        collections = collections_config.get("preferred_collections", [])
+        cast_config = enhanced.get("cast_crew", {})
+        actors = cast_config.get("preferred_actors", [])
+        edu_config = enhanced.get("educational_value", {})
+        holiday_enabled = bool(bonuses_config.get("holiday_bonus", False))
+        safety_enabled = bool(keywords_safety.get("enabled", False))
+        educational_enabled = bool(edu_config.get("enabled", False))
+        return _ProfileBonusConfig(
+            holiday_enabled=holiday_enabled,
+            keyword_scans=holiday_enabled or safety_enabled or educational_enabled,
+            safety_enabled=safety_enabled,
+            safe=_compile_any(keywords_safety.get("safe_keywords", [])),
+            safe_bonus=keywords_safety.get("safe_bonus_points", 5),
+            dangerous=_compile_any(keywords_safety.get("dangerous_keywords", [])),
+            dangerous_penalty=keywords_safety.get("dangerous_penalty_points", -100),
+            collections_enabled=bool(collections_config.get("enabled", False)),
+            collections=_compile_any(collections),
+            collections_joined="\0".join(c.lower() for c in collections),
+            collection_bonus=collections_config.get("collection_bonus_points", 10),
+            cast_enabled=bool(cast_config.get("enabled", False)),
+            actors=_compile_any(actors),
+            actors_joined="\0".join(a.lower() for a in actors),
+            actor_bonus=cast_config.get("popular_actor_bonus", 3),
+            educational_enabled=educational_enabled,
+            educational=_compile_any(edu_config.get("educational_keywords", [])),
+            educational_bonus=edu_config.get("bonus_points", 5),
+        )
+
     def evaluate(
         self,
         content: dict[str, Any],
@@ -403,12 +522,10 @@ class BonusCriterion(BaseCriterion):
         context: ScoringContext | None = None,
     ) -> CriterionResult:
         """Evaluate criterion and return detailed result with bonuses."""
-        mfp_policy = self.get_mfp_policy(profile, block)
+        weight, multiplier, mfp_policy = self.get_scoring_params(profile, block)
         score, bonuses, bonus_categories_earned, rule_violation = self._calculate_with_bonuses(
             content, content_meta, profile, block, context, mfp_policy
         )
-        weight = self.get_weight(profile)
-        multiplier = self.get_multiplier(profile, block)
         weighted_score = score * weight / 100.0
 
         return CriterionResult(
@@ -429,3 +546,7 @@ class BonusCriterion(BaseCriterion):
             },
             rule_violation=rule_violation,
         )
+
+
+# Shared prepared rules for blocks without bonus_rules
+_NO_BONUS_RULES = BonusCriterion._prepare_bonus_rules({})
@@ -5,7 +5,6 @@ from typing import Any
 from app.core.scoring.base_criterion import (
     BaseCriterion,
     CriterionResult,
-    RuleViolation,
     ScoringContext,
 )
 
@@ -80,9 +79,7 @@ class DurationCriterion(BaseCriterion):
     ) -> CriterionResult:
         """Evaluate criterion with optional rules check."""
         score = self.calculate(content, content_meta, profile, block, context)
-        weight = self.get_weight(profile)
-        multiplier = self.get_multiplier(profile, block)
-        mfp_policy = self.get_mfp_policy(profile, block)
+        weight, multiplier, mfp_policy = self.get_scoring_params(profile, block)
 
         # Check for per-criterion rules
         # For duration, rules use categories: "short", "medium", "standard", "long", "epic", "very_long"
@@ -110,39 +107,12 @@ class DurationCriterion(BaseCriterion):
                     duration_category = "very_long"
 
                 if duration_category:
-                    # Custom M/F/P logic for duration (single category vs list of allowed/forbidden)
-                    forbidden = [v.lower() for v in (duration_rules.get("forbidden_values") or [])]
-                    mandatory = [v.lower() for v in (duration_rules.get("mandatory_values") or [])]
-                    preferred = [v.lower() for v in (duration_rules.get("preferred_values") or [])]
-
-                    # Check forbidden first (highest priority)
-                    if duration_category.lower() in forbidden:
-                        penalty = duration_rules.get(
-                            "forbidden_penalty", mfp_policy.forbidden_detected_penalty
-                        )
-                        rule_violation = RuleViolation("forbidden", [duration_category], penalty)
-                        score += penalty
-                    # Check mandatory (content category must be IN the mandatory list)
-                    elif mandatory and duration_category.lower() not in mandatory:
-                        penalty = duration_rules.get(
-                            "mandatory_penalty", mfp_policy.mandatory_missed_penalty
-                        )
-                        rule_violation = RuleViolation("mandatory", mandatory, penalty)
-                        score += penalty
-                    # Check preferred (bonus if in preferred list)
-                    elif duration_category.lower() in preferred:
-                        bonus = duration_rules.get(
-                            "preferred_bonus", mfp_policy.preferred_matched_bonus
-                        )
-                        rule_violation = RuleViolation("preferred", [duration_category], bonus)
-                        score += bonus
-                    # If mandatory is defined and category matches, give bonus
-                    elif mandatory and duration_category.lower() in mandatory:
-                        bonus = mfp_policy.mandatory_matched_bonus
-                        rule_violation = RuleViolation("mandatory", [duration_category], bonus)
-                        score += bonus
-
-        score = max(0.0, min(100.0, score))
+                    adjustment, rule_violation = self.check_category_rules(
+                        duration_category, duration_rules, mfp_policy
+                    )
+                    score += adjustment
+
+        score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
         weighted_score = score * weight / 100.0
         return CriterionResult(
             name=self.name,
@@ -8,6 +8,7 @@ from app.core.scoring.base_criterion import (
     MFPPolicyConfig,
     RuleViolation,
     ScoringContext,
+    lowered_meta_values,
 )
 
 
@@ -40,8 +41,8 @@ class FilterCriterion(BaseCriterion):
         preferred_bonus = mfp_policy.preferred_matched_bonus if mfp_policy else 20.0
         forbidden_penalty = mfp_policy.forbidden_detected_penalty if mfp_policy else -400.0
 
-        content_keywords = {k.lower() for k in content_meta.get("keywords", [])}
-        content_studios = {s.lower() for s in content_meta.get("studios", [])}
+        content_keywords = set(lowered_meta_values(content_meta, "keywords"))
+        content_studios = set(lowered_meta_values(content_meta, "studios"))
         content_title = content.get("title", "").lower()
 
         # Get filters from block or profile
@@ -162,16 +163,14 @@ class FilterCriterion(BaseCriterion):
         context: ScoringContext | None = None,
     ) -> CriterionResult:
         """Evaluate criterion with MFP policy applied."""
-        weight = self.get_weight(profile)
-        multiplier = self.get_multiplier(profile, block)
-        mfp_policy = self.get_mfp_policy(profile, block)
+        weight, multiplier, mfp_policy = self.get_scoring_params(profile, block)
 
         # Calculate score with MFP policy and get rule violation
         score, rule_violation, matched_keywords = self._calculate_with_mfp(
             content, content_meta, profile, block, context, mfp_policy
         )
 
-        score = max(0.0, min(100.0, score))
+        score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
         weighted_score = score * weight / 100.0
         return CriterionResult(
             name=self.name,
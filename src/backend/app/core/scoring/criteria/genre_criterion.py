@@ -1,5 +1,6 @@
 """GenreCriterion - Genre preference matching with mandatory/forbidden support."""
 
+from dataclasses import dataclass
 from typing import Any
 
 from app.core.scoring.base_criterion import (
@@ -7,9 +8,24 @@ from app.core.scoring.base_criterion import (
     CriterionResult,
     RuleViolation,
     ScoringContext,
+    lowered_meta_values,
 )
 
 
+@dataclass(slots=True)
+class _GenreRules:
+    """Lowercased genre rule sets for one (profile, block) pair (shared, never mutated)."""
+
+    # Rule values plus legacy genre_criteria, used for scoring
+    mandatory: set[str]
+    forbidden: set[str]
+    preferred: set[str]
+    # Rule values only, used for the reported rule violation
+    report_mandatory: set[str]
+    report_forbidden: set[str]
+    report_preferred: set[str]
+
+
 class GenreCriterion(BaseCriterion):
     """Score based on genre matching with preferences and mandatory/forbidden rules."""
 
@@ -37,11 +53,65 @@ class GenreCriterion(BaseCriterion):
         if not content_meta:
             return 50.0  # Neutral if no metadata
 
-        content_genres = {g.lower() for g in content_meta.get("genres", [])}
+        return self._score_genres(
+            set(lowered_meta_values(content_meta, "genres")), self._get_rules(profile, block)
+        )
+
+    def _get_rules(self, profile: dict[str, Any], block: dict[str, Any] | None) -> _GenreRules:
+        """Return the genre rule sets for this (profile, block), parsed once per pair."""
+        return self._cached_policy(
+            "genre_rules", profile, block, lambda: self._build_genre_rules(profile, block)
+        )
+
+    @staticmethod
+    def _score_genres(content_genres: set[str], rules: _GenreRules) -> float:
+        """Score already-lowercased content genres against the genre rule sets."""
         if not content_genres:
             return 50.0  # Neutral if no genres
 
-        # Get genre criteria from block or profile
+        # 1. Check for FORBIDDEN genres first (CRITICAL VIOLATION - score = 0)
+        if not rules.forbidden.isdisjoint(content_genres):
+            return 0.0
+
+        score = 75.0  # Base score
+        mandatory = rules.mandatory
+        preferred = rules.preferred
+
+        # 2. Check MANDATORY genres (at least one must be present)
+        # This is the key fix: if mandatory genres are defined, at least one must match
+        mandatory_count = 0
+        if mandatory:
+            mandatory_count = len(content_genres & mandatory)
+            if not mandatory_count:
+                # No mandatory genre present - heavy penalty
+                # This makes the score very low (close to 0 but allows other criteria to have effect)
+                score = 10.0  # Very low base when mandatory not met
+            else:
+                # Has at least one mandatory genre - good!
+                score = 85.0  # Higher base score
+
+        # 3. Calculate bonus for preferred genres
+        if preferred:
+            preferred_count = len(content_genres & preferred)
+            if preferred_count:
+                # Bonus based on number of preferred matches
+                bonus = min(15.0, preferred_count * 5.0)
+                score += bonus
+
+        # 4. Extra bonus if content matches multiple mandatory genres
+        if mandatory_count > 1:
+            # Bonus for matching multiple mandatory
+            extra_bonus = min(10.0, (mandatory_count - 1) * 3.0)
+            score += extra_bonus
+
+        return max(0.0, min(100.0, score))
+
+    @staticmethod
+    def _build_genre_rules(
+        profile: dict[str, Any],
+        block: dict[str, Any] | None,
+    ) -> _GenreRules:
+        """Collect lowercased mandatory/forbidden/preferred genres from block or profile."""
         if block:
             block_criteria = block.get("criteria", {})
             genre_config = block_criteria.get("genre_criteria", {})
@@ -69,52 +139,15 @@ class GenreCriterion(BaseCriterion):
         forbidden_config = genre_config.get("forbidden_genres", {})
         preferred_config = genre_config.get("preferred_genres", {})
 
-        # Get genres from legacy configs
-        mandatory_genres_legacy = {g.lower() for g in mandatory_config.get("genres", [])}
-        forbidden_genres_legacy = {g.lower() for g in forbidden_config.get("genres", [])}
-        preferred_genres_legacy = {g.lower() for g in preferred_config.get("genres", [])}
-
         # Merge all mandatory sources (allowed_genres + legacy mandatory)
-        mandatory = allowed | mandatory_genres_legacy
-        forbidden = forbidden | forbidden_genres_legacy
-        preferred = preferred | preferred_genres_legacy
-
-        score = 75.0  # Base score
-
-        # 1. Check for FORBIDDEN genres first (CRITICAL VIOLATION - score = 0)
-        forbidden_matches = content_genres & forbidden
-        if forbidden_matches:
-            return 0.0
-
-        # 2. Check MANDATORY genres (at least one must be present)
-        # This is the key fix: if mandatory genres are defined, at least one must match
-        if mandatory:
-            has_any_mandatory = bool(content_genres & mandatory)
-            if not has_any_mandatory:
-                # No mandatory genre present - heavy penalty
-                # This makes the score very low (close to 0 but allows other criteria to have effect)
-                score = 10.0  # Very low base when mandatory not met
-            else:
-                # Has at least one mandatory genre - good!
-                score = 85.0  # Higher base score
-
-        # 3. Calculate bonus for preferred genres
-        if preferred:
-            preferred_matches = content_genres & preferred
-            if preferred_matches:
-                # Bonus based on number of preferred matches
-                bonus = min(15.0, len(preferred_matches) * 5.0)
-                score += bonus
-
-        # 4. Extra bonus if content matches multiple mandatory genres
-        if mandatory:
-            mandatory_matches = content_genres & mandatory
-            if len(mandatory_matches) > 1:
-                # Bonus for matching multiple mandatory
-                extra_bonus = min(10.0, (len(mandatory_matches) - 1) * 3.0)
-                score += extra_bonus
-
-        return max(0.0, min(100.0, score))
+        return _GenreRules(
+            mandatory=allowed | {g.lower() for g in mandatory_config.get("genres", [])},
+            forbidden=forbidden | {g.lower() for g in forbidden_config.get("genres", [])},
+            preferred=preferred | {g.lower() for g in preferred_config.get("genres", [])},
+            report_mandatory=allowed,
+            report_forbidden=forbidden,
+            report_preferred=preferred,
+        )
 
     def evaluate(
         self,
@@ -125,33 +158,22 @@ class GenreCriterion(BaseCriterion):
         context: ScoringContext | None = None,
     ) -> CriterionResult:
         """Evaluate criterion with genre-specific rules check."""
-        score = self.calculate(content, content_meta, profile, block, context)
-        weight = self.get_weight(profile)
-        multiplier = self.get_multiplier(profile, block)
-        mfp_policy = self.get_mfp_policy(profile, block)
+        # Lowercase the content genres once for both scoring and the rule check
+        content_genres = set(lowered_meta_values(content_meta, "genres")) if content_meta else None
+        rules = self._get_rules(profile, block)
+        if content_genres is None:
+            score = 50.0  # Neutral if no metadata
+        else:
+            score = self._score_genres(content_genres, rules)
+        weight, multiplier, mfp_policy = self.get_scoring_params(profile, block)
 
         # Check for rule violations (genre-specific logic: at least one mandatory must match)
         rule_violation = None
-        if content_meta:
-            content_genres = {g.lower() for g in content_meta.get("genres", [])}
-
-            # Collect all mandatory/forbidden/preferred genres from block or profile
-            if block:
-                block_criteria = block.get("criteria", {})
-                mandatory = {g.lower() for g in block_criteria.get("allowed_genres", [])}
-                forbidden = {g.lower() for g in block_criteria.get("forbidden_genres", [])}
-                preferred = {g.lower() for g in block_criteria.get("preferred_genres", [])}
-                # Add from genre_rules
-                genre_rules = block_criteria.get("genre_rules", {})
-                if genre_rules:
-                    mandatory |= {g.lower() for g in (genre_rules.get("mandatory_values") or [])}
-                    forbidden |= {g.lower() for g in (genre_rules.get("forbidden_values") or [])}
-                    preferred |= {g.lower() for g in (genre_rules.get("preferred_values") or [])}
-            else:
-                criteria = profile.get("mandatory_forbidden_criteria", {})
-                mandatory = {g.lower() for g in criteria.get("allowed_genres", [])}
-                forbidden = {g.lower() for g in criteria.get("forbidden_genres", [])}
-                preferred = {g.lower() for g in criteria.get("preferred_genres", [])}
+        if content_genres is not None:
+            # Mandatory/forbidden/preferred genres from block or profile
+            mandatory = rules.report_mandatory
+            forbidden = rules.report_forbidden
+            preferred = rules.report_preferred
 
             # 1. Check for FORBIDDEN violation (highest priority)
             forbidden_matches = content_genres & forbidden
@@ -192,7 +214,7 @@ class GenreCriterion(BaseCriterion):
                         penalty_or_bonus=mfp_policy.preferred_matched_bonus,
                     )
 
-        score = max(0.0, min(100.0, score))
+        score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
         weighted_score = score * weight / 100.0
         return CriterionResult(
             name=self.name,
@@ -1,14 +1,37 @@
 """RatingCriterion - TMDB rating thresholds scoring."""
 
+from bisect import bisect_right
+from dataclasses import dataclass
 from typing import Any
 
 from app.core.scoring.base_criterion import (
     BaseCriterion,
     CriterionResult,
-    RuleViolation,
     ScoringContext,
 )
 
+# Rating rule categories (bisect_right): < 5, >= 5, >= 7, >= 8
+RATING_CATEGORY_BOUNDS = (5.0, 7.0, 8.0)
+RATING_CATEGORIES = ("poor", "average", "good", "excellent")
+
+
+def rating_category(rating: float) -> str:
+    """Map a TMDB rating to its rule category (NaN meets no bound, so it is "poor")."""
+    if rating != rating:
+        return RATING_CATEGORIES[0]
+    return RATING_CATEGORIES[bisect_right(RATING_CATEGORY_BOUNDS, rating)]
+
+
+@dataclass(slots=True)
+class _RatingThresholds:
+    """Rating thresholds for one (profile, block) pair (shared, never mutated)."""
+
+    min_rating: float
+    preferred_rating: float
+    min_votes: int  # 0 when no vote count threshold applies
+    range_size: float  # preferred_rating - min_rating
+    below_divisor: float  # max(min_rating, 1.0)
+
 
 class RatingCriterion(BaseCriterion):
     """Score based on TMDB rating thresholds."""
@@ -46,41 +69,74 @@ class RatingCriterion(BaseCriterion):
             return 50.0  # Neutral if invalid rating
 
         vote_count = content_meta.get("vote_count") or 0
+        return self._score_rating(tmdb_rating, vote_count, self._get_thresholds(profile, block))
+
+    def _get_thresholds(
+        self, profile: dict[str, Any], block: dict[str, Any] | None
+    ) -> _RatingThresholds:
+        """Return the rating thresholds for this (profile, block), resolved once per pair."""
+        return self._cached_policy(
+            "rating_thresholds", profile, block, lambda: self._build_thresholds(profile, block)
+        )
 
+    @staticmethod
+    def _build_thresholds(
+        profile: dict[str, Any], block: dict[str, Any] | None
+    ) -> _RatingThresholds:
         # Get thresholds from block or profile
         if block:
-            block_criteria = block.get("criteria", {})
-            min_rating = block_criteria.get("min_tmdb_rating") or 0.0
-            preferred_rating = block_criteria.get("preferred_tmdb_rating") or 7.0
-            min_votes = block_criteria.get("min_vote_count") or 0
+            criteria = block.get("criteria", {})
         else:
             criteria = profile.get("mandatory_forbidden_criteria", {})
-            min_rating = criteria.get("min_tmdb_rating") or 0.0
-            preferred_rating = criteria.get("preferred_tmdb_rating") or 7.0
-            min_votes = criteria.get("min_vote_count") or 0
+        min_rating = criteria.get("min_tmdb_rating") or 0.0
+        preferred_rating = criteria.get("preferred_tmdb_rating") or 7.0
+        min_votes = criteria.get("min_vote_count") or 0
+        return _RatingThresholds(
+            min_rating=min_rating,
+            preferred_rating=preferred_rating,
+            min_votes=min_votes if min_votes > 0 else 0,
+            range_size=preferred_rating - min_rating,
+            below_divisor=max(min_rating, 1.0),
+        )
+
+    @staticmethod
+    def _score_rating(tmdb_rating: float, vote_count: int, thresholds: _RatingThresholds) -> float:
+        """
+        Score a numeric TMDB rating and its vote count against resolved thresholds.
+
+        Runs once per scored item, so clamps are plain comparisons rather than
+        min()/max() calls. The confidence penalty is at most 30, so the above-preferred
+        score never needs clamping to 70.
+        """
+        min_rating = thresholds.min_rating
+        min_votes = thresholds.min_votes
 
         # Check vote count threshold
-        if min_votes and min_votes > 0 and vote_count < min_votes:
+        if min_votes and vote_count < min_votes:
             # Reduce confidence in rating
-            confidence_penalty = min(30.0, (min_votes - vote_count) / min_votes * 30)
+            confidence_penalty = (min_votes - vote_count) / min_votes * 30
+            if not confidence_penalty < 30.0:
+                confidence_penalty = 30.0
         else:
             confidence_penalty = 0.0
 
         # Check rating thresholds
         if tmdb_rating < min_rating:
             # Below minimum - low score
-            ratio = tmdb_rating / max(min_rating, 1.0)
-            return max(0.0, ratio * 40.0 - confidence_penalty)
+            score = tmdb_rating / thresholds.below_divisor * 40.0 - confidence_penalty
+            return score if score > 0.0 else 0.0
 
-        if tmdb_rating >= preferred_rating:
+        if tmdb_rating >= thresholds.preferred_rating:
             # Above preferred - excellent
-            return max(70.0, 100.0 - confidence_penalty)
+            return 100.0 - confidence_penalty
 
         # Between min and preferred - proportional
-        range_size = preferred_rating - min_rating
+        range_size = thresholds.range_size
         if range_size > 0:
             position = (tmdb_rating - min_rating) / range_size
-            return max(0.0, 50.0 + (position * 40.0) - confidence_penalty)
+            score = 50.0 + (position * 40.0) - confidence_penalty
+            # NaN ratings end up here and clamp to 0
+            return score if score > 0.0 else 0.0
 
         return 60.0 - confidence_penalty
 
@@ -94,9 +150,7 @@ class RatingCriterion(BaseCriterion):
     ) -> CriterionResult:
         """Evaluate criterion with optional rules check."""
         score = self.calculate(content, content_meta, profile, block, context)
-        weight = self.get_weight(profile)
-        multiplier = self.get_multiplier(profile, block)
-        mfp_policy = self.get_mfp_policy(profile, block)
+        weight, multiplier, mfp_policy = self.get_scoring_params(profile, block)
 
         # Check for per-criterion rules
         # For rating, rules use categories: "excellent", "good", "average", "poor"
@@ -107,56 +161,22 @@ class RatingCriterion(BaseCriterion):
             rating_rules = block_criteria.get("rating_rules")
             if rating_rules:
                 tmdb_rating = content_meta.get("tmdb_rating")
-                rating_category = None
+                category = None
                 if tmdb_rating is not None:
                     try:
                         tmdb_rating = float(tmdb_rating)
                     except (TypeError, ValueError):
-                        tmdb_rating = None
-                if tmdb_rating is not None:
-                    if tmdb_rating >= 8.0:
-                        rating_category = "excellent"
-                    elif tmdb_rating >= 7.0:
-                        rating_category = "good"
-                    elif tmdb_rating >= 5.0:
-                        rating_category = "average"
+                        pass
                     else:
-                        rating_category = "poor"
-
-                if rating_category:
-                    # Custom M/F/P logic for rating (single category vs list of allowed/forbidden)
-                    forbidden = [v.lower() for v in (rating_rules.get("forbidden_values") or [])]
-                    mandatory = [v.lower() for v in (rating_rules.get("mandatory_values") or [])]
-                    preferred = [v.lower() for v in (rating_rules.get("preferred_values") or [])]
-
-                    # Check forbidden first (highest priority)
-                    if rating_category.lower() in forbidden:
-                        penalty = rating_rules.get(
-                            "forbidden_penalty", mfp_policy.forbidden_detected_penalty
-                        )
-                        rule_violation = RuleViolation("forbidden", [rating_category], penalty)
-                        score += penalty
-                    # Check mandatory (content category must be IN the mandatory list)
-                    elif mandatory and rating_category.lower() not in mandatory:
-                        penalty = rating_rules.get(
-                            "mandatory_penalty", mfp_policy.mandatory_missed_penalty
-                        )
-                        rule_violation = RuleViolation("mandatory", mandatory, penalty)
-                        score += penalty
-                    # Check preferred (bonus if in preferred list)
-                    elif rating_category.lower() in preferred:
-                        bonus = rating_rules.get(
-                            "preferred_bonus", mfp_policy.preferred_matched_bonus
-                        )
-                        rule_violation = RuleViolation("preferred", [rating_category], bonus)
-                        score += bonus
-                    # If mandatory is defined and category matches, give bonus
-                    elif mandatory and rating_category.lower() in mandatory:
-                        bonus = mfp_policy.mandatory_matched_bonus
-                        rule_violation = RuleViolation("mandatory", [rating_category], bonus)
-                        score += bonus
-
-        score = max(0.0, min(100.0, score))
+                        category = rating_category(tmdb_rating)
+
+                if category:
+                    adjustment, rule_violation = self.check_category_rules(
+                        category, rating_rules, mfp_policy
+                    )
+                    score += adjustment
+
+        score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
         weighted_score = score * weight / 100.0
         return CriterionResult(
             name=self.name,
@@ -1,10 +1,23 @@
 """StrategyCriterion - Sequence/insertion rules scoring."""
 
+from dataclasses import dataclass
 from typing import Any
 
 from app.core.scoring.base_criterion import BaseCriterion, CriterionResult, ScoringContext
 
 
+@dataclass(slots=True)
+class _StrategyParams:
+    """Strategy switches of one profile (shared, never mutated)."""
+
+    defined: bool  # Profile has any strategies at all
+    maintain_sequence: bool
+    maximize_variety: bool
+    marathon_mode: bool
+    filler_enabled: bool
+    filler_types: frozenset[str]  # Lowercased, also used by the rules check
+
+
 class StrategyCriterion(BaseCriterion):
     """Score based on programming strategy compliance."""
 
@@ -29,17 +42,24 @@ class StrategyCriterion(BaseCriterion):
         - variety: Maximize genre variety
         - marathon: Same series/franchise
         """
-        strategies = profile.get("strategies", {})
-        if not strategies:
+        return self._score_strategies(
+            content.get("type", "").lower(), content_meta, self._get_params(profile)
+        )
+
+    @staticmethod
+    def _score_strategies(
+        content_type: str, content_meta: dict[str, Any] | None, params: _StrategyParams
+    ) -> float:
+        """Score an already-lowercased content type and its metadata against strategies."""
+        if not params.defined:
             return 80.0  # No strategies defined
 
         score = 100.0
 
         # Check sequence strategy
-        if strategies.get("maintain_sequence", False):
+        if params.maintain_sequence:
             # This would need context about previous programs
             # For now, assume episode content follows sequence
-            content_type = content.get("type", "").lower()
             if content_type == "episode":
                 # Episodes are assumed to follow sequence
                 pass
@@ -48,33 +68,50 @@ class StrategyCriterion(BaseCriterion):
                 score -= 5.0
 
         # Check variety strategy
-        if strategies.get("maximize_variety", False):
+        if params.maximize_variety:
             # Would need context about other content in block
             # For now, diverse genres score better
             if content_meta:
-                genres = content_meta.get("genres", [])
+                genres = content_meta.get("genres", ())
                 if len(genres) > 2:
                     score += 5.0  # Bonus for diverse content
 
         # Check marathon strategy
-        if strategies.get("marathon_mode", False):
+        if params.marathon_mode:
             # Would need context about series/franchise
             # For now, check if content is part of collection
             if content_meta:
-                collections = content_meta.get("collections", [])
+                collections = content_meta.get("collections", ())
                 if collections:
                     score += 10.0  # Bonus for collection content
 
         # Check filler insertion strategy
-        filler_config = strategies.get("filler_insertion", {})
-        if filler_config.get("enabled", False):
-            content_type = content.get("type", "").lower()
-            filler_types = filler_config.get("types", ["trailer"])
-            if content_type in [t.lower() for t in filler_types]:
+        if params.filler_enabled:
+            if content_type in params.filler_types:
                 score += 5.0  # Slight bonus for filler content
 
         return max(0.0, min(100.0, score))
 
+    def _get_params(self, profile: dict[str, Any]) -> _StrategyParams:
+        """Return the profile's strategy switches, read once per profile."""
+        return self._cached_policy(
+            "strategy_params", profile, None, lambda: self._build_params(profile)
+        )
+
+    @staticmethod
+    def _build_params(profile: dict[str, Any]) -> _StrategyParams:
+        # Stored profiles may carry an explicit null for these
+        strategies = profile.get("strategies") or {}
+        filler_config = strategies.get("filler_insertion") or {}
+        return _StrategyParams(
+            defined=bool(strategies),
+            maintain_sequence=bool(strategies.get("maintain_sequence", False)),
+            maximize_variety=bool(strategies.get("maximize_variety", False)),
+            marathon_mode=bool(strategies.get("marathon_mode", False)),
+            filler_enabled=bool(filler_config.get("enabled", False)),
+            filler_types=frozenset(t.lower() for t in filler_config.get("types", ["trailer"])),
+        )
+
     def evaluate(
         self,
         content: dict[str, Any],
@@ -84,10 +121,11 @@ class StrategyCriterion(BaseCriterion):
         context: ScoringContext | None = None,
     ) -> CriterionResult:
         """Evaluate criterion with optional rules check."""
-        score = self.calculate(content, content_meta, profile, block, context)
-        weight = self.get_weight(profile)
-        multiplier = self.get_multiplier(profile, block)
-        mfp_policy = self.get_mfp_policy(profile, block)
+        # Lowercase the type once for both the score and the rules check
+        content_type = content.get("type", "").lower()
+        params = self._get_params(profile)
+        score = self._score_strategies(content_type, content_meta, params)
+        weight, multiplier, mfp_policy = self.get_scoring_params(profile, block)
 
         # Check for per-criterion rules
         # For strategy, rules check content characteristics, not profile settings
@@ -99,24 +137,20 @@ class StrategyCriterion(BaseCriterion):
             block_criteria = block.get("criteria", {})
             strategy_rules = block_criteria.get("strategy_rules")
             if strategy_rules:
-                strategies = profile.get("strategies", {})
                 content_characteristics = []
 
                 # Check if content IS a filler type (not if filler is enabled in profile)
-                content_type = content.get("type", "").lower()
-                filler_types = strategies.get("filler_insertion", {}).get("types", ["trailer"])
-                filler_types_lower = [t.lower() for t in filler_types]
-                if content_type in filler_types_lower:
+                if content_type in params.filler_types:
                     content_characteristics.append("filler")
 
                 # Check if content has variety (multiple genres)
                 if content_meta:
-                    genres = content_meta.get("genres", [])
+                    genres = content_meta.get("genres", ())
                     if len(genres) >= 2:
                         content_characteristics.append("variety")
 
                     # Check if content is part of a collection (marathon-suitable)
-                    collections = content_meta.get("collections", [])
+                    collections = content_meta.get("collections", ())
                     if collections:
                         content_characteristics.append("marathon")
 
@@ -129,7 +163,7 @@ class StrategyCriterion(BaseCriterion):
                 )
                 score += adjustment
 
-        score = max(0.0, min(100.0, score))
+        score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
         weighted_score = score * weight / 100.0
         return CriterionResult(
             name=self.name,
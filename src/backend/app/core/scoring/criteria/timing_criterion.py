@@ -223,9 +223,7 @@ class TimingCriterion(BaseCriterion):
         """Evaluate criterion with optional rules check."""
         # Calculate timing details for display
         details = self._calculate_timing_details(content, block, context)
-        weight = self.get_weight(profile)
-        multiplier = self.get_multiplier(profile, block)
-        mfp_policy = self.get_mfp_policy(profile, block)
+        weight, multiplier, mfp_policy = self.get_scoring_params(profile, block)
 
         # For middle programs, timing criterion is skipped (not applicable)
         if details.get("skipped", False):
@@ -367,7 +365,7 @@ class TimingCriterion(BaseCriterion):
                     "effective_forbidden_max": effective_forbidden_max,
                 }
 
-        score = max(0.0, min(100.0, score))
+        score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
 
         # For timing, the multiplier amplifies the PENALTY (deficit from 100)
         # This makes multiplier > 1.0 increase the negative impact of late/overflow
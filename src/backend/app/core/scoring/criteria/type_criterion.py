@@ -1,15 +1,33 @@
 """TypeCriterion - Content type matching."""
 
+from dataclasses import dataclass
 from typing import Any
 
 from app.core.scoring.base_criterion import (
     BaseCriterion,
     CriterionResult,
-    RuleViolation,
     ScoringContext,
 )
 
 
+@dataclass(slots=True)
+class _TypeSets:
+    """Type lists and rules for one (profile, block) pair (shared, never mutated)."""
+
+    # Block criteria (empty when there is no block)
+    block_excluded: frozenset[str]
+    block_preferred: frozenset[str]
+    block_allowed: frozenset[str]
+    type_rules: dict[str, Any] | None  # Block M/F/P type rules, if any
+    # Profile mandatory_forbidden_criteria
+    profile_allowed: frozenset[str]
+    profile_forbidden: frozenset[str]
+
+
+def _lowered_set(values: list[str] | None) -> frozenset[str]:
+    return frozenset(v.lower() for v in values or ())
+
+
 class TypeCriterion(BaseCriterion):
     """Score based on content type matching block preferences."""
 
@@ -32,42 +50,57 @@ class TypeCriterion(BaseCriterion):
         - 50: Match with profile's allowed types
         - 0: Type not allowed
         """
-        content_type = content.get("type", "").lower()
+        return self._score_type(
+            content.get("type", "").lower(), self._get_type_sets(profile, block)
+        )
+
+    @staticmethod
+    def _score_type(content_type: str, types: _TypeSets) -> float:
+        """Score an already-lowercased content type against the type sets."""
         if not content_type:
             return 50.0  # Neutral if no type
 
-        # Check block preferences first
-        if block:
-            block_criteria = block.get("criteria", {})
-            preferred_types = block_criteria.get("preferred_types", [])
-            allowed_types = block_criteria.get("allowed_types", [])
-            excluded_types = block_criteria.get("excluded_types", [])
-
-            # Check if excluded
-            if content_type in [t.lower() for t in excluded_types]:
-                return 0.0
+        # Check block preferences first (block sets are empty without a block)
+        # Check if excluded
+        if content_type in types.block_excluded:
+            return 0.0
 
-            # Check if preferred
-            if preferred_types and content_type in [t.lower() for t in preferred_types]:
-                return 100.0
+        # Check if preferred
+        if content_type in types.block_preferred:
+            return 100.0
 
-            # Check if allowed
-            if allowed_types and content_type in [t.lower() for t in allowed_types]:
-                return 75.0
+        # Check if allowed
+        if content_type in types.block_allowed:
+            return 75.0
 
         # Check profile-level type preferences
-        mandatory_criteria = profile.get("mandatory_forbidden_criteria", {})
-        allowed_types = mandatory_criteria.get("allowed_types", [])
-        forbidden_types = mandatory_criteria.get("forbidden_types", [])
-
-        if content_type in [t.lower() for t in forbidden_types]:
+        if content_type in types.profile_forbidden:
             return 0.0
 
-        if allowed_types and content_type not in [t.lower() for t in allowed_types]:
+        if types.profile_allowed and content_type not in types.profile_allowed:
             return 25.0
 
         return 75.0  # Default acceptable score
 
+    def _get_type_sets(self, profile: dict[str, Any], block: dict[str, Any] | None) -> _TypeSets:
+        """Return the lowercased type sets for this (profile, block), built once per pair."""
+        return self._cached_policy(
+            "type_sets", profile, block, lambda: self._build_type_sets(profile, block)
+        )
+
+    @staticmethod
+    def _build_type_sets(profile: dict[str, Any], block: dict[str, Any] | None) -> _TypeSets:
+        block_criteria = block.get("criteria", {}) if block else {}
+        mandatory_criteria = profile.get("mandatory_forbidden_criteria", {})
+        return _TypeSets(
+            block_excluded=_lowered_set(block_criteria.get("excluded_types")),
+            block_preferred=_lowered_set(block_criteria.get("preferred_types")),
+            block_allowed=_lowered_set(block_criteria.get("allowed_types")),
+            type_rules=block_criteria.get("type_rules") or None,
+            profile_allowed=_lowered_set(mandatory_criteria.get("allowed_types")),
+            profile_forbidden=_lowered_set(mandatory_criteria.get("forbidden_types")),
+        )
+
     def evaluate(
         self,
         content: dict[str, Any],
@@ -77,53 +110,22 @@ class TypeCriterion(BaseCriterion):
         context: ScoringContext | None = None,
     ) -> CriterionResult:
         """Evaluate criterion with optional rules check."""
-        score = self.calculate(content, content_meta, profile, block, context)
-        weight = self.get_weight(profile)
-        multiplier = self.get_multiplier(profile, block)
-        mfp_policy = self.get_mfp_policy(profile, block)
+        # Lowercase the type once for both the score and the rules check
+        content_type = content.get("type", "").lower()
+        types = self._get_type_sets(profile, block)
+        score = self._score_type(content_type, types)
+        weight, multiplier, mfp_policy = self.get_scoring_params(profile, block)
 
         # Check for per-criterion rules
         # Logic: content has ONE type, mandatory means "must be one of these"
         rule_violation = None
-        if block:
-            block_criteria = block.get("criteria", {})
-            type_rules = block_criteria.get("type_rules")
-            if type_rules:
-                content_type = content.get("type", "").lower()
-                if content_type:
-                    # Custom M/F/P logic for type (single type vs list of allowed/forbidden)
-                    forbidden = [v.lower() for v in (type_rules.get("forbidden_values") or [])]
-                    mandatory = [v.lower() for v in (type_rules.get("mandatory_values") or [])]
-                    preferred = [v.lower() for v in (type_rules.get("preferred_values") or [])]
-
-                    # Check forbidden first (highest priority)
-                    if content_type in forbidden:
-                        penalty = type_rules.get(
-                            "forbidden_penalty", mfp_policy.forbidden_detected_penalty
-                        )
-                        rule_violation = RuleViolation("forbidden", [content_type], penalty)
-                        score += penalty
-                    # Check mandatory (content type must be IN the mandatory list)
-                    elif mandatory and content_type not in mandatory:
-                        penalty = type_rules.get(
-                            "mandatory_penalty", mfp_policy.mandatory_missed_penalty
-                        )
-                        rule_violation = RuleViolation("mandatory", mandatory, penalty)
-                        score += penalty
-                    # Check preferred (bonus if in preferred list)
-                    elif content_type in preferred:
-                        bonus = type_rules.get(
-                            "preferred_bonus", mfp_policy.preferred_matched_bonus
-                        )
-                        rule_violation = RuleViolation("preferred", [content_type], bonus)
-                        score += bonus
-                    # If mandatory is defined and type matches, give bonus
-                    elif mandatory and content_type in mandatory:
-                        bonus = mfp_policy.mandatory_matched_bonus
-                        rule_violation = RuleViolation("mandatory", [content_type], bonus)
-                        score += bonus
-
-        score = max(0.0, min(100.0, score))
+        if types.type_rules and content_type:
+            adjustment, rule_violation = self.check_category_rules(
+                content_type, types.type_rules, mfp_policy
+            )
+            score += adjustment
+
+        score = 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
         weighted_score = score * weight / 100.0
         return CriterionResult(
             name=self.name,
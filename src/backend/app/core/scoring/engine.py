@@ -1,10 +1,16 @@
 """ScoringEngine orchestrator with weighted aggregation."""
 
 import logging
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
-from app.core.scoring.base_criterion import BaseCriterion, CriterionResult, ScoringContext
+from app.core.scoring.base_criterion import (
+    BaseCriterion,
+    CriterionResult,
+    ScoringContext,
+    lowered_meta_values,
+)
 from app.core.scoring.criteria import (
     AgeCriterion,
     BonusCriterion,
@@ -77,7 +83,7 @@ class ScoringResult:
             "forbidden_violations": self.forbidden_violations,
             "mandatory_penalties": self.mandatory_penalties,
             "bonuses_applied": self.bonuses_applied,
-            "forbidden_violated": len(self.forbidden_violations) > 0,
+            "forbidden_violated": bool(self.forbidden_violations),
             "mandatory_met": len(self.mandatory_penalties) == 0,
             "keyword_multiplier": self.keyword_multiplier,
             "keyword_match": self.keyword_match,
@@ -85,6 +91,19 @@ class ScoringResult:
         }
 
 
+@dataclass(slots=True)
+class PreparedRules:
+    """Profile/block rule lists normalized once and shared by every content scored with them."""
+
+    forbidden_content_ids: frozenset[Any]
+    forbidden_types: frozenset[str]
+    forbidden_keywords: tuple[str, ...]
+    forbidden_genres: frozenset[str]
+    block_forbidden_genres: frozenset[str]
+    exclude_keywords: tuple[str, ...]
+    include_keywords: tuple[str, ...]
+
+
 class ScoringEngine:
     """Orchestrates scoring across all criteria with weighted aggregation."""
 
@@ -102,6 +121,16 @@ class ScoringEngine:
             BonusCriterion(),
         ]
 
+    def clear_caches(self) -> None:
+        """
+        Drop the criteria's per-(profile, block) caches.
+
+        Call once when a generation or scoring run starts, so the profiles and blocks
+        of earlier runs are released instead of accumulating until the size limit.
+        """
+        for criterion in self.criteria:
+            criterion.clear_policy_cache()
+
     def score(
         self,
         content: dict[str, Any],
@@ -123,6 +152,37 @@ class ScoringEngine:
         Returns:
             ScoringResult with all criterion scores and violations
         """
+        return self._score(
+            content, content_meta, profile, block, context, self._prepare_rules(profile, block)
+        )
+
+    def iter_scores(
+        self,
+        contents: Iterable[tuple[dict[str, Any], dict[str, Any] | None]],
+        profile: dict[str, Any],
+        block: dict[str, Any] | None = None,
+        context: ScoringContext | None = None,
+    ) -> Iterator[ScoringResult]:
+        """
+        Lazily score content items sharing the same profile, block and context.
+
+        Profile/block rules are prepared once for all items, and items are only
+        scored when requested, so callers can stop at the first acceptable result.
+        """
+        rules = self._prepare_rules(profile, block)
+        for content, meta in contents:
+            yield self._score(content, meta, profile, block, context, rules)
+
+    def _score(
+        self,
+        content: dict[str, Any],
+        content_meta: dict[str, Any] | None,
+        profile: dict[str, Any],
+        block: dict[str, Any] | None,
+        context: ScoringContext | None,
+        rules: PreparedRules,
+    ) -> ScoringResult:
+        """Calculate complete score for content with prepared profile/block rules."""
         criterion_results: dict[str, CriterionResult] = {}
         criterion_rule_violations: dict[str, dict[str, Any]] = {}
         total_weight = 0.0
@@ -152,7 +212,7 @@ class ScoringEngine:
             weighted_total = 50.0  # Default neutral score
 
         # Check forbidden rules (profile-level)
-        forbidden_violations = self._check_forbidden(content, content_meta, profile, block)
+        forbidden_violations = self._check_forbidden(content, content_meta, rules)
 
         # Add per-criterion forbidden rule violations to global forbidden list
         # This ensures content with forbidden age ratings, genres, etc. is completely excluded
@@ -180,9 +240,7 @@ class ScoringEngine:
                 final_score -= penalty.get("penalty", 10.0)
 
         # Calculate and apply keyword multiplier
-        keyword_multiplier, keyword_match = self._calculate_keyword_multiplier(
-            content, profile, block
-        )
+        keyword_multiplier, keyword_match = self._calculate_keyword_multiplier(content, rules)
         if keyword_multiplier != 1.0:
             final_score = final_score * keyword_multiplier
 
@@ -207,25 +265,57 @@ class ScoringEngine:
             criterion_rule_violations=criterion_rule_violations,
         )
 
+    def _prepare_rules(
+        self,
+        profile: dict[str, Any],
+        block: dict[str, Any] | None = None,
+    ) -> PreparedRules:
+        """Normalize the forbidden and keyword rules of a profile/block for scoring."""
+        criteria = profile.get("mandatory_forbidden_criteria", {})
+        forbidden = criteria.get("forbidden", {})
+
+        block_forbidden_genres: frozenset[str] = frozenset()
+        if block:
+            block_criteria = block.get("criteria", {})
+            block_forbidden_genres = frozenset(
+                g.lower() for g in block_criteria.get("forbidden_genres", [])
+            )
+            # Keyword config comes from the block when scoring within a block
+            keyword_criteria = block_criteria
+        else:
+            keyword_criteria = criteria
+
+        # Also check enhanced_criteria.keywords_safety for dangerous_keywords (treated as exclude)
+        enhanced_criteria = profile.get("enhanced_criteria", {})
+        keywords_safety = enhanced_criteria.get("keywords_safety", {})
+        exclude_keywords = {k.lower() for k in keyword_criteria.get("exclude_keywords", [])}
+        exclude_keywords.update(k.lower() for k in keywords_safety.get("dangerous_keywords", []))
+
+        return PreparedRules(
+            forbidden_content_ids=frozenset(forbidden.get("content_ids", [])),
+            forbidden_types=frozenset(t.lower() for t in forbidden.get("types", [])),
+            forbidden_keywords=tuple(k.lower() for k in forbidden.get("keywords", [])),
+            forbidden_genres=frozenset(g.lower() for g in forbidden.get("genres", [])),
+            block_forbidden_genres=block_forbidden_genres,
+            exclude_keywords=tuple(exclude_keywords),
+            include_keywords=tuple(k.lower() for k in keyword_criteria.get("include_keywords", [])),
+        )
+
     def _check_forbidden(
         self,
         content: dict[str, Any],
         content_meta: dict[str, Any] | None,
-        profile: dict[str, Any],
-        block: dict[str, Any] | None = None,
+        rules: PreparedRules,
     ) -> list[dict[str, Any]]:
         """Check for forbidden rule violations."""
         violations = []
-        criteria = profile.get("mandatory_forbidden_criteria", {})
-        forbidden = criteria.get("forbidden", {})
 
         content_title = content.get("title", "").lower()
         content_type = content.get("type", "").lower()
 
         # Check forbidden content IDs
-        forbidden_ids = forbidden.get("content_ids", [])
         content_id = content.get("plex_key", "")
-        if content_id in forbidden_ids:
+        if content_id in rules.forbidden_content_ids:
             violations.append(
                 {
                     "rule": "forbidden_content_id",
@@ -235,8 +325,7 @@ class ScoringEngine:
             )
 
         # Check forbidden types
-        forbidden_types = [t.lower() for t in forbidden.get("types", [])]
-        if content_type in forbidden_types:
+        if content_type in rules.forbidden_types:
             violations.append(
                 {
                     "rule": "forbidden_type",
@@ -246,8 +335,7 @@ class ScoringEngine:
             )
 
         # Check forbidden keywords in title
-        forbidden_keywords = [k.lower() for k in forbidden.get("keywords", [])]
-        for keyword in forbidden_keywords:
+        for keyword in rules.forbidden_keywords:
             if keyword in content_title:
                 violations.append(
                     {
@@ -259,10 +347,9 @@ class ScoringEngine:
 
         # Check forbidden genres (global)
         if content_meta:
-            content_genres = [g.lower() for g in content_meta.get("genres", [])]
-            forbidden_genres = [g.lower() for g in forbidden.get("genres", [])]
+            content_genres = lowered_meta_values(content_meta, "genres")
             for genre in content_genres:
-                if genre in forbidden_genres:
+                if genre in rules.forbidden_genres:
                     violations.append(
                         {
                             "rule": "forbidden_genre",
@@ -271,14 +358,10 @@ class ScoringEngine:
                         }
                     )
 
-        # Check block-level forbidden genres
-        if block and content_meta:
-            block_criteria = block.get("criteria", {})
-            block_forbidden_genres = [g.lower() for g in block_criteria.get("forbidden_genres", [])]
-            if block_forbidden_genres:
-                content_genres = [g.lower() for g in content_meta.get("genres", [])]
+            # Check block-level forbidden genres
+            if rules.block_forbidden_genres:
                 for genre in content_genres:
-                    if genre in block_forbidden_genres:
+                    if genre in rules.block_forbidden_genres:
                         # Avoid duplicate violations
                         existing = any(
                             v.get("rule") == "forbidden_genre" and v.get("value") == genre
@@ -362,8 +445,7 @@ class ScoringEngine:
     def _calculate_keyword_multiplier(
         self,
         content: dict[str, Any],
-        profile: dict[str, Any],
-        block: dict[str, Any] | None = None,
+        rules: PreparedRules,
     ) -> tuple[float, str | None]:
         """
         Calculate keyword multiplier based on title matching.
@@ -373,10 +455,12 @@ class ScoringEngine:
         - include_keywords in title: +10% (multiplier 1.1)
         - Exclusion always takes priority over inclusion
 
+        Keywords come from the block criteria when scoring within a block, otherwise
+        from the profile, plus the profile's dangerous keywords (see _prepare_rules).
+
         Args:
             content: Content data with title
-            profile: Profile configuration
-            block: Time block configuration (optional)
+            rules: Prepared profile/block rules
 
         Returns:
             Tuple of (multiplier, match_type) where match_type is
@@ -386,29 +470,13 @@ class ScoringEngine:
         if not content_title:
             return 1.0, None
 
-        # Get keyword config from block or profile
-        if block:
-            block_criteria = block.get("criteria", {})
-            exclude_keywords = [k.lower() for k in block_criteria.get("exclude_keywords", [])]
-            include_keywords = [k.lower() for k in block_criteria.get("include_keywords", [])]
-        else:
-            criteria = profile.get("mandatory_forbidden_criteria", {})
-            exclude_keywords = [k.lower() for k in criteria.get("exclude_keywords", [])]
-            include_keywords = [k.lower() for k in criteria.get("include_keywords", [])]
-
-        # Also check enhanced_criteria.keywords_safety for dangerous_keywords (treated as exclude)
-        enhanced_criteria = profile.get("enhanced_criteria", {})
-        keywords_safety = enhanced_criteria.get("keywords_safety", {})
-        dangerous_keywords = [k.lower() for k in keywords_safety.get("dangerous_keywords", [])]
-        exclude_keywords = list(set(exclude_keywords + dangerous_keywords))
-
         # Check for exclusion first (takes priority)
-        for keyword in exclude_keywords:
+        for keyword in rules.exclude_keywords:
             if keyword in content_title:
                 return 0.5, "exclude"  # -50% penalty
 
         # Check for inclusion bonus
-        for keyword in include_keywords:
+        for keyword in rules.include_keywords:
             if keyword in content_title:
                 return 1.1, "include"  # +10% bonus
 
@@ -419,6 +487,7 @@ class ScoringEngine:
         contents: list[tuple[dict[str, Any], dict[str, Any] | None]],
         profile: dict[str, Any],
         block: dict[str, Any] | None = None,
+        context: ScoringContext | None = None,
     ) -> list[ScoringResult]:
-        """Score multiple content items efficiently."""
-        return [self.score(content, meta, profile, block) for content, meta in contents]
+        """Score multiple content items efficiently (profile/block rules prepared once)."""
+        return list(self.iter_scores(contents, profile, block, context))
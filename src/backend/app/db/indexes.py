@@ -51,8 +51,8 @@ INDEXES = {
     ],
     "programs": [
         (
-            "idx_programs_channel_id",
-            "CREATE INDEX IF NOT EXISTS idx_programs_channel_id ON programs(channel_id)",
+            "idx_programs_channel_position",
+            "CREATE INDEX IF NOT EXISTS idx_programs_channel_position ON programs(channel_id, position)",
         ),
         (
             "idx_programs_content_id",
@@ -68,39 +68,29 @@ INDEXES = {
         ),
     ],
     "scoring_results": [
+        # Covers per-profile top-score queries without touching the table
         (
-            "idx_scoring_channel_id",
-            "CREATE INDEX IF NOT EXISTS idx_scoring_channel_id ON scoring_results(channel_id)",
-        ),
-        (
-            "idx_scoring_profile_id",
-            "CREATE INDEX IF NOT EXISTS idx_scoring_profile_id ON scoring_results(profile_id)",
-        ),
-        (
-            "idx_scoring_program_id",
-            "CREATE INDEX IF NOT EXISTS idx_scoring_program_id ON scoring_results(program_id)",
+            "idx_scoring_profile_score",
+            "CREATE INDEX IF NOT EXISTS idx_scoring_profile_score"
+            " ON scoring_results(profile_id, total_score DESC, program_id)",
         ),
         (
             "idx_scoring_total_score",
             "CREATE INDEX IF NOT EXISTS idx_scoring_total_score ON scoring_results(total_score DESC)",
         ),
     ],
+    # History lists filter on one column and order by started_at DESC, so each filter
+    # index carries started_at to return rows in order without a sort
     "history_entries": [
         (
-            "idx_history_type",
-            "CREATE INDEX IF NOT EXISTS idx_history_type ON history_entries(type)",
-        ),
-        (
-            "idx_history_status",
-            "CREATE INDEX IF NOT EXISTS idx_history_status ON history_entries(status)",
-        ),
-        (
-            "idx_history_channel_id",
-            "CREATE INDEX IF NOT EXISTS idx_history_channel_id ON history_entries(channel_id)",
+            "idx_history_channel_started",
+            "CREATE INDEX IF NOT EXISTS idx_history_channel_started"
+            " ON history_entries(channel_id, started_at DESC)",
         ),
         (
-            "idx_history_profile_id",
-            "CREATE INDEX IF NOT EXISTS idx_history_profile_id ON history_entries(profile_id)",
+            "idx_history_profile_started",
+            "CREATE INDEX IF NOT EXISTS idx_history_profile_started"
+            " ON history_entries(profile_id, started_at DESC)",
         ),
         (
             "idx_history_started_at",
@@ -108,7 +98,14 @@ INDEXES = {
         ),
         (
             "idx_history_type_status",
-            "CREATE INDEX IF NOT EXISTS idx_history_type_status ON history_entries(type, status)",
+            "CREATE INDEX IF NOT EXISTS idx_history_type_status"
+            " ON history_entries(type, status, started_at DESC)",
+        ),
+        # Only in-progress runs, a handful of rows at any time
+        (
+            "idx_history_running",
+            "CREATE INDEX IF NOT EXISTS idx_history_running"
+            " ON history_entries(started_at DESC) WHERE status = 'running'",
         ),
     ],
     "services": [
@@ -119,6 +116,20 @@ INDEXES = {
     ],
 }
 
+# Indexes from earlier versions, dropped by create_indexes. Single low-selectivity
+# columns, prefixes of a composite index, duplicates of a UNIQUE constraint, or (for
+# idx_scoring_channel_id) a column that scoring_results does not have.
+RETIRED_INDEXES = (
+    "idx_programs_channel_id",
+    "idx_scoring_channel_id",
+    "idx_scoring_profile_id",
+    "idx_scoring_program_id",
+    "idx_history_type",
+    "idx_history_status",
+    "idx_history_channel_id",
+    "idx_history_profile_id",
+)
+
 
 async def create_indexes(session: AsyncSession) -> dict[str, int]:
     """
@@ -132,6 +143,12 @@ async def create_indexes(session: AsyncSession) -> dict[str, int]:
     """
     results: dict[str, int] = {}
 
+    for index_name in RETIRED_INDEXES:
+        try:
+            await session.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        except Exception as e:
+            logger.warning(f"Failed to drop retired index {index_name}: {e}")
+
     for table, index_defs in INDEXES.items():
         created = 0
         for index_name, create_sql in index_defs:
@@ -232,7 +249,11 @@ async def get_index_stats(session: AsyncSession) -> list[dict[str, str]]:
 
 async def vacuum_database(session: AsyncSession) -> None:
     """
-    Run VACUUM to optimize database file.
+    Run a full VACUUM to rebuild the database file.
+
+    Rewrites the whole file and blocks writers while it runs, so keep it for
+    explicit maintenance; routine space reclaim is done by the scheduler via
+    ``app.db.database.vacuum_db``.
 
     Note: VACUUM cannot run inside a transaction in SQLite.
 
@@ -267,8 +288,8 @@ def get_index_recommendations() -> list[dict[str, str]]:
         },
         {
             "table": "history_entries",
-            "recommendation": "Composite index on (type, status) for filtered history queries",
-            "query_pattern": "SELECT * FROM history_entries WHERE type = ? AND status = ?",
+            "recommendation": "Composite index on (type, status, started_at DESC) for filtered history queries",
+            "query_pattern": "SELECT * FROM history_entries WHERE type = ? AND status = ? ORDER BY started_at DESC",
         },
         {
             "table": "scoring_results",
@@ -26,8 +26,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
 
     # Import here to avoid circular imports
+    from app.core.programming.generator import shutdown_iteration_pool
     from app.core.scheduler import get_scheduler_manager
-    from app.db.database import init_db
+    from app.db.database import init_db, optimize_db
 
     await init_db()
     logger.info("Database initialized")
@@ -40,8 +41,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Shutdown
+    await optimize_db()
     await scheduler.stop()
     logger.info("Scheduler stopped")
+    shutdown_iteration_pool()
     logger.info(f"Shutting down {settings.app_name}")
 
 
@@ -9,6 +9,9 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.database import Base
 
+# Model class -> ((column name, is DateTime column), ...), built on first to_dict
+_dict_columns: dict[type, tuple[tuple[str, bool], ...]] = {}
+
 
 class BaseModel(Base):
     """Base model with UUID primary key and timestamps."""
@@ -33,10 +36,17 @@ class BaseModel(Base):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert model to dictionary."""
+        columns = _dict_columns.get(type(self))
+        if columns is None:
+            columns = _dict_columns[type(self)] = tuple(
+                (column.name, isinstance(column.type, DateTime))
+                for column in self.__table__.columns
+            )
+
         result = {}
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            if isinstance(value, datetime):
+        for name, is_datetime in columns:
+            value = getattr(self, name)
+            if is_datetime and isinstance(value, datetime):
                 value = value.isoformat()
-            result[column.name] = value
+            result[name] = value
         return result
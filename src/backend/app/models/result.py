@@ -1,9 +1,8 @@
 """Result model for storing programming and scoring results."""
 
-from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import ForeignKey, String
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -21,7 +20,7 @@ class Result(BaseModel):
     )
     channel_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
     profile_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    # created_at comes from BaseModel (SQL-side now(), as for every other table)
     data: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
 
     def __repr__(self) -> str:
@@ -48,7 +48,6 @@ class ResultService:
             history_entry_id=history_entry_id,
             channel_id=channel_id,
             profile_id=profile_id,
-            created_at=datetime.utcnow(),
         )
         self.session.add(result)
         await self.session.commit()
@@ -4,7 +4,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, bindparam, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.schedule import Schedule
@@ -247,6 +247,56 @@ class ScheduleService:
 
         return schedule
 
+    async def update_next_executions(self, next_runs: dict[str, datetime]) -> None:
+        """
+        Update next_execution_at for several schedules in a single transaction.
+
+        Rows already holding the given time are left untouched, so re-registering
+        unchanged schedules does not write anything.
+
+        Args:
+            next_runs: Mapping of schedule ID to next scheduled execution time
+        """
+        if not next_runs:
+            return
+
+        stmt = (
+            update(Schedule)
+            .where(Schedule.id == bindparam("schedule_id"))
+            .where(
+                or_(
+                    Schedule.next_execution_at.is_(None),
+                    Schedule.next_execution_at != bindparam("next_run"),
+                )
+            )
+            .values(next_execution_at=bindparam("next_run"))
+        )
+        # Executed on the connection: a WHERE clause cannot be combined with ORM bulk
+        # UPDATE by primary key
+        connection = await self.session.connection()
+        await connection.execute(
+            stmt,
+            [
+                {"schedule_id": schedule_id, "next_run": next_run}
+                for schedule_id, next_run in next_runs.items()
+            ],
+        )
+        await self.session.commit()
+
+    async def update_execution_statuses(self, updates: list[dict[str, Any]]) -> None:
+        """
+        Apply several execution status updates in a single transaction.
+
+        Args:
+            updates: Column values per schedule: id, last_execution_at,
+                last_execution_status and optionally next_execution_at
+        """
+        if not updates:
+            return
+
+        await self.session.execute(update(Schedule), updates)
+        await self.session.commit()
+
     def schedule_to_response(self, schedule: Schedule) -> dict[str, Any]:
         """
         Convert schedule to API response.
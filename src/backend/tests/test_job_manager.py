@@ -0,0 +1,108 @@
+"""Tests for job progress broadcasting in the JobManager."""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any
+
+import orjson
+
+from app.core.job_manager import PROGRESS_BROADCAST_INTERVAL, JobManager, JobType
+
+
+def drain_events(queue: asyncio.Queue[str]) -> list[dict[str, Any]]:
+    """Parse every SSE message waiting in a client queue."""
+    events = []
+    while not queue.empty():
+        message = queue.get_nowait()
+        events.append(orjson.loads(message.removeprefix("data: ")))
+    return events
+
+
+def progress_values(events: list[dict[str, Any]]) -> list[float]:
+    return [e["job"]["progress"] for e in events if e["type"] == "job_progress"]
+
+
+async def start_job(manager: JobManager) -> tuple[str, asyncio.Queue[str]]:
+    """Create and start a job with one subscribed client, its setup events drained."""
+    queue = await manager.subscribe_sse()
+    job_id = await manager.create_job(job_type=JobType.SCORING, title="test")
+    await manager.start_job(job_id)
+    drain_events(queue)
+    return job_id, queue
+
+
+async def test_progress_updates_are_coalesced_to_the_latest_state():
+    """Updates within the broadcast interval are merged into one trailing event."""
+    manager = JobManager()
+    job_id, queue = await start_job(manager)
+
+    for progress in (10.0, 20.0, 30.0, 40.0):
+        await manager.update_job_progress(job_id, progress)
+
+    # The first update goes out at once, the others wait for the interval
+    assert progress_values(drain_events(queue)) == [10.0]
+
+    await asyncio.sleep(PROGRESS_BROADCAST_INTERVAL * 2)
+    assert progress_values(drain_events(queue)) == [40.0]
+
+
+async def test_spaced_progress_updates_are_all_sent():
+    """Updates further apart than the interval are not delayed or merged."""
+    manager = JobManager()
+    job_id, queue = await start_job(manager)
+
+    await manager.update_job_progress(job_id, 10.0)
+    await asyncio.sleep(PROGRESS_BROADCAST_INTERVAL * 1.5)
+    await manager.update_job_progress(job_id, 20.0)
+
+    assert progress_values(drain_events(queue)) == [10.0, 20.0]
+
+
+async def test_terminal_event_flushes_pending_progress():
+    """A pending progress event is sent before job_completed, and never after it."""
+    manager = JobManager()
+    job_id, queue = await start_job(manager)
+
+    await manager.update_job_progress(job_id, 10.0)
+    await manager.update_job_progress(job_id, 90.0)
+    await manager.complete_job(job_id, result={}, best_score=1.0)
+    await asyncio.sleep(PROGRESS_BROADCAST_INTERVAL * 2)
+
+    events = drain_events(queue)
+    assert [e["type"] for e in events] == ["job_progress", "job_progress", "job_completed"]
+    # The flushed event carries the job's final state
+    assert events[1]["job"] == events[2]["job"]
+    assert job_id not in manager._progress_sent_at
+    assert job_id not in manager._progress_flushes
+
+
+async def test_failed_job_flushes_pending_progress():
+    """fail_job also sends the latest progress before its terminal event."""
+    manager = JobManager()
+    job_id, queue = await start_job(manager)
+
+    await manager.update_job_progress(job_id, 10.0)
+    await manager.update_job_progress(job_id, 50.0)
+    await manager.fail_job(job_id, "boom")
+
+    events = drain_events(queue)
+    assert [e["type"] for e in events][-2:] == ["job_progress", "job_failed"]
+    assert progress_values(events) == [10.0, 50.0]
+
+
+async def test_cleanup_old_jobs_drops_progress_state():
+    """Removed jobs leave no throttling state or pending event behind."""
+    manager = JobManager()
+    job_id, queue = await start_job(manager)
+
+    await manager.update_job_progress(job_id, 10.0)
+    await manager.update_job_progress(job_id, 20.0)
+    pending = manager._progress_flushes[job_id]
+    manager._jobs[job_id].completed_at = datetime.utcnow() - timedelta(hours=48)
+
+    assert await manager.cleanup_old_jobs(max_age_hours=24) == 1
+    await asyncio.sleep(0)
+
+    assert job_id not in manager._progress_sent_at
+    assert job_id not in manager._progress_flushes
+    assert pending.cancelled()
@@ -0,0 +1,118 @@
+"""Tests for batched schedule status writes in the scheduler."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import datetime
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401  (registers the tables)
+from app.core import scheduler
+from app.core.scheduler import _StatusWriter
+from app.db.database import Base
+from app.services.schedule_service import ScheduleService
+
+
+@pytest.fixture
+async def session_maker(monkeypatch) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """In-memory database used by the scheduler in place of the application database."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(scheduler, "async_session_maker", maker)
+    yield maker
+    await engine.dispose()
+
+
+@pytest.fixture
+def written_batches(monkeypatch) -> list[list[dict[str, Any]]]:
+    """Record every batch handed to ScheduleService.update_execution_statuses."""
+    batches: list[list[dict[str, Any]]] = []
+    original = ScheduleService.update_execution_statuses
+
+    async def record(self, updates):
+        batches.append(list(updates))
+        await original(self, updates)
+
+    monkeypatch.setattr(ScheduleService, "update_execution_statuses", record)
+    return batches
+
+
+async def create_schedules(maker: async_sessionmaker[AsyncSession], count: int) -> list[str]:
+    async with maker() as session:
+        service = ScheduleService(session)
+        schedules = [
+            await service.create_schedule(
+                name=f"schedule {i}",
+                schedule_type="scoring",
+                channel_id="channel",
+                profile_id=None,
+                schedule_config={"mode": "simple", "frequency": "daily", "time": "06:00"},
+                execution_params={},
+            )
+            for i in range(count)
+        ]
+        return [schedule.id for schedule in schedules]
+
+
+async def stored_statuses(
+    maker: async_sessionmaker[AsyncSession], schedule_ids: list[str]
+) -> dict[str, tuple[str | None, datetime | None]]:
+    async with maker() as session:
+        service = ScheduleService(session)
+        statuses = {}
+        for schedule_id in schedule_ids:
+            schedule = await service.get_schedule(schedule_id)
+            statuses[schedule_id] = (schedule.last_execution_status, schedule.next_execution_at)
+        return statuses
+
+
+async def test_status_updates_submitted_together_are_written_in_one_batch(
+    session_maker, written_batches
+):
+    """Updates within the flush delay share one write, and the latest one per schedule wins."""
+    first, second = await create_schedules(session_maker, 2)
+    next_run = datetime(2030, 1, 1, 6, 0)
+    writer = _StatusWriter(delay=0.05)
+    writer.start()
+
+    await writer.submit(first, "running", None)
+    await writer.submit(second, "running", None)
+    await writer.submit(first, "success", next_run)
+    await asyncio.sleep(0.2)
+
+    assert len(written_batches) == 1
+    assert sorted(update["id"] for update in written_batches[0]) == sorted([first, second])
+    assert await stored_statuses(session_maker, [first, second]) == {
+        first: ("success", next_run),
+        second: ("running", None),
+    }
+    await writer.stop()
+
+
+async def test_stop_writes_buffered_updates(session_maker, written_batches):
+    """Stopping the writer before its delay has passed still writes pending updates."""
+    (schedule_id,) = await create_schedules(session_maker, 1)
+    writer = _StatusWriter(delay=60)
+    writer.start()
+
+    await writer.submit(schedule_id, "failed", None)
+    await writer.stop()
+
+    assert len(written_batches) == 1
+    assert await stored_statuses(session_maker, [schedule_id]) == {schedule_id: ("failed", None)}
+
+
+async def test_submit_writes_immediately_when_not_started(session_maker, written_batches):
+    """Without the background task, each update is written as it is submitted."""
+    (schedule_id,) = await create_schedules(session_maker, 1)
+    writer = _StatusWriter()
+
+    await writer.submit(schedule_id, "success", None)
+
+    assert len(written_batches) == 1
+    assert await stored_statuses(session_maker, [schedule_id]) == {schedule_id: ("success", None)}